@@ -1,8 +1,28 @@
-import copy
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from parser import *
 from expr import *
-from typing import Union, List
+from typing import Union, List, Dict
 import z3
+from cache import load_cached_program, store_cached_program
+from solvers import classify_logic, make_solver, timed_check, get_function_tactics, SMTLIB_LOGICS, \
+    reset_solver_statistics, print_solver_statistics, \
+    record_solving_time, QF_BOOL, Z3Translator, thread_context, has_arithmetic
+from vectorized import free_variables, exhaustive_check, random_check, format_counter_example, \
+    DEFAULT_EXHAUSTIVE_MAX_VARIABLES, DEFAULT_RANDOM_TESTS
+from interpreter import compile_function, replay_counter_example
+from feasibility import normalize, path_facts, Facts
+from intervals import analyze_function, discharges, holds_when_reached, INTERVAL_LOGIC_SUFFIX
+from canonical import canonicalize, rename_assignment, inverse_renaming
+from incremental import IncrementalParser
+from portfolio import race, record_race, reset_portfolio_statistics, print_portfolio_statistics, PORTFOLIO_LOGICS
+from profiling import memory_phase, profiled_iterator, get_memory_profiler, \
+    PARSE, VALIDATION, PATH_COLLECTION, VC_BUILD, SOLVE
+from bmc import bounded_model_check
+from events import emit, FUNCTION_STARTED, PATH_GENERATED, VC_BUILT, VC_SOLVED, \
+    FUNCTION_FINISHED, VALID, INVALID, UNKNOWN
 
 
 
@@ -48,7 +68,30 @@ class MissingReturnStatement(Exception):
                          + " or inside both if and else bodies of an if-else statement."):
         super().__init__(message)
 
+class PathExplosion(Exception):
+    def __init__(self, max_paths:int):
+        self.max_paths = max_paths
+        super().__init__(f"Path explosion: more than {max_paths} basic paths.")
+
+class ProgramValidationError(Exception):
+    def __init__(self, errors:List[Exception]):
+        self.errors = errors
+        super().__init__("\n".join(map(format_validation_error, errors)))
+
+
+def format_validation_error(error:Exception) -> str:
+    location = []
+    if getattr(error, "lineno", None):
+        location.append(f"line {error.lineno}")
+    if getattr(error, "function_name", None):
+        location.append(f"function {error.function_name}")
+    if location:
+        return f"{', '.join(location)}: {error}"
+    return str(error)
+
+
 class Context:
+    ''' origin_statement is the innermost loop whose body is being collected, None outside any loop '''
     def __init__(self, pre_condition:AnnotationStatement, post_condition:AnnotationStatement,
                  origin_statement:Union[None,Statement]):
         self.pre_condition = pre_condition
@@ -57,322 +100,934 @@ class Context:
 
 
 
-def substitute(expression, mapping):
-    if isinstance(expression, LiteralExpression):
+def shallow_copy(expression):
+    ''' same as copy.copy for the expression nodes, which only hold plain attributes, without its overhead '''
+    expression_copy = object.__new__(expression.__class__)
+    expression_copy.__dict__.update(expression.__dict__)
+    return expression_copy
+
+
+class Substitution(Fold):
+    ''' replaces the variables of an expression by the expressions they are mapped to,
+    the expression is left untouched and only the nodes above a replaced variable are copied '''
+    def __init__(self, mapping):
+        self.mapping = mapping
+
+    def visit_LiteralExpression(self, expression):
         return expression
-    elif isinstance(expression, VariableExpression):
-        if expression.name in mapping:
-            return mapping[expression.name]
-        else:
-            return expression
-    elif isinstance(expression, ReturnValueVariableExpression):
-        if expression.name in mapping:
-            return mapping[expression.name]
-        else:
+
+    def visit_VariableExpression(self, expression):
+        return self.mapping.get(expression.name, expression)
+
+    def visit_ReturnValueVariableExpression(self, expression):
+        return self.mapping.get(expression.name, expression)
+
+    def visit_BinaryExpression(self, expression, left, right):
+        if left is expression.left and right is expression.right:
             return expression
-    elif isinstance(expression, BinaryExpression):
-        expression.left = substitute(expression.left, mapping)
-        expression.right = substitute(expression.right, mapping)
+        expression = shallow_copy(expression)
+        expression.left = left
+        expression.right = right
         return expression
-    elif isinstance(expression, UnaryExpression):
-        expression.expression = substitute(expression.expression, mapping)
+
+    def visit_UnaryExpression(self, expression, operand):
+        if operand is expression.expression:
+            return expression
+        expression = shallow_copy(expression)
+        expression.expression = operand
         return expression
 
 
-total = []
+def substitute(expression, mapping):
+    return Substitution(mapping).visit(expression)
 
-def collector(statements:List[Statement], path:List[Statement], context:Union[None, Context]):
-    statements = copy.deepcopy(statements)
-    path = copy.deepcopy(path)
 
-    if not statements:
-        if context.origin_statement and isinstance(context.origin_statement, WhileLoopStatement):
-            path.append(context.origin_statement.invariant)
-        else:
-            path.append(context.post_condition)
-        path = copy.deepcopy(path)
-        total.append(path)
-        return
+# encodings of the VC of a basic path
+SUBSTITUTION = "substitution"
+SSA = "ssa"
 
-    statement = statements[0]
-    tail = statements[1:]
+# the n-th assignment of x defines the variable x!n in the SSA encoding, "!" is not allowed in the names of the program
+SSA_SEPARATOR = "!"
 
-    if isinstance(statement, IfThenElseStatement):
-        then_statements = statement.then_body
-        else_statements = statement.else_body
 
+def substitution_vc(pre, statements:List[Statement], post):
+    ''' VC of a basic path by backward substitution, the right-hand side of each assignment replaces the variable
+    in the condition after it, so a chain of assignments each using its variable twice gives an exponential VC
+
+    The substitutions are composed forward: each variable is mapped to its value in terms of the inputs of the
+    path, and every assumption, then the postcondition, is substituted once with the mapping at its position.
+    This gives the same VC as substituting backward, without walking the condition again at each assignment. '''
+    mapping = {}
+    hypotheses = []
+    for statement in statements:
+        if isinstance(statement, AssignmentStatement):
+            mapping[statement.variable] = substitute(statement.expression, mapping)
+        elif isinstance(statement, AssumptionStatement):
+            hypotheses.append(substitute(statement.expression, mapping))
+    post = substitute(post, mapping)
+    for hypothesis in reversed(hypotheses):
+        post = ImpliesExpression(hypothesis, post, "=>")
+    return ImpliesExpression(pre, post, "=>")
+
+
+def ssa_vc(pre, statements:List[Statement], post):
+    ''' VC of a basic path in SSA form, each assignment defines a fresh version of its variable, equal to its
+    right-hand side, and the later uses of the variable refer to that version, so the VC is linear in the length
+    of the path. The variables of the precondition keep their names, they are the inputs of the path. '''
+    versions = {}
+    renaming = {}
+    hypotheses = []
+    for statement in statements:
+        if isinstance(statement, AssignmentStatement):
+            expression = substitute(statement.expression, renaming)
+            version = versions[statement.variable] = versions.get(statement.variable, 0) + 1
+            variable = VariableExpression(f"{statement.variable}{SSA_SEPARATOR}{version}", expression.type)
+            renaming[statement.variable] = variable
+            hypotheses.append(ComparisonBinaryExpression(variable, expression, "=="))
+        elif isinstance(statement, AssumptionStatement):
+            hypotheses.append(substitute(statement.expression, renaming))
+    post = substitute(post, renaming)
+    for hypothesis in reversed(hypotheses):
+        post = ImpliesExpression(hypothesis, post, "=>")
+    return ImpliesExpression(pre, post, "=>")
+
+
+VC_ENCODINGS = {
+    SUBSTITUTION: substitution_vc,
+    SSA: ssa_vc,
+}
+
+
+def overflow_vc(vc, encoding:str, pre, statements:List[Statement], post):
+    ''' VC whose operations are those evaluated by the basic path, its overflow VC (see translate_vc) is the
+    overflow VC of the path: the SSA encoded VC, where the value of each assignment, and of the RETURN, is a
+    hypothesis under the assumptions before it, so an operation whose value never reaches the postcondition is
+    checked too, unlike in the VC by substitution '''
+    return vc if encoding == SSA else ssa_vc(pre, statements, post)
+
+
+def input_assignment(assignment:Union[None, Dict[str, object]]) -> Union[None, Dict[str, object]]:
+    ''' the values of an assignment of an SSA encoded VC for the variables of the program, without their versions '''
+    if assignment is None:
+        return None
+    return {name: value for name, value in assignment.items() if SSA_SEPARATOR not in name}
+
+
+# orders in which the basic paths of a function are enumerated
+DFS = "dfs"
+BFS = "bfs"
+
+
+# position of a work item at the end of the body of a loop, or of the function
+END = ()
+
+
+def position(block:List[Statement], index:int, outer) -> tuple:
+    ''' position of the statement block[index], followed by the position outer once the block is done, the
+    statements left are never copied out of their blocks '''
+    while index >= len(block):
+        if outer is END:
+            return END
+        block, index, outer = outer
+    return (block, index, outer)
+
+
+def path_list(path) -> List[Statement]:
+    ''' statements of a linked path (last statement, previous path), the previous path of the first one is None '''
+    statements = []
+    while path is not None:
+        statement, path = path
+        statements.append(statement)
+    statements.reverse()
+    return statements
+
+
+class PathCollector(Visitor):
+    ''' enumerates the basic paths of a function body, see paths
+
+    A work item (position, path, context, facts) is a path not completed yet and the position of the statements
+    left to follow (see position), a visit method handles the statement at the position and returns the work items
+    continuing the path, where a completed basic path is (None, path, None, None). The path is linked, (last
+    statement, previous path), so that extending it does not copy it, and the paths sharing a prefix share it.
+    The branches whose condition contradicts the facts known on their path (see feasibility.py) are not followed
+    if prune is true, the facts are extended with each statement appended to the path (they are None without
+    pruning). The PATH_GENERATED event of a path is emitted with function_name when it is yielded. '''
+
+    def __init__(self, prune:bool=True, function_name:Union[None, str]=None):
+        self.prune = prune
+        self.function_name = function_name
+        self.pruned_branches = 0
+
+    def paths(self, statements:List[Statement], start:AnnotationStatement, context:Context,
+              order:str=DFS, max_paths:Union[None, int]=None):
+        ''' generator of the basic paths starting at the annotation, each one is yielded as soon as it is completed
+        so only the work items left are kept in memory, raises PathExplosion once more than max_paths paths are
+        completed '''
+        worklist = deque([(position(statements, 0, END), (start, None), context,
+                           path_facts([start]) if self.prune else None)])
+        depth_first = order == DFS
+        dispatch = self._dispatch_table
+        path_count = 0
+        while worklist:
+            item_position, path, context, facts = worklist.pop() if depth_first else worklist.popleft()
+            if item_position is None:
+                path_count += 1
+                if max_paths is not None and path_count > max_paths:
+                    raise PathExplosion(max_paths)
+                path = path_list(path)
+                emit(PATH_GENERATED, self.function_name, path_count - 1, path)
+                yield path
+                continue
+            if item_position is END:
+                # end of the body of a loop, or of the function
+                if context.origin_statement is not None:
+                    successors = [(None, (context.origin_statement.invariant, path), None, None)]
+                else:
+                    successors = [(None, (context.post_condition, path), None, None)]
+            else:
+                block, index, outer = item_position
+                statement = block[index]
+                successors = dispatch[statement.__class__](self, statement, position(block, index + 1, outer),
+                                                           path, context, facts)
+            # the successors of a work item are followed in order, by both DFS and BFS
+            worklist.extend(reversed(successors) if depth_first else successors)
+
+    def branch_facts(self, facts:Union[None, Facts], condition, polarity:bool):
+        ''' (whether the branch where the condition has the polarity is feasible, facts known in the branch) '''
+        if facts is None:
+            return True, None
+        formula = normalize(condition, polarity)
+        if facts.contradicts(formula):
+            self.pruned_branches += 1
+            return False, None
+        return True, facts.assume(formula)
+
+    def visit_IfThenElseStatement(self, statement, tail, path, context, facts):
         condition_holds = AssumptionStatement(statement.condition)
         condition_doesnt_hold = AssumptionStatement(NotExpression(statement.condition))
 
-        collector(then_statements + tail, path + [condition_holds], Context(context.pre_condition, context.post_condition, statement))
-
-
-        collector(else_statements + tail, path + [condition_doesnt_hold], Context(context.pre_condition, context.post_condition, statement))
-
-    elif isinstance(statement, WhileLoopStatement):
+        # both branches end where the IF ends, so the context is unchanged
+        successors = []
+        feasible, then_facts = self.branch_facts(facts, statement.condition, True)
+        if feasible:
+            successors.append((position(statement.then_body, 0, tail), (condition_holds, path), context, then_facts))
+        feasible, else_facts = self.branch_facts(facts, statement.condition, False)
+        if feasible:
+            successors.append((position(statement.else_body, 0, tail), (condition_doesnt_hold, path), context,
+                               else_facts))
+        return successors
+
+    def visit_WhileLoopStatement(self, statement, tail, path, context, facts):
         invariant = statement.invariant
 
-        path.append(invariant)
-        total.append(copy.deepcopy(path))
-
-        # Keep Invariant
-        path = [path[-1]]
+        # the path reaching the loop ends at its invariant, and new paths start from it
+        successors = [(None, (invariant, path), None, None)]
+        path = (invariant, None)
+        facts = path_facts([invariant]) if facts is not None else None
 
         condition_holds = AssumptionStatement(statement.condition)
         condition_doesnt_hold = AssumptionStatement(NotExpression(statement.condition))
 
-        collector(statement.body, path + [condition_holds], Context(context.pre_condition, context.post_condition, statement))
-
-        collector(tail, path + [condition_doesnt_hold], Context(context.pre_condition, context.post_condition, statement))
+        feasible, body_facts = self.branch_facts(facts, statement.condition, True)
+        if feasible:
+            successors.append((position(statement.body, 0, END), (condition_holds, path),
+                               Context(context.pre_condition, context.post_condition, statement), body_facts))
+        # after the loop, the path ends where the loop itself ends
+        feasible, exit_facts = self.branch_facts(facts, statement.condition, False)
+        if feasible:
+            successors.append((tail, (condition_doesnt_hold, path), context, exit_facts))
+        return successors
 
-    elif isinstance(statement, ReturnStatement):
-        path.append(statement)
-        path.append(context.post_condition)
-        total.append(copy.deepcopy(path))
+    def visit_ReturnStatement(self, statement, tail, path, context, facts):
+        return [(None, (context.post_condition, (statement, path)), None, None)]
 
+    def visit_AssignmentStatement(self, statement, tail, path, context, facts):
+        return [(tail, (statement, path), context, facts.assign(statement.variable) if facts is not None else None)]
 
-    elif isinstance(statement, AssignmentStatement) or isinstance(statement, AssumptionStatement):
-        path.append(statement)
-        collector(tail, path, context)
+    def visit_AssumptionStatement(self, statement, tail, path, context, facts):
+        return [(tail, (statement, path), context,
+                 facts.assume(normalize(statement.expression)) if facts is not None else None)]
 
-    elif isinstance(statement, AnnotationStatement):
+    def visit_AnnotationStatement(self, statement, tail, path, context, facts):
         raise AnnotationWithNoWhileLoop()
 
-    elif isinstance(statement, DeclarationStatement):
-        collector(tail, path, context)
-    else:
-        raise ExpressionWithNoEffect()
+    def visit_DeclarationStatement(self, statement, tail, path, context, facts):
+        return [(tail, path, context, facts)]
 
-    return
+    def generic_visit(self, statement, tail, path, context, facts):
+        raise ExpressionWithNoEffect()
 
 
-def convert_to_z3(basic_paths, function:FunctionDeclarationStatement) -> bool:
-    basic_paths = copy.deepcopy(basic_paths)
+def collect_basic_paths(function:FunctionDeclarationStatement, order:str=DFS, max_paths:Union[None, int]=None,
+                        prune:bool=True):
+    ''' (collector, generator of the basic paths of the function), see PathCollector.paths '''
+    path_collector = PathCollector(prune, function.function_name)
+    pre_condition, post_condition = function.precondition, function.postcondition
+    return path_collector, path_collector.paths(function.get_body_after_annotations(), pre_condition,
+                                                Context(pre_condition, post_condition, None), order, max_paths)
+
+
+def smt2_file_name(prefix:Union[None, str], function_name:str, path_index:int) -> str:
+    ''' stable name of the SMT-LIB2 file holding the VC of a basic path '''
+    name = f"{function_name}.path{path_index:03d}.smt2"
+    if prefix:
+        return f"{prefix}.{name}"
+    return name
+
+
+def export_smt2(solver:z3.Solver, directory:str, file_name:str, header:List[str], logic:str) -> str:
+    ''' dump the assertions of the solver (the negated VC) as an SMT-LIB2 script '''
+    os.makedirs(directory, exist_ok=True)
+    file_path = os.path.join(directory, file_name)
+    with open(file_path, "w") as f:
+        for line in header:
+            f.write("; " + line.replace("\n", " ") + "\n")
+        f.write(f"(set-logic {SMTLIB_LOGICS[logic]})\n")
+        f.write(solver.to_smt2())
+    return file_path
+
+
+# VCs built ahead of the reports when they are checked by a thread pool
+MAX_PENDING_VCS = 64
+
+
+def check_vc(vc, logic:str, vc_variables:Dict[str, DataType], exhaustive:bool, random_tests:int,
+             tactics:Union[None, List[str]]=None, function_name:Union[None, str]=None,
+             portfolio:Union[None, List[str]]=None, bit_width:Union[None, int]=None, overflow:bool=False,
+             context:Union[None, z3.Context]=None) -> tuple:
+    ''' (status, counterexample, reason of an unknown status) of a VC, the solver works in the given
+    z3 context so that VCs can be checked by several threads, each with its own context,
+    the VCs of the PORTFOLIO_LOGICS are raced by the configurations of the portfolio if one is given
+
+    With a bit width, INT is encoded as bit-vectors of that width, and with overflow it is the overflow VC of the
+    VC that is checked: the operations of the VC do not overflow, under the hypotheses they are evaluated in, the VC
+    is then built by overflow_vc '''
+    counter_example = None
+    with memory_phase(SOLVE, function_name):
+        if exhaustive:
+            # small Boolean input space, every assignment is evaluated at once with NumPy
+            start = time.perf_counter()
+            counter_example = exhaustive_check(vc, vc_variables)
+            record_solving_time(QF_BOOL + "/exhaustive", time.perf_counter() - start)
+            return (z3.unsat if counter_example is None else z3.sat), counter_example, None
+        if random_tests > 0 and vc_variables and bit_width is None:
+            # most invalid VCs are falsified by some random input, z3 is then only needed to prove the others
+            start = time.perf_counter()
+            counter_example = random_check(vc, vc_variables, random_tests)
+            record_solving_time(logic + "/random", time.perf_counter() - start)
+            if counter_example is not None:
+                return z3.sat, counter_example, None
+
+    with memory_phase(VC_BUILD, function_name):
+        solver = make_solver(logic, tactics, context)
+        solver.add(z3.Not(translate_vc(vc, bit_width, overflow, context)))
+
+    with memory_phase(SOLVE, function_name):
+        if portfolio and logic in PORTFOLIO_LOGICS:
+            start = time.perf_counter()
+            status, counter_example, reason, winner = race(solver.to_smt2(), logic, portfolio)
+            duration = time.perf_counter() - start
+            record_solving_time(logic + "/portfolio", duration)
+            record_race(logic, winner, duration)
+            return status, counter_example, reason
+        status = timed_check(solver, logic)
+        if status == z3.sat:
+            return status, model_assignment(solver.model()), None
+        if status == z3.unknown:
+            return status, None, solver.reason_unknown()
+        return status, None, None
+
+
+def translate_vc(vc, bit_width:Union[None, int]=None, overflow:bool=False, context:Union[None, z3.Context]=None):
+    ''' z3 term of the VC, or of its overflow VC '''
+    translator = Z3Translator(context, bit_width)
+    term = translator.translate(vc)
+    return translator.no_overflow() if overflow else term
+
+
+def timed_check_vc(*arguments, context:Union[None, z3.Context]=None) -> tuple:
+    ''' (result of check_vc, wall time of the check in seconds) '''
+    start = time.perf_counter()
+    result = check_vc(*arguments, context=context)
+    return result, time.perf_counter() - start
+
+
+def check_vc_in_thread(*arguments) -> tuple:
+    ''' timed_check_vc in the z3 context of the calling thread '''
+    return timed_check_vc(*arguments, context=thread_context())
+
+
+def convert_to_z3(basic_paths, function:FunctionDeclarationStatement,
+                  smt2_dir:Union[None, str]=None, smt2_prefix:Union[None, str]=None,
+                  tactics:Union[None, List[str]]=None,
+                  exhaustive_max_variables:int=DEFAULT_EXHAUSTIVE_MAX_VARIABLES,
+                  random_tests:int=DEFAULT_RANDOM_TESTS, replay:bool=False,
+                  vc_results:Union[None, Dict[str, "VCResult"]]=None,
+                  executor:Union[None, ThreadPoolExecutor]=None, encoding:str=SUBSTITUTION,
+                  portfolio:Union[None, List[str]]=None, bit_width:Union[None, int]=None,
+                  intervals:bool=True) -> bool:
+    ''' check the VC of every basic path with a solver chosen for the logic of the VC, or built from the
+    given z3 tactics, if smt2_dir is given the VCs are also exported as SMT-LIB2 files so they can be
+    solved offline (see solve_smt2.py)
+
+    In a function whose variables are all Boolean, a VC with at most exhaustive_max_variables variables
+    is decided by evaluating it on all its assignments instead (see vectorized.py), the other VCs are first
+    evaluated on random_tests random assignments and only given to the solver if none falsifies them
+
+    With replay, the counterexamples of the paths starting at the precondition are run on the compiled function
+    (see interpreter.py), which tells a real bug from a loop invariant too weak to prove the function
+
+    vc_results maps the canonical form of the VCs already checked to their result (see canonical.py),
+    a VC found there is not checked again, and new results are added to it
+
+    With a portfolio (names of configurations of portfolio.py), the nonlinear VCs are raced by these
+    configurations in parallel processes instead of being checked by a single solver
+
+    The VCs are built with the given encoding (SUBSTITUTION or SSA), the counterexamples of SSA encoded VCs
+    only give the values of the inputs of the path
+
+    With a bit width, INT is a signed bit-vector of that width whose arithmetic wraps around, the VCs are not
+    tested on random inputs (their arithmetic does not wrap around) and a path evaluating arithmetic operations
+    also gets an overflow VC, valid if none of them overflows (see overflow_vc), its counterexample only gives the
+    values of the inputs of the path
+
+    With intervals, the VCs proved by intervals from the first annotation of their path and its assumptions (see
+    intervals.py) are reported valid without being checked, and a VC starting at a loop invariant that is not
+    proved valid is followed by a note if it holds in the states reaching the loop head, the invariant is then
+    too weak. The intervals do not model the wrap around of bit-vectors so they are not used with a bit width
+
+    The VCs are built in this thread, if an executor is given they are checked by its threads while the next
+    ones are built, each thread with its own z3 context, and the results are still reported in path order '''
+    compiled_function = None
+    if replay:
+        try:
+            compiled_function = compile_function(function)
+        except (SyntaxError, RecursionError, MemoryError) as e:
+            # the Python parser limits the nesting of blocks and parentheses, the VCs are still checked
+            print(f"Replay disabled for {function.function_name}, it is nested too deeply for Python: "
+                  f"{str(e) or type(e).__name__}")
+    use_intervals = intervals and bit_width is None
+    # states reaching the loop heads, only analyzed once a VC starting at a loop invariant is not proved valid
+    loop_heads = None
+    function_variables = get_functions(function.function_name)[0]
+    is_boolean_function = isinstance(function, BoolFunctionDeclarationStatement) and \
+        all(variable_type == DataType.BOOL for variable_type in function_variables.values())
+    # VCs built and not reported yet, at most MAX_PENDING_VCS so that the paths are not all built ahead of the solvers
+    pending = deque()
+    window = MAX_PENDING_VCS if executor is not None else 0
     is_invalid = False
 
-    print("Validating function: " + function.function_name)
-    for basic_path in basic_paths:
-
-        pre, post = basic_path[0], basic_path[-1]
-        variables = get_functions(function.function_name)[0]
-        # variables = functions[function.function_name][0]
-
-        if isinstance(basic_path[-2], ReturnStatement):
-            if isinstance(function, IntFunctionDeclarationStatement):
-                basic_path[-2] = IntAssignmentStatement("rv", basic_path[-2].expression)
-                variables["rv"] = DataType.INT
-            elif isinstance(function, BoolFunctionDeclarationStatement):
-                basic_path[-2] = BooleanAssignmentStatement("rv", basic_path[-2].expression)
-                variables["rv"] = DataType.BOOL
-
-        statements = basic_path[1:-1]
-
-        immutable_basic_path = copy.deepcopy(basic_path)
-        pre = pre.expression
-        post = post.expression
-
-        mapping = {}
-        solver = z3.Solver()
-
-        for variable in variables.keys():
-            if variables[variable] == DataType.INT:
-                mapping[variable] = z3.Int(variable)
-            elif variables[variable] == DataType.BOOL:
-                mapping[variable] = z3.Bool(variable)
-
-        for statement in statements[::-1]:
-            if isinstance(statement, AssignmentStatement):
-                variable_name = statement.variable
-                # Side effect that affects post condition
-                # Back propgation
-                substitute(post, { variable_name: statement.expression })
-            elif isinstance(statement, AssumptionStatement):
-                post = ImpliesExpression(statement.expression, post, "=>")
-
-            if isinstance(statement, AnnotationStatement):
-                pass
-
-        mapping['z3'] = z3
-        fol_statement_z3 = f"z3.Implies({Z3Serializer.serialize(pre)}, {Z3Serializer.serialize(post)})"
-        fol_statement = f"({pre}) => ({post})"
-        solver.add(z3.Not(eval(fol_statement_z3, mapping)))
-        solver_result = solver.check()
-        print("Original basic path")
-        print(immutable_basic_path)
-        print("VC")
-        print(fol_statement)
+    def report(path_index, basic_path, fol_statement, logic, result, renaming, is_duplicate, overflow, discharged,
+               future):
+        nonlocal is_invalid, loop_heads
+        if is_duplicate:
+            # same VC as an earlier path, up to renaming, the earlier one is always reported first
+            solver_result = result.status
+            counter_example = rename_assignment(result.counter_example, inverse_renaming(renaming))
+            reason = result.reason
+            duration = 0.0
+        else:
+            (solver_result, counter_example, reason), duration = future.result()
+            if result is not None:
+                result.status = solver_result
+                result.counter_example = rename_assignment(counter_example, renaming)
+                result.reason = reason
+
+        if encoding == SSA or overflow:
+            counter_example = input_assignment(counter_example)
+
+        duplicate = f" (same VC as {result.origin})" if is_duplicate else \
+            " (discharged by interval analysis)" if discharged else ""
+        if overflow:
+            # follows the VC of the same path
+            print("Overflow VC")
+            print(f"NoOverflow({fol_statement})")
+        else:
+            print("Original basic path")
+            print(basic_path)
+            print("VC")
+            print(fol_statement)
         if solver_result == z3.sat:
             is_invalid = True
-            counter_example = solver.model()
-            print("Invalid!")
-            print("Counter example: ",counter_example)
+            print("Invalid!" + duplicate)
+            print("Counter example: ", format_counter_example(counter_example))
+        elif solver_result == z3.unknown:
+            # the VC could not be proved
+            is_invalid = True
+            print("Unknown! (" + logic + ": " + reason + ")" + duplicate)
         else:
-            print("Valid!")
+            print("Valid!" + duplicate)
+        if solver_result != z3.unsat and use_intervals and not overflow \
+                and isinstance(basic_path[0], LoopAnnotationStatement):
+            if loop_heads is None:
+                loop_heads = analyze_function(function)
+            if holds_when_reached(basic_path, loop_heads):
+                print("Holds in the states reaching the loop (interval analysis), the invariant may be too weak")
+        emit(VC_SOLVED, function.function_name, path_index, logic,
+             INVALID if solver_result == z3.sat else UNKNOWN if solver_result == z3.unknown else VALID,
+             duration, overflow, is_duplicate)
+        if compiled_function is not None and counter_example is not None and not overflow \
+                and isinstance(basic_path[0], PreAnnotationStatement):
+            # the variables of the VC of a path starting at the precondition hold the inputs of the function
+            outcome = replay_counter_example(compiled_function, counter_example)
+            print(f"Replay of {function.function_name}{compiled_function.arguments_of(counter_example)}: {outcome}")
+
+    print("Validating function: " + function.function_name)
+    try:
+        for path_index, basic_path in enumerate(basic_paths):
+            build_start = time.perf_counter()
+            with memory_phase(VC_BUILD, function.function_name):
+                # the statements of a path are shared with the other paths, and with the function, they are never
+                # modified: the VCs are built from new expressions, so only the list is copied
+                basic_path = list(basic_path)
+
+                pre, post = basic_path[0], basic_path[-1]
+
+                if isinstance(basic_path[-2], ReturnStatement):
+                    if isinstance(function, IntFunctionDeclarationStatement):
+                        basic_path[-2] = IntAssignmentStatement("rv", basic_path[-2].expression)
+                    elif isinstance(function, BoolFunctionDeclarationStatement):
+                        basic_path[-2] = BooleanAssignmentStatement("rv", basic_path[-2].expression)
+
+                statements = basic_path[1:-1]
+
+                immutable_basic_path = basic_path
+
+                vc = VC_ENCODINGS[encoding](pre.expression, statements, post.expression)
+                logic = classify_logic(vc, bit_width)
+                fol_statement = f"({vc.left}) => ({vc.right})"
+
+                # (overflow, VC, its text, logic, variables, canonical form, renaming to it) of each VC of the path
+                checks = [(False, vc, fol_statement, logic, free_variables(vc))]
+                if bit_width is not None:
+                    path_vc = overflow_vc(vc, encoding, pre.expression, statements, post.expression)
+                    if has_arithmetic(path_vc):
+                        checks.append((True, path_vc, f"({path_vc.left}) => ({path_vc.right})",
+                                       classify_logic(path_vc, bit_width), free_variables(path_vc)))
+                checks = [check + (canonicalize(check[1]) if vc_results is not None else (None, None))
+                          for check in checks]
+
+                if smt2_dir is not None:
+                    for overflow, checked_vc, checked_statement, checked_logic, _, _, _ in checks:
+                        solver = make_solver(checked_logic, tactics)
+                        solver.add(z3.Not(translate_vc(checked_vc, bit_width, overflow)))
+                        file_name = smt2_file_name(smt2_prefix, function.function_name, path_index)
+                        export_smt2(solver, smt2_dir, file_name.replace(".smt2", ".overflow.smt2") if overflow
+                                    else file_name,
+                                    [f"function: {function.function_name}", f"path: {path_index}",
+                                     f"basic path: {immutable_basic_path}",
+                                     f"VC: NoOverflow({checked_statement})" if overflow
+                                     else f"VC: {checked_statement}"],
+                                    checked_logic)
+            emit(VC_BUILT, function.function_name, path_index, logic, time.perf_counter() - build_start)
+
+            discharged = False
+            if use_intervals:
+                start = time.perf_counter()
+                discharged = discharges(basic_path)
+                if discharged:
+                    record_solving_time(logic + INTERVAL_LOGIC_SUFFIX, time.perf_counter() - start)
+
+            for overflow, checked_vc, checked_statement, checked_logic, vc_variables, canonical_vc, renaming in checks:
+                result = None
+                is_duplicate = False
+                if discharged:
+                    # proved without a solver, it is not shared with the other paths
+                    future = Future()
+                    future.set_result(((z3.unsat, None, None), 0.0))
+                    pending.append((path_index, immutable_basic_path, checked_statement, checked_logic, result,
+                                    renaming, is_duplicate, overflow, discharged, future))
+                    continue
+                if vc_results is not None:
+                    key = f"NoOverflow({canonical_vc})" if overflow else canonical_vc
+                    result = vc_results.get(key)
+                    is_duplicate = result is not None
+                    if not is_duplicate:
+                        # filled in when the path is reported
+                        result = vc_results[key] = VCResult(None, None, None,
+                                                            f"{function.function_name} path {path_index}")
+
+                future = None
+                if not is_duplicate:
+                    exhaustive = not overflow and is_boolean_function and exhaustive_max_variables > 0 and \
+                        len(vc_variables) <= exhaustive_max_variables
+                    arguments = (checked_vc, checked_logic, vc_variables, exhaustive, random_tests, tactics,
+                                 function.function_name, portfolio, bit_width, overflow)
+                    if executor is not None:
+                        future = executor.submit(check_vc_in_thread, *arguments)
+                    else:
+                        future = Future()
+                        future.set_result(timed_check_vc(*arguments))
+                pending.append((path_index, immutable_basic_path, checked_statement, checked_logic, result,
+                                renaming, is_duplicate, overflow, discharged, future))
+            while len(pending) > window:
+                report(*pending.popleft())
+    finally:
+        # also on a path explosion, the paths checked so far are reported
+        while pending:
+            report(*pending.popleft())
     return not is_invalid
 
-def ensure_and_attach_loop_annotation(statements):
-    '''This takes the loop annotation and merges it into
-        the while loop statement'''
-    i = 0
-    while i < len(statements):
-        statement = statements[i]
-        if isinstance(statement, WhileLoopStatement):
-            if not isinstance(statements[i-1], LoopAnnotationStatement):
-                raise LoopAnnotationError()
-            else:
-                statements[i].invariant = statements[i-1]
-                statements.pop(i - 1)
-                i = i - 1
-        if isinstance(statement, FunctionDeclarationStatement):
-            ensure_and_attach_loop_annotation(statement.body)
-        if isinstance(statement, IfThenElseStatement):
-            ensure_and_attach_loop_annotation(statement.then_body)
-            ensure_and_attach_loop_annotation(statement.else_body)
-        i += 1
-
-def ensure_function_declarations(statements):
-    ''' make sure that all the code is inside a function's body  with pre and post annotations '''
 
-    for statement in statements:
-        if isinstance(statement, FunctionDeclarationStatement):
-            continue
+class VCResult:
+    ''' verdict of a VC, shared by the paths whose VCs have the same canonical form,
+    the counterexample uses the canonical names of the variables '''
+    def __init__(self, status, counter_example:Union[None, Dict[str, object]], reason:Union[None, str], origin:str):
+        self.status = status
+        self.counter_example = counter_example
+        self.reason = reason
+        self.origin = origin
+
+
+def model_assignment(model:z3.ModelRef) -> Dict[str, object]:
+    ''' values of the variables of a z3 model as Python values '''
+    assignment = {}
+    for declaration in model.decls():
+        value = model[declaration]
+        if z3.is_bool(value):
+            assignment[declaration.name()] = z3.is_true(value)
+        elif z3.is_bv_value(value):
+            # the bit-vectors encode signed integers
+            assignment[declaration.name()] = value.as_signed_long()
         else:
-            raise AnnotationFuncError()
-
-
-    for function in statements:
-        statement_index = 0
-        body_statements = function.body
-        while statement_index < len(body_statements):
-            if isinstance(body_statements[statement_index], DeclarationStatement):
-                statement_index += 1
-            else:
-                break
-
-        if statement_index < len(body_statements):
-            if isinstance(body_statements[statement_index], PreAnnotationStatement):
-                if isinstance(body_statements[statement_index+1], PostAnnotationStatement):
-                    statement_index = statement_index + 2
-                    while statement_index < len(body_statements):
-                        if isinstance(statement_index, PreAnnotationStatement):
-                            raise PreConditionError("Incorrect placement of Precondition")
-                        if isinstance(statement_index, PostAnnotationStatement):
-                            raise PostConditionError("Incorrect placement of PostCondition")
-                        statement_index = statement_index + 1
-                else:
-                    raise PostConditionMissing()
-            else:
-                raise PreConditionError("Missing precondition")
-
-    return
+            assignment[declaration.name()] = value.as_long()
+    return assignment
 
+class ContractVariableChecker(Fold):
+    ''' true if an annotation only uses the parameters of the function, and also "rv" for a postcondition '''
+    def __init__(self, parameter_list:List[str], condition:str):
+        assert (condition == "precondition" or condition == "postcondition")
+        self.parameter_list = parameter_list
+        self.condition = condition
 
+    def visit_LiteralExpression(self, expression) -> bool:
+        return True
 
-def ensure_return_statements(program_statements) -> None:
-    '''ensure correct return statements types and placement.'''
+    def visit_ReturnValueVariableExpression(self, expression) -> bool:
+        return self.condition == "postcondition"
 
-    def ensure_correct_return_types(function: FunctionDeclarationStatement, statements) -> None:
-        '''make sure that the type of the expressions returned by all return statements
-         match the function type.'''
+    def visit_VariableExpression(self, expression) -> bool:
+        return expression.name in self.parameter_list
 
-        for statement in statements:
-            if isinstance(statement, ReturnStatement):
-                function.assert_valid_return_statement(statement)
-            elif isinstance(statement, IfThenElseStatement):
-                ensure_correct_return_types(function, statement.then_body)
-                ensure_correct_return_types(function, statement.else_body)
-            elif isinstance(statement, WhileLoopStatement):
-                ensure_correct_return_types(function, statement.body)
-
-    def ensure_return_statements_aux(statements) -> bool:
-        '''
-        Every function should have at least 1 return statement outside any if-else or while loop statements.
-        '''
-        for statement in statements:
-            if isinstance(statement, ReturnStatement):
-                return True
-            elif isinstance(statement, IfThenElseStatement):
-                if (ensure_return_statements_aux(statement.then_body)
-                        and ensure_return_statements_aux(statement.else_body)):
-                    return True
-        return False
+    def visit_BinaryExpression(self, expression, left:bool, right:bool) -> bool:
+        return left and right
 
-    for statement in program_statements:
-        if isinstance(statement, FunctionDeclarationStatement):
-            ensure_correct_return_types(statement, statement.body)
-            if not ensure_return_statements_aux(statement.body):
-                raise MissingReturnStatement()
+    def visit_UnaryExpression(self, expression, operand:bool) -> bool:
+        return operand
 
 
-def ensure_pre_post_condition(pre_condition:AnnotationStatement, post_condition:AnnotationStatement, parameter_list:List[DeclarationStatement]):
-    ''' make sure that the precondition and postcondition contain only parameter variables, or also "rv" for postcondition '''
-    def ensure_pre_post_condition_aux(expression, parameter_list, condition: str):
-        assert (condition == "precondition" or condition == "postcondition")
+class NestedBlocks:
+    ''' blocks of a statement, validated by ProgramValidator.validate_block, the statement always reaches a return
+    statement if can_return is true and all its blocks always reach one '''
+    def __init__(self, blocks:List[List[Statement]], can_return:bool):
+        self.blocks = blocks
+        self.can_return = can_return
 
-        if expression is None:
-            return True
-        elif isinstance(expression, IntLiteralExpression) or isinstance(expression, BooleanLiteralExpression):
-            return True
-        elif isinstance(expression, ReturnValueVariableExpression):
-            if condition == "precondition":
-                return False
-            elif condition == "postcondition":
-                return True
-        elif isinstance(expression, VariableExpression):
-            return expression.name in parameter_list
-        elif isinstance(expression, BinaryExpression):
-            return ensure_pre_post_condition_aux(expression.left, parameter_list, condition) and \
-                ensure_pre_post_condition_aux(expression.right, parameter_list, condition)
-        elif isinstance(expression, UnaryExpression):
-            return ensure_pre_post_condition_aux(expression.expression, parameter_list, condition)
 
-    parameter_list = [parameter.variable for parameter in parameter_list]
+class ProgramValidator(Visitor):
+    ''' Semantic analysis of a parsed program, done in a single traversal of each function:
+    - all the code is inside functions, whose body starts with the declarations and the pre and post conditions
+    - the pre and post conditions only use the parameters, and also "rv" for the post condition
+    - every while loop is preceded by its loop annotation, which is moved into the loop statement
+    - return statements match the function type and every function ends with a return statement
+    Every error is collected with its line before the ProgramValidationError listing them is raised. '''
 
-    if not ensure_pre_post_condition_aux(pre_condition.expression, parameter_list, "precondition"):
-        raise PreConditionError()
-    if not ensure_pre_post_condition_aux(post_condition.expression, parameter_list, "postcondition"):
-        raise PostConditionError()
+    def __init__(self):
+        self.errors = []
+        self.function = None
 
+    def error(self, exception:Exception, statement:Union[None, Statement]) -> None:
+        exception.lineno = getattr(statement, "lineno", None)
+        exception.function_name = self.function.function_name if self.function else None
+        self.errors.append(exception)
 
+    def validate(self, statements:List[Statement]) -> None:
+        for statement in statements:
+            if isinstance(statement, FunctionDeclarationStatement):
+                self.validate_function(statement)
+            else:
+                self.function = None
+                self.error(AnnotationFuncError(), statement)
+        if self.errors:
+            raise ProgramValidationError(self.errors)
 
-def generate_basic_paths(file_path:str) -> bool:
-    global total
-
-    with open(file_path) as f:
-        input = f.read()
-        program = parser.parse(input)
-        statements = program.statements
-
-        ensure_function_declarations(statements)
+    def validate_function(self, function:FunctionDeclarationStatement) -> None:
+        self.function = function
+        body = function.body
 
-        ensure_and_attach_loop_annotation(statements)
+        statement_index = 0
+        while statement_index < len(body) and isinstance(body[statement_index], DeclarationStatement):
+            statement_index += 1
+
+        if statement_index < len(body) and isinstance(body[statement_index], PreAnnotationStatement):
+            function.precondition = body[statement_index]
+            statement_index += 1
+            if statement_index < len(body) and isinstance(body[statement_index], PostAnnotationStatement):
+                function.postcondition = body[statement_index]
+                statement_index += 1
+            else:
+                self.error(PostConditionMissing(), function)
+        else:
+            self.error(PreConditionError("Missing precondition"), function)
+
+        parameter_list = [parameter.variable for parameter in function.parameter_list]
+        if function.precondition is not None and \
+                not ContractVariableChecker(parameter_list, "precondition").visit(function.precondition.expression):
+            self.error(PreConditionError(), function.precondition)
+        if function.postcondition is not None and \
+                not ContractVariableChecker(parameter_list, "postcondition").visit(function.postcondition.expression):
+            self.error(PostConditionError(), function.postcondition)
+
+        # the annotations are part of the body, only the statements after them are checked as a block
+        header, block = body[:statement_index], body[statement_index:]
+        returns = self.validate_block(block, function)
+        body[:] = header + block
+        if not returns:
+            self.error(MissingReturnStatement(), function)
+
+    def run(self, steps) -> bool:
+        ''' whether a block always reaches a return statement, from the generator of validate_block_steps of the
+        block: the nested blocks are validated on an explicit stack before their block is resumed, so that the
+        blocks can be nested arbitrarily deep '''
+        stack = [steps]
+        value = None
+        while True:
+            step = stack[-1].send(value)
+            if step.__class__ is tuple:
+                stack.append(self.validate_block_steps(*step))
+                value = None
+                continue
+            stack.pop()
+            if not stack:
+                return step
+            value = step
+
+    def check_placement(self, statement:Statement, loop_annotation:Union[None, Statement], owner:Statement) -> bool:
+        ''' checks the statement of a block following the loop annotation (None if there is none), true if the
+        statement is to be visited '''
+        if isinstance(statement, WhileLoopStatement):
+            if loop_annotation is not None:
+                statement.invariant = loop_annotation
+            elif statement.invariant is None:
+                # an invariant attached by a previous validation of the same function is kept
+                self.error(WhileLoopWithNoAnnotation(), statement)
+        elif loop_annotation is not None:
+            self.error(LoopAnnotationError(), loop_annotation)
+        if isinstance(statement, Expression):
+            self.error(ExpressionWithNoEffect(), owner)
+            return False
+        return True
+
+    def validate_block(self, statements:List[Statement], owner:Statement, depth:Union[None, int]=None) -> bool:
+        ''' checks the statements of a block, attaches the loop annotations and returns whether the block
+        always reaches a return statement (one outside any while loop, or in both bodies of an if-else),
+        owner is the function or statement the block belongs to, the errors of its expressions are reported at
+        its line since expressions have none. The nested blocks are validated by recursion down to depth levels
+        (RECURSION_DEPTH by default), and the deeper ones on an explicit stack, see run '''
+        if depth is None:
+            depth = get_recursion_depth()
+        steps = self.validate_block_steps(statements, owner)
+        if depth == 0:
+            return self.run(steps)
+        step = steps.send(None)
+        while step.__class__ is tuple:
+            step = steps.send(self.validate_block(step[0], step[1], depth - 1))
+        return step
+
+    def validate_block_steps(self, statements:List[Statement], owner:Statement):
+        ''' the checks of validate_block as a generator, for both the recursion and run: it yields (nested block,
+        statement) for each block nested in a statement, to be resumed with whether that block always reaches a
+        return statement, and yields that of the block last '''
+        dispatch = self._dispatch_table
+        validated = []
+        loop_annotation = None
+        returns = False
+        for statement in statements:
+            if isinstance(statement, LoopAnnotationStatement):
+                if loop_annotation is not None:
+                    self.error(LoopAnnotationError(), loop_annotation)
+                loop_annotation = statement
+                continue
+            validated.append(statement)
+            is_visited = self.check_placement(statement, loop_annotation, owner)
+            loop_annotation = None
+            if not is_visited:
+                continue
+
+            statement_returns = dispatch[statement.__class__](self, statement)
+            if statement_returns.__class__ is NestedBlocks:
+                nested_blocks = statement_returns
+                statement_returns = nested_blocks.can_return
+                for block in nested_blocks.blocks:
+                    # every block is validated, even once one of them does not return
+                    block_returns = yield block, statement
+                    statement_returns = statement_returns and block_returns
+            if statement_returns:
+                returns = True
+
+        if loop_annotation is not None:
+            self.error(LoopAnnotationError(), loop_annotation)
+        # rebuilt in place, so that the loop annotations are dropped without shifting the list
+        statements[:] = validated
+        yield returns
+
+    def visit_ReturnStatement(self, statement) -> bool:
+        try:
+            self.function.assert_valid_return_statement(statement)
+        except InvalidExpressionType as e:
+            self.error(e, statement)
+        return True
+
+    def visit_IfThenElseStatement(self, statement) -> "NestedBlocks":
+        return NestedBlocks([statement.then_body, statement.else_body], True)
+
+    def visit_WhileLoopStatement(self, statement) -> "NestedBlocks":
+        # the body may never run
+        return NestedBlocks([statement.body], False)
+
+    def visit_PreAnnotationStatement(self, statement) -> bool:
+        self.error(PreConditionError("Incorrect placement of Precondition"), statement)
+        return False
 
-        ensure_return_statements(statements)
+    def visit_PostAnnotationStatement(self, statement) -> bool:
+        self.error(PostConditionError("Incorrect placement of PostCondition"), statement)
+        return False
 
+    def visit_AnnotationStatement(self, statement) -> bool:
+        self.error(AnnotationWithNoWhileLoop(), statement)
+        return False
 
-        is_invalid = False
-        for func_index in range(0,len(statements)):
+    def visit_Statement(self, statement) -> bool:
+        return False
 
-            function = statements[func_index]
-            function.set_precondition()
-            function.set_postcondition()
 
-            pre_condition = function.precondition
-            post_condition = function.postcondition
+def load_program(file_path:str, cache_dir:Union[None, str]=None,
+                 incremental_parser:Union[None, IncrementalParser]=None) -> Program:
+    ''' parse and validate the program of a .tpl file and register the symbol table of its functions,
+    if cache_dir is given an unchanged file is loaded from the cache instead of being parsed again,
+    if incremental_parser is given only the functions changed since its previous parse are parsed '''
+    with open(file_path) as f:
+        input = f.read()
+    return load_source(input, cache_dir, incremental_parser)
+
+
+def load_source(input:str, cache_dir:Union[None, str]=None,
+                incremental_parser:Union[None, IncrementalParser]=None) -> Program:
+    ''' load_program for the content of a .tpl file '''
+    if cache_dir is not None:
+        cached = load_cached_program(cache_dir, input)
+        if cached is not None:
+            program, function_tables = cached
+            for function_name, function_table in function_tables.items():
+                set_functions(function_name, function_table)
+            return program
+
+    with memory_phase(PARSE):
+        program = parse_program(input) if incremental_parser is None else incremental_parser.parse(input)
+    statements = program.statements
+
+    with memory_phase(VALIDATION):
+        ProgramValidator().validate(statements)
+
+    if cache_dir is not None:
+        function_tables = {function.function_name: get_functions(function.function_name) for function in statements}
+        store_cached_program(cache_dir, input, program, function_tables)
+
+    return program
+
+
+def generate_basic_paths(file_path:str, smt2_dir:Union[None, str]=None, cache_dir:Union[None, str]=None,
+                         function_tactics:Union[None, Dict[str, List[str]]]=None,
+                         exhaustive_max_variables:int=DEFAULT_EXHAUSTIVE_MAX_VARIABLES,
+                         random_tests:int=DEFAULT_RANDOM_TESTS, replay:bool=False, prune:bool=True,
+                         deduplicate:bool=True, path_order:str=DFS, max_paths:Union[None, int]=None,
+                         jobs:int=1, encoding:str=SUBSTITUTION, portfolio:Union[None, List[str]]=None,
+                         bit_width:Union[None, int]=None,
+                         incremental_parser:Union[None, IncrementalParser]=None,
+                         bmc_max_depth:Union[None, int]=None, intervals:bool=True) -> bool:
+    ''' verify every function of a .tpl file, function_tactics maps a function name (or "*" for all of them)
+    to the z3 tactics its VCs are solved with, Boolean VCs with at most exhaustive_max_variables variables
+    are decided by enumeration (0 always uses z3) and the other VCs are first tested on random_tests random
+    assignments (0 disables the testing), with replay the counterexamples are run on the function,
+    with prune the branches contradicting the facts known on their path are not collected,
+    with deduplicate the VCs equal up to renaming, across all the functions of the file, are only checked once
+
+    The basic paths of a function are checked while they are enumerated, in path_order (DFS or BFS),
+    a function with more than max_paths basic paths is reported as a path explosion and counts as invalid,
+    with more than one job the VCs are checked by that many threads, each with its own z3 context,
+    encoding is the encoding of the VCs, SUBSTITUTION or SSA (linear in the length of the paths),
+    portfolio names the z3 configurations racing on the nonlinear VCs (see portfolio.py),
+    with a bit width INT is a bit-vector of that width and every path also gets an overflow VC,
+    an incremental_parser only parses the functions changed since the file was last verified with it,
+    with a bmc_max_depth the functions are bounded model checked instead, their loops unrolled up to that
+    many times (see bmc.py), with intervals the VCs proved by intervals along their path are not given to the
+    solvers '''
+    vc_results = {} if deduplicate else None
+
+    reset_solver_statistics()
+    reset_portfolio_statistics()
+
+    program = load_program(file_path, cache_dir, incremental_parser)
+    statements = program.statements
 
-            assert(isinstance(statements[func_index], FunctionDeclarationStatement))
-            assert(isinstance(pre_condition, PreAnnotationStatement))
-            assert(isinstance(post_condition, PostAnnotationStatement))
+    is_invalid = False
+    # the memory of the phases run by concurrent threads can not be told apart
+    executor = ThreadPoolExecutor(jobs) if jobs > 1 and get_memory_profiler() is None else None
+    try:
+        for function in statements:
+            if bmc_max_depth is not None:
+                if not bounded_model_check(function, bmc_max_depth, bit_width):
+                    is_invalid = True
+            elif not verify_function(function, file_path, smt2_dir, function_tactics, exhaustive_max_variables,
+                                   random_tests, replay, prune, path_order, max_paths, vc_results, executor,
+                                   encoding, portfolio, bit_width, intervals):
+                is_invalid = True
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-            ensure_pre_post_condition(pre_condition, post_condition, function.parameter_list)
+    print_solver_statistics()
+    print_portfolio_statistics()
+    return not is_invalid
 
-            collector(function.get_body_after_annotations(),[pre_condition],Context(pre_condition,post_condition,None))
-            # basic_paths.extend(total)
-            if not(convert_to_z3(total,function)):
-                is_invalid = True
-            total = []
 
-        return not is_invalid
+def verify_function(function:FunctionDeclarationStatement, file_path:str, smt2_dir:Union[None, str]=None,
+                    function_tactics:Union[None, Dict[str, List[str]]]=None,
+                    exhaustive_max_variables:int=DEFAULT_EXHAUSTIVE_MAX_VARIABLES,
+                    random_tests:int=DEFAULT_RANDOM_TESTS, replay:bool=False, prune:bool=True,
+                    path_order:str=DFS, max_paths:Union[None, int]=None,
+                    vc_results:Union[None, Dict[str, "VCResult"]]=None,
+                    executor:Union[None, ThreadPoolExecutor]=None, encoding:str=SUBSTITUTION,
+                    portfolio:Union[None, List[str]]=None, bit_width:Union[None, int]=None,
+                    intervals:bool=True) -> bool:
+    ''' verify one function of a loaded program, see generate_basic_paths '''
+    # set by the validation of the program
+    pre_condition = function.precondition
+    post_condition = function.postcondition
+
+    assert(isinstance(function, FunctionDeclarationStatement))
+    assert(isinstance(pre_condition, PreAnnotationStatement))
+    assert(isinstance(post_condition, PostAnnotationStatement))
+
+    emit(FUNCTION_STARTED, function.function_name)
+    start = time.perf_counter()
+    is_valid = False
+    path_collector, basic_paths = collect_basic_paths(function, path_order, max_paths, prune)
+    basic_paths = profiled_iterator(basic_paths, PATH_COLLECTION, function.function_name)
+    smt2_prefix = os.path.splitext(os.path.basename(file_path))[0]
+    try:
+        is_valid = convert_to_z3(basic_paths, function, smt2_dir, smt2_prefix,
+                                 get_function_tactics(function_tactics, function.function_name),
+                                 exhaustive_max_variables, random_tests, replay, vc_results, executor, encoding,
+                                 portfolio, bit_width, intervals)
+    except PathExplosion as e:
+        # the paths checked so far are reported, but the function is not verified
+        print(f"Path explosion! {function.function_name} has more than {e.max_paths} basic paths, "
+              f"only the first {e.max_paths} were checked")
+    if path_collector.pruned_branches:
+        print(f"Pruned infeasible branches: {path_collector.pruned_branches}")
+    emit(FUNCTION_FINISHED, function.function_name, is_valid, time.perf_counter() - start)
+    return is_valid
 
 
 def print_paths(all_paths):
@@ -0,0 +1,57 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from IR import generate_basic_paths
+from parser import reset_functions
+from profiling import enable_memory_profiling, disable_memory_profiling
+
+# Memory used by each verification phase on a function with 2^branches basic paths,
+# a sequence of IFs inside a loop. Run from the root of the repository: python3 -m benchmarks.memory [branches]
+
+
+def branching_function(branches:int) -> str:
+    lines = ["INT FUNCTION branching(INT n) {",
+             "    DECLARE (INT i, INT total);",
+             "    @PRE n >= 0;",
+             "    @POST rv >= 0;",
+             "    i := 0;",
+             "    total := 0;",
+             "    @LOOP (i >= 0) ^ (total >= 0);",
+             "    WHILE (i < n) {"]
+    for branch in range(branches):
+        lines += [f"        IF (i > {branch}) {{",
+                  f"            total := total + {branch};",
+                  "        } ELSE {",
+                  "            total := total + 1;",
+                  "        }"]
+    lines += ["        i := i + 1;",
+              "    }",
+              "    RETURN total;",
+              "}"]
+    return "\n".join(lines) + "\n"
+
+
+def main(branches:int):
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "branching.tpl")
+        with open(file_path, "w") as f:
+            f.write(branching_function(branches))
+
+        reset_functions()
+        profiler = enable_memory_profiling(top=5)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_basic_paths(file_path, random_tests=0, prune=False)
+        duration = time.perf_counter() - start
+        disable_memory_profiling()
+
+    print(f"branches: {branches}, basic paths: {2 ** branches + 2}, time: {duration:.3f}s (profiled)")
+    profiler.print_report()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
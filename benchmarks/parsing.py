@@ -0,0 +1,52 @@
+import sys
+import time
+
+from parser import parse_program, reset_functions
+
+# Parse time of long statement lists, long parameter lists and files with many functions, for sizes doubling from
+# the given one: the time per element stays flat when the lists are built in linear time.
+# Run from the root of the repository: python3 -m benchmarks.parsing [size]
+
+
+def long_body(size:int) -> str:
+    lines = ["INT FUNCTION long(INT x) {",
+             "    DECLARE (INT y);",
+             "    @PRE TRUE;",
+             "    @POST TRUE;",
+             "    y := x;"]
+    lines += ["    y := y + 1;"] * size
+    lines += ["    RETURN y;", "}"]
+    return "\n".join(lines) + "\n"
+
+
+def long_parameter_list(size:int) -> str:
+    parameters = ", ".join(f"INT x{index}" for index in range(size))
+    return f"INT FUNCTION wide({parameters}) {{\n    @PRE TRUE;\n    @POST TRUE;\n    RETURN x0;\n}}\n"
+
+
+def many_functions(size:int) -> str:
+    return "".join(f"INT FUNCTION f{index}(INT x) {{\n    @PRE TRUE;\n    @POST TRUE;\n    RETURN x;\n}}\n"
+                   for index in range(size))
+
+
+def parse_time(source:str, repeat:int=3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        reset_functions()
+        start = time.perf_counter()
+        parse_program(source)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(size:int):
+    print(f"{'list':<12} {'elements':>9} {'time':>10} {'per element':>12}")
+    for name, generate in [("statements", long_body), ("parameters", long_parameter_list),
+                           ("functions", many_functions)]:
+        for elements in [size, 2 * size, 4 * size, 8 * size]:
+            duration = parse_time(generate(elements))
+            print(f"{name:<12} {elements:>9} {duration * 1e3:>8.1f}ms {duration / elements * 1e6:>10.1f}us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,286 @@
+import gc
+import copy
+import random
+import sys
+import time
+
+from IR import substitute, ContractVariableChecker, ProgramValidator
+from expr import *
+from statement import *
+
+# Per-node cost of the AST passes: the dispatch-table visitors against the isinstance ladders they replaced.
+# Run from the root of the repository: python3 -m benchmarks.traversal [depth]
+
+# operator -> (prefix, infix) of the z3py code of a binary expression, the suffix is always ")"
+Z3_SERIALIZATION = {
+    "=>": ("z3.Implies(", ", "),
+    "^": ("z3.And(", ", "),
+    "v": ("z3.Or(", ", "),
+}
+for _operator in ["<", "<=", ">", ">=", "=="]:
+    Z3_SERIALIZATION[_operator] = ("(", f" {_operator} ")
+for _operator, _z3_operator in BINARY_OPERATOR_Z3_MAPPING.items():
+    Z3_SERIALIZATION[_operator] = ("(", f" {_z3_operator} ")
+
+
+class Z3Serializer(Fold):
+    ''' z3py code of an expression, what the ladder below computed, the verifier builds z3 terms directly '''
+    @staticmethod
+    def serialize(expression):
+        return _z3_serializer.visit(expression)
+
+    def visit_BinaryExpression(self, expression, left, right):
+        prefix, infix = Z3_SERIALIZATION[expression.op]
+        return f"{prefix}{left}{infix}{right})"
+
+    def visit_NotExpression(self, expression, operand):
+        return f"z3.Not({operand})"
+
+    def visit_UnaryExpression(self, expression, operand):
+        return f"({expression.op} {operand})"
+
+    def visit_BooleanLiteralExpression(self, expression):
+        if expression.value == "TRUE":
+            return f"True"
+        elif expression.value == "FALSE":
+            return "False"
+
+    def generic_visit(self, expression):
+        return str(expression)
+
+
+_z3_serializer = Z3Serializer()
+
+
+def ladder_serialize(expression):
+    serialize = ladder_serialize
+    if isinstance(expression, BinaryExpression):
+        if expression.op == "=>":
+            return f"z3.Implies({serialize(expression.left)}, {serialize(expression.right)})"
+        if expression.op == '^':
+            return f"z3.And({serialize(expression.left)}, {serialize(expression.right)})"
+        if expression.op == 'v':
+            return f"z3.Or({serialize(expression.left)}, {serialize(expression.right)})"
+        if expression.op in BINARY_OPERATOR_Z3_MAPPING:
+            return f"({serialize(expression.left)} {BINARY_OPERATOR_Z3_MAPPING[expression.op]} {serialize(expression.right)})"
+        else:
+            return f"({serialize(expression.left)} {expression.op} {serialize(expression.right)})"
+    elif isinstance(expression, NotExpression):
+        return f"z3.Not({serialize(expression.expression)})"
+    elif isinstance(expression, BooleanLiteralExpression):
+        if expression.value == "TRUE":
+            return f"True"
+        elif expression.value == "FALSE":
+            return "False"
+    return str(expression)
+
+
+def ladder_substitute(expression, mapping):
+    if isinstance(expression, LiteralExpression):
+        return expression
+    elif isinstance(expression, VariableExpression):
+        if expression.name in mapping:
+            return mapping[expression.name]
+        else:
+            return expression
+    elif isinstance(expression, ReturnValueVariableExpression):
+        if expression.name in mapping:
+            return mapping[expression.name]
+        else:
+            return expression
+    elif isinstance(expression, BinaryExpression):
+        expression.left = ladder_substitute(expression.left, mapping)
+        expression.right = ladder_substitute(expression.right, mapping)
+        return expression
+    elif isinstance(expression, UnaryExpression):
+        expression.expression = ladder_substitute(expression.expression, mapping)
+        return expression
+
+
+def ladder_contract_check(expression, parameter_list, condition):
+    if expression is None:
+        return True
+    elif isinstance(expression, IntLiteralExpression) or isinstance(expression, BooleanLiteralExpression):
+        return True
+    elif isinstance(expression, ReturnValueVariableExpression):
+        if condition == "precondition":
+            return False
+        elif condition == "postcondition":
+            return True
+    elif isinstance(expression, VariableExpression):
+        return expression.name in parameter_list
+    elif isinstance(expression, BinaryExpression):
+        return ladder_contract_check(expression.left, parameter_list, condition) and \
+            ladder_contract_check(expression.right, parameter_list, condition)
+    elif isinstance(expression, UnaryExpression):
+        return ladder_contract_check(expression.expression, parameter_list, condition)
+
+
+def ladder_returns(statements):
+    for statement in statements:
+        if isinstance(statement, ReturnStatement):
+            return True
+        elif isinstance(statement, IfThenElseStatement):
+            if ladder_returns(statement.then_body) and ladder_returns(statement.else_body):
+                return True
+    return False
+
+
+def ladder_return_types(function, statements):
+    for statement in statements:
+        if isinstance(statement, ReturnStatement):
+            function.assert_valid_return_statement(statement)
+        elif isinstance(statement, IfThenElseStatement):
+            ladder_return_types(function, statement.then_body)
+            ladder_return_types(function, statement.else_body)
+        elif isinstance(statement, WhileLoopStatement):
+            ladder_return_types(function, statement.body)
+
+
+def ladder_attach_loop_annotation(statements):
+    i = 0
+    while i < len(statements):
+        statement = statements[i]
+        if isinstance(statement, WhileLoopStatement):
+            statements[i].invariant = statements[i-1]
+            statements.pop(i - 1)
+            i = i - 1
+        if isinstance(statement, FunctionDeclarationStatement):
+            ladder_attach_loop_annotation(statement.body)
+        if isinstance(statement, IfThenElseStatement):
+            ladder_attach_loop_annotation(statement.then_body)
+            ladder_attach_loop_annotation(statement.else_body)
+        i += 1
+
+
+def ladder_validate(function):
+    ''' the separate passes the validation used to make over a function '''
+    ladder_attach_loop_annotation([function])
+    ladder_return_types(function, function.body)
+    ladder_returns(function.body)
+
+
+PARAMETERS = ["a", "b", "c", "d"]
+
+
+def random_int_expression(depth):
+    if depth == 0:
+        if random.random() < 0.6:
+            return VariableExpression(random.choice(PARAMETERS), DataType.INT)
+        return IntLiteralExpression(random.randint(0, 9))
+    if random.random() < 0.1:
+        return IntUnaryExpression(random_int_expression(depth - 1), "-")
+    operator = random.choice([BinaryOperator.PLUS, BinaryOperator.MINUS, BinaryOperator.TIMES])
+    return IntBinaryExpression(random_int_expression(depth - 1), random_int_expression(depth - 1), operator)
+
+
+def random_bool_expression(depth):
+    if depth == 0:
+        return ComparisonBinaryExpression(random_int_expression(2), random_int_expression(2),
+                                          random.choice(["<", "<=", ">", ">=", "=="]))
+    if random.random() < 0.2:
+        return NotExpression(random_bool_expression(depth - 1))
+    if random.random() < 0.1:
+        return ImpliesExpression(random_bool_expression(depth - 1), random_bool_expression(depth - 1), "=>")
+    return BooleanBinaryExpression(random_bool_expression(depth - 1), random_bool_expression(depth - 1),
+                                   random.choice(["^", "v"]))
+
+
+def random_body(depth):
+    ''' nested if-else statements with assignments and annotated loops, every branch returns '''
+    if depth == 0:
+        return [IntAssignmentStatement("a", random_int_expression(2)), ReturnStatement(random_int_expression(2))]
+    return [IntAssignmentStatement("b", random_int_expression(2)),
+            LoopAnnotationStatement(random_bool_expression(0)),
+            WhileLoopStatement(random_bool_expression(0), [IntAssignmentStatement("c", random_int_expression(1))]),
+            IfThenElseStatement(random_bool_expression(1), random_body(depth - 1), random_body(depth - 1))]
+
+
+def flat_body(length):
+    ''' a single block of annotated loops '''
+    body = []
+    for _ in range(length):
+        body.append(LoopAnnotationStatement(random_bool_expression(0)))
+        body.append(WhileLoopStatement(random_bool_expression(0), [IntAssignmentStatement("c", random_int_expression(1))]))
+    return body + [ReturnStatement(random_int_expression(2))]
+
+
+def random_function(body):
+    parameters = [IntDeclarationStatement(parameter) for parameter in PARAMETERS]
+    header = [PreAnnotationStatement(BooleanLiteralExpression("TRUE")),
+              PostAnnotationStatement(BooleanLiteralExpression("TRUE"))]
+    return IntFunctionDeclarationStatement("f", parameters, header + body)
+
+
+def count_nodes(node):
+    if isinstance(node, BinaryExpression):
+        return 1 + count_nodes(node.left) + count_nodes(node.right)
+    if isinstance(node, UnaryExpression):
+        return 1 + count_nodes(node.expression)
+    if isinstance(node, IfThenElseStatement):
+        return 1 + sum(map(count_nodes, node.then_body)) + sum(map(count_nodes, node.else_body))
+    if isinstance(node, WhileLoopStatement):
+        return 1 + sum(map(count_nodes, node.body))
+    return 1
+
+
+def best_time(function, repeat=15, setup=None):
+    best = float("inf")
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        # a collection of the garbage of the previous runs would be timed with a random run
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function(argument)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def report(name, nodes, ladder_time, visitor_time):
+    print(f"{name:<22} {ladder_time / nodes * 1e9:>10.1f} {visitor_time / nodes * 1e9:>10.1f} "
+          f"{ladder_time / visitor_time:>8.2f}x")
+
+
+def main(depth):
+    random.seed(0)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+    expression = random_bool_expression(depth)
+    function = random_function(random_body(depth))
+    flat_function = random_function(flat_body(2 ** depth))
+    nodes = count_nodes(expression)
+    statements = sum(map(count_nodes, function.body))
+    # the first mapping only walks the expression, the second one also rewrites the nodes above every a.
+    # The ladder rewrote the expression in place, so its callers had to deep copy the VC first.
+    absent_mapping = {"x": IntLiteralExpression(1)}
+    mapping = {"a": IntLiteralExpression(1)}
+
+    print(f"expression nodes: {nodes}, statements: {statements}")
+    print(f"{'pass':<22} {'ladder':>10} {'visitor':>10} {'speedup':>9}   (ns per node)")
+    report("serialize", nodes,
+           best_time(lambda _: ladder_serialize(expression)),
+           best_time(lambda _: Z3Serializer.serialize(expression)))
+    report("substitute (walk)", nodes,
+           best_time(lambda _: ladder_substitute(expression, absent_mapping)),
+           best_time(lambda _: substitute(expression, absent_mapping)))
+    report("substitute (rewrite)", nodes,
+           best_time(lambda _: ladder_substitute(copy.deepcopy(expression), mapping)),
+           best_time(lambda _: substitute(expression, mapping)))
+    report("contract variables", nodes,
+           best_time(lambda _: ladder_contract_check(expression, PARAMETERS, "postcondition")),
+           best_time(lambda _: ContractVariableChecker(PARAMETERS, "postcondition").visit(expression)))
+    report("validation", statements,
+           best_time(lambda function: ladder_validate(function), setup=lambda: copy.deepcopy(function)),
+           best_time(lambda function: ProgramValidator().validate([function]), setup=lambda: copy.deepcopy(function)))
+    flat_statements = len(flat_function.body)
+    report("validation (flat)", flat_statements,
+           best_time(lambda function: ladder_validate(function), repeat=3, setup=lambda: copy.deepcopy(flat_function)),
+           best_time(lambda function: ProgramValidator().validate([function]), repeat=3,
+                     setup=lambda: copy.deepcopy(flat_function)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,260 @@
+import time
+from typing import Union, List
+
+import z3
+
+from expr import *
+from statement import *
+from solvers import Z3Translator, timed_check
+from vectorized import format_counter_example
+from events import emit, FUNCTION_STARTED, FUNCTION_FINISHED
+
+# Bounded model checking: the body of a function is unrolled, every loop running at most `depth` iterations, and
+# encoded as one formula, satisfiable when an execution starting in @PRE returns a value violating @POST. The loop
+# invariants are ignored, so a bug is found even when the invariant is wrong, but a function without counterexample
+# up to some depth is only proved if no execution runs more iterations than that. With a bit width, an operation
+# overflowing in an execution reaching it is also a counterexample, as in the overflow VCs.
+
+# key of the solving times of the bounded model checks
+BMC = "BMC"
+
+DEFAULT_BMC_MAX_DEPTH = 10
+
+# the versions of the variables are named as in the SSA encoding of IR.py, so that they are dropped from the
+# counterexamples by input_assignment, the guards can not clash with a variable
+VERSION_SEPARATOR = "!"
+GUARD = "!guard"
+
+
+class StateTranslator(Z3Translator):
+    ''' Z3Translator where a variable stands for its value in state, the constant of its initial value if it
+    is not in state '''
+
+    def __init__(self, context:Union[None, z3.Context]=None, bit_width:Union[None, int]=None):
+        super().__init__(context, bit_width)
+        self.state = {}
+
+    def visit_VariableExpression(self, expression):
+        term = self.state.get(expression.name)
+        if term is None:
+            return super().visit_VariableExpression(expression)
+        return term
+
+
+class Merge:
+    ''' an IF whose then branch is being executed, or has been, see BoundedEncoder.branch '''
+
+    def __init__(self, guard:z3.BoolRef, state:dict, condition:z3.BoolRef):
+        self.guard = guard
+        self.state = state
+        self.condition = condition
+        # at the end of the then branch
+        self.then_guard = None
+        self.then_state = None
+
+
+class BoundedEncoder(Visitor):
+    ''' formula of the executions of a function running at most depth iterations of each loop, see encode
+
+    The statements are executed symbolically on a stack of tasks (handler, arguments...) rather than by recursion:
+    the state maps each variable to the constant of its current version, defined by an equality in definitions,
+    and the guard is the condition for the execution to reach the current statement. Both branches of an IF are
+    executed and their states are merged with if-then-else, so the formula is linear in the size of the unrolled
+    function instead of the number of its paths. '''
+
+    def __init__(self, depth:int, context:Union[None, z3.Context]=None, bit_width:Union[None, int]=None):
+        self.depth = depth
+        self.context = context
+        self.translator = StateTranslator(context, bit_width)
+        self.versions = {}
+        self.definitions = []
+        # (condition, description) for each RETURN, the condition holds if it is reached and violates @POST, and
+        # with a bit width for each statement with operations, it holds if it is reached and one of them overflows
+        self.violations = []
+        # conditions for a loop to run more than depth iterations
+        self.unwindings = []
+        self.guard = z3.BoolVal(True, context)
+        self.tasks = []
+        self.post_condition = None
+
+    @property
+    def state(self) -> dict:
+        return self.translator.state
+
+    @state.setter
+    def state(self, state:dict):
+        self.translator.state = state
+
+    def translate(self, expression, description:str) -> z3.ExprRef:
+        ''' term of the expression in the current state, the overflow of its operations is a violation '''
+        translator = self.translator
+        term = translator.translate(expression)
+        if translator.overflow_conditions:
+            self.violations.append((z3.And(self.guard, z3.Not(translator.no_overflow())), description))
+            translator.forget_overflow()
+        return term
+
+    def fresh(self, name:str, term:z3.ExprRef) -> z3.ExprRef:
+        ''' constant of a new version of the variable, equal to the term '''
+        version = self.versions.get(name, 0) + 1
+        self.versions[name] = version
+        constant = z3.Const(f"{name}{VERSION_SEPARATOR}{version}", term.sort())
+        self.definitions.append(constant == term)
+        return constant
+
+    def restrict(self, condition:z3.BoolRef) -> z3.BoolRef:
+        ''' guard of the executions reaching the current statement and satisfying the condition '''
+        if z3.is_true(self.guard):
+            return condition
+        return self.fresh(GUARD, z3.And(self.guard, condition))
+
+    def encode(self, function:FunctionDeclarationStatement) -> z3.BoolRef:
+        ''' the precondition, over the initial values of the variables, the violations and unwindings
+        are collected while the body is executed '''
+        pre_condition = self.translate(function.precondition.expression, "overflow in @PRE")
+        self.post_condition = function.postcondition.expression
+        self.push_block(function.get_body_after_annotations())
+        while self.tasks:
+            handler, *arguments = self.tasks.pop()
+            handler(*arguments)
+        return pre_condition
+
+    def push_block(self, statements:List[Statement]):
+        self.tasks.extend((self.execute, statement) for statement in reversed(statements))
+
+    def execute(self, statement:Statement):
+        # the statements following a RETURN in every branch are never reached
+        if not z3.is_false(self.guard):
+            self._dispatch_table[statement.__class__](self, statement)
+
+    def branch(self, condition:z3.BoolRef, then_tasks:list, else_statements:List[Statement]):
+        ''' run the then tasks under the condition, then the else statements under its negation, and merge '''
+        merge = Merge(self.guard, dict(self.state), condition)
+        self.tasks.append((self.merge, merge))
+        self.tasks.append((self.start_else, merge, else_statements))
+        self.tasks.extend(reversed(then_tasks))
+        self.guard = self.restrict(condition)
+
+    def start_else(self, merge:Merge, else_statements:List[Statement]):
+        merge.then_guard, merge.then_state = self.guard, self.state
+        self.guard, self.state = merge.guard, dict(merge.state)
+        self.guard = self.restrict(z3.Not(merge.condition))
+        self.push_block(else_statements)
+
+    def merge(self, merge:Merge):
+        then_guard, then_state = merge.then_guard, merge.then_state
+        if z3.is_false(then_guard):
+            return
+        if z3.is_false(self.guard):
+            self.guard, self.state = then_guard, then_state
+            return
+        else_state = self.state
+        state = {}
+        for name in then_state.keys() | else_state.keys():
+            then_term, else_term = then_state.get(name), else_state.get(name)
+            if then_term is None:
+                then_term = z3.Const(name, else_term.sort())
+            elif else_term is None:
+                else_term = z3.Const(name, then_term.sort())
+            state[name] = then_term if then_term.eq(else_term) else \
+                self.fresh(name, z3.If(then_guard, then_term, else_term))
+        self.guard = self.fresh(GUARD, z3.Or(then_guard, self.guard))
+        self.state = state
+
+    def unroll(self, statement:WhileLoopStatement, iterations:int):
+        ''' the loop, running at most iterations more iterations '''
+        if z3.is_false(self.guard):
+            return
+        condition = self.translate(statement.condition, overflow_in(statement))
+        if iterations == 0:
+            # the executions running more iterations are left out, and recorded to tell if a deeper unrolling
+            # can find more counterexamples
+            self.unwindings.append(z3.And(self.guard, condition))
+            self.guard = self.restrict(z3.Not(condition))
+            return
+        self.branch(condition, [(self.execute, body_statement) for body_statement in statement.body] +
+                    [(self.unroll, statement, iterations - 1)], [])
+
+    def visit_AssignmentStatement(self, statement):
+        self.state[statement.variable] = self.fresh(statement.variable,
+                                                    self.translate(statement.expression, overflow_in(statement)))
+
+    def visit_IfThenElseStatement(self, statement):
+        self.branch(self.translate(statement.condition, overflow_in(statement)),
+                    [(self.execute, then_statement) for then_statement in statement.then_body],
+                    statement.else_body)
+
+    def visit_WhileLoopStatement(self, statement):
+        self.unroll(statement, self.depth)
+
+    def visit_ReturnStatement(self, statement):
+        state = self.state
+        self.state = dict(state, rv=self.translate(statement.expression, overflow_in(statement)))
+        post_condition = self.translate(self.post_condition,
+                                        f"overflow in @POST at the RETURN of line {statement.lineno}")
+        self.violations.append((z3.And(self.guard, z3.Not(post_condition)),
+                                f"@POST violated by the RETURN of line {statement.lineno}"))
+        self.state = state
+        self.guard = z3.BoolVal(False, self.context)
+
+    def visit_DeclarationStatement(self, statement):
+        pass
+
+
+def overflow_in(statement:Statement) -> str:
+    return f"overflow in the statement of line {statement.lineno}"
+
+
+def bounded_model_check(function:FunctionDeclarationStatement, max_depth:int=DEFAULT_BMC_MAX_DEPTH,
+                        bit_width:Union[None, int]=None) -> bool:
+    ''' look for inputs satisfying @PRE for which the function returns a value violating @POST, with iterative
+    deepening: its loops are unrolled 0, 1, ... max_depth times until a counterexample is found, or no execution
+    runs more iterations (the function is then proved). Returns false unless the function was proved: if a
+    counterexample was found, the solver gave up or executions running more than max_depth iterations remain.
+    With a bit width, INT is a signed bit-vector of that width, as in the VCs, and an operation overflowing in an
+    execution meeting @PRE is a counterexample too. '''
+    # IR imports this module
+    from IR import model_assignment, input_assignment
+    emit(FUNCTION_STARTED, function.function_name)
+    start = time.perf_counter()
+    print("Bounded model checking of function: " + function.function_name)
+    is_valid = True
+    for depth in range(max_depth + 1):
+        encoder = BoundedEncoder(depth, None, bit_width)
+        pre_condition = encoder.encode(function)
+        solver = z3.Solver()
+        solver.add(pre_condition, *encoder.definitions)
+
+        status = z3.unsat
+        if encoder.violations:
+            solver.push()
+            solver.add(z3.Or([violation for violation, _ in encoder.violations]))
+            status = timed_check(solver, BMC)
+        if status == z3.sat:
+            model = solver.model()
+            description = next(description for violation, description in encoder.violations
+                               if z3.is_true(model.eval(violation, model_completion=True)))
+            print(f"Invalid! (depth {depth}: {description})")
+            print("Counter example: ", format_counter_example(input_assignment(model_assignment(model))))
+            is_valid = False
+            break
+        if status == z3.unknown:
+            print(f"Unknown! ({BMC}: {solver.reason_unknown()}, depth {depth})")
+            is_valid = False
+            break
+        if encoder.violations:
+            solver.pop()
+
+        # a deeper unrolling can only find a counterexample if some execution runs more iterations
+        if encoder.unwindings:
+            solver.add(z3.Or(encoder.unwindings))
+        if not encoder.unwindings or timed_check(solver, BMC) == z3.unsat:
+            print(f"Valid! (every execution runs at most {depth} iterations of each loop)")
+            break
+        print(f"No counterexample at depth {depth}")
+    else:
+        # not a proof: a counterexample may need more iterations
+        print(f"Unknown! (no counterexample up to depth {max_depth}, longer executions were not checked)")
+        is_valid = False
+    emit(FUNCTION_FINISHED, function.function_name, is_valid, time.perf_counter() - start)
+    return is_valid
@@ -0,0 +1,67 @@
+import hashlib
+import os
+import pickle
+import zlib
+from typing import Union, Dict, Tuple
+
+# Cache of validated programs, keyed by the content of the .tpl file.
+# An entry holds the Program (loop annotations already attached) and the symbol table
+# of each of its functions (the `functions` entries of the parser), pickled and compressed.
+
+# modules whose code shapes the cached objects, a change in any of them invalidates the cache
+_SOURCE_MODULES = ["lexer.py", "parser.py", "expr.py", "statement.py", "visitor.py", "IR.py"]
+
+# version of the layout of the entries, to bump when the pickled objects change in a way the sources do not show
+CACHE_FORMAT_VERSION = 1
+
+_sources_digest = None
+
+
+def _get_sources_digest() -> str:
+    global _sources_digest
+    if _sources_digest is None:
+        digest = hashlib.sha256(f"format {CACHE_FORMAT_VERSION}".encode())
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for module in _SOURCE_MODULES:
+            with open(os.path.join(directory, module), "rb") as f:
+                digest.update(f.read())
+        _sources_digest = digest.hexdigest()
+    return _sources_digest
+
+
+def cache_key(source:str) -> str:
+    digest = hashlib.sha256(_get_sources_digest().encode())
+    digest.update(source.encode())
+    return digest.hexdigest()
+
+
+def cache_file_path(cache_dir:str, source:str) -> str:
+    return os.path.join(cache_dir, cache_key(source) + ".ast")
+
+
+def load_cached_program(cache_dir:str, source:str) -> Union[None, Tuple[object, Dict[str, list]]]:
+    ''' returns (program, function_tables) if the source was already validated, None otherwise '''
+    file_path = cache_file_path(cache_dir, source)
+    try:
+        with open(file_path, "rb") as f:
+            return pickle.loads(zlib.decompress(f.read()))
+    except FileNotFoundError:
+        return None
+    except (zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # corrupted or outdated entry, it is simply rebuilt
+        return None
+
+
+def store_cached_program(cache_dir:str, source:str, program, function_tables:Dict[str, list]) -> None:
+    os.makedirs(cache_dir, exist_ok=True)
+    file_path = cache_file_path(cache_dir, source)
+    try:
+        data = zlib.compress(pickle.dumps((program, function_tables), protocol=pickle.HIGHEST_PROTOCOL))
+    except RecursionError:
+        # pickle recurses into the nested blocks and expressions, a program too deep for it is parsed every time
+        return
+    # write then rename so concurrent runs never read a partial entry
+    temporary_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(data)
+    os.replace(temporary_path, file_path)
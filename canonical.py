@@ -0,0 +1,74 @@
+from typing import Union, List, Dict, Tuple
+
+from expr import *
+
+# Canonical form of the VCs, two VCs with the same canonical form are equal up to the names of their variables
+# and the order of the operands of commutative operators, so they are valid or invalid together and the
+# counterexample of one is a counterexample of the other once its variables are renamed.
+
+COMMUTATIVE_OPERATORS = {"^", "v", "==", BinaryOperator.PLUS, BinaryOperator.TIMES}
+
+# a > b is written b < a, and a >= b is written b <= a
+MIRRORED_COMPARISONS = {">": "<", ">=": "<="}
+
+
+class Canonicalizer(Fold):
+    ''' (shape, tokens) of an expression, the shape is its text with every variable replaced by its type and the
+    operands of the commutative operators sorted by their shape, the tokens are the same text where each
+    variable is left as a (name, type) tuple, so it can be renamed by order of first occurrence '''
+
+    def visit_BinaryExpression(self, expression, left, right):
+        op = expression.op
+        if op in MIRRORED_COMPARISONS:
+            op = MIRRORED_COMPARISONS[op]
+            left, right = right, left
+        if op in COMMUTATIVE_OPERATORS and right[0] < left[0]:
+            left, right = right, left
+        text = f" {BINARY_OPERATOR_TEXT_MAPPING.get(op, op)} "
+        return f"({left[0]}{text}{right[0]})", ["("] + left[1] + [text] + right[1] + [")"]
+
+    def visit_NotExpression(self, expression, operand):
+        return f"(!{operand[0]})", ["(!"] + operand[1] + [")"]
+
+    def visit_IntUnaryExpression(self, expression, operand):
+        return f"(-{operand[0]})", ["(-"] + operand[1] + [")"]
+
+    def visit_VariableExpression(self, expression):
+        return f"?{expression.type.name}", [(expression.name, expression.type)]
+
+    def visit_ReturnValueVariableExpression(self, expression):
+        return f"?{expression.type.name}", [(expression.name, expression.type)]
+
+    def visit_LiteralExpression(self, expression):
+        return str(expression.value), [str(expression.value)]
+
+
+_canonicalizer = Canonicalizer()
+
+
+def canonicalize(expression) -> Tuple[str, Dict[str, str]]:
+    ''' canonical text of the expression, and the canonical name of each of its variables '''
+    shape, tokens = _canonicalizer.visit(expression)
+    renaming = {}
+    text = []
+    for token in tokens:
+        if isinstance(token, tuple):
+            name, variable_type = token
+            if name not in renaming:
+                renaming[name] = f"{variable_type.name.lower()}{len(renaming)}"
+            text.append(renaming[name])
+        else:
+            text.append(token)
+    return "".join(text), renaming
+
+
+def rename_assignment(assignment:Union[None, Dict[str, object]], renaming:Dict[str, str]) \
+        -> Union[None, Dict[str, object]]:
+    ''' the values of an assignment under the new names of its variables, unknown variables are dropped '''
+    if assignment is None:
+        return None
+    return {renaming[name]: value for name, value in assignment.items() if name in renaming}
+
+
+def inverse_renaming(renaming:Dict[str, str]) -> Dict[str, str]:
+    return {canonical_name: name for name, canonical_name in renaming.items()}
@@ -0,0 +1,60 @@
+from typing import List
+
+# Events of the verification, for monitoring tools. A listener subclasses EventListener and overrides the methods
+# of the events it needs, the listeners added with add_event_listener are called in the thread running the
+# verification, in the order of the events: the VCs checked by the threads of --jobs are reported solved in path
+# order, when their result is printed.
+
+FUNCTION_STARTED = "function_started"
+PATH_GENERATED = "path_generated"
+VC_BUILT = "vc_built"
+VC_SOLVED = "vc_solved"
+FUNCTION_FINISHED = "function_finished"
+
+# results of a solved VC
+VALID = "valid"
+INVALID = "invalid"
+UNKNOWN = "unknown"
+
+
+class EventListener:
+    ''' durations are in seconds '''
+
+    def function_started(self, function_name:str):
+        pass
+
+    def path_generated(self, function_name:str, path_index:int, basic_path:list):
+        pass
+
+    def vc_built(self, function_name:str, path_index:int, logic:str, duration:float):
+        pass
+
+    def vc_solved(self, function_name:str, path_index:int, logic:str, result:str, duration:float,
+                  overflow:bool, duplicate:bool):
+        ''' result is VALID, INVALID or UNKNOWN, overflow is true for the overflow VC of the path (see --bit-width)
+        and duplicate for a VC answered by an equal VC checked earlier, its duration is then 0 '''
+        pass
+
+    def function_finished(self, function_name:str, verified:bool, duration:float):
+        pass
+
+
+_listeners = []
+
+
+def add_event_listener(listener:EventListener):
+    _listeners.append(listener)
+
+
+def remove_event_listener(listener:EventListener):
+    _listeners.remove(listener)
+
+
+def get_event_listeners() -> List[EventListener]:
+    return list(_listeners)
+
+
+def emit(event:str, *arguments):
+    ''' call the method of the event on every listener '''
+    for listener in _listeners:
+        getattr(listener, event)(*arguments)
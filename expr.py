@@ -1,175 +1,228 @@
 from enum import Enum
+from visitor import Visitor, register_node_class
 
 
 
 class InvalidExpressionType(Exception):
-    def __init__(self, message="Invalid Expression Type"):
+    def __init__(self, message="Invalid Expression Type", expression=None):
         super().__init__(message)
+        # the offending subexpression, if known
+        self.expression = expression
 
-class Z3Serializer:
-    @staticmethod
-    def serialize(expression):
-        serialize = Z3Serializer.serialize
-        if isinstance(expression, BinaryExpression):
-            if expression.op == "=>":
-                return f"z3.Implies({serialize(expression.left)}, {serialize(expression.right)})"
-            if expression.op == '^':
-                return f"z3.And({serialize(expression.left)}, {serialize(expression.right)})"
-            if expression.op == 'v':
-                return f"z3.Or({serialize(expression.left)}, {serialize(expression.right)})"
-            if expression.op in BINARY_OPERATOR_Z3_MAPPING:
-                return f"({serialize(expression.left)} {BINARY_OPERATOR_Z3_MAPPING[expression.op]} {serialize(expression.right)})"
+# levels of an expression folded by recursion, which is faster for the shallow expressions, the nodes below are
+# folded on explicit stacks so that the recursion limit is never reached, the passes over the statements and the
+# normalized conditions do the same
+RECURSION_DEPTH = 100
+
+
+def get_recursion_depth() -> int:
+    return RECURSION_DEPTH
+
+
+def set_recursion_depth(depth:int):
+    ''' 0 runs every pass on its explicit stacks, the tests check that the result does not depend on the depth '''
+    global RECURSION_DEPTH
+    RECURSION_DEPTH = depth
+
+
+class Fold(Visitor):
+    ''' Visitor computing a value for every node of an expression from the values of its operands, bottom up.
+
+    The nodes are folded by recursion down to RECURSION_DEPTH levels, and the deeper subexpressions in two loops
+    over explicit stacks instead of the Python stack, so that the depth of an expression is not bounded by the
+    recursion limit: the VCs of long paths are nested as deep as the paths are long.
+    A node of class C is handled by visit_C(self, node, *values), values are those of node.children(), in order. '''
+
+    def visit(self, node):
+        return self.fold(node, RECURSION_DEPTH)
+
+    def fold(self, node, depth:int):
+        ''' value of the node, folded by recursion down to depth levels below it, the leaves are dispatched
+        without a call to fold since they are about half of the nodes '''
+        dispatch = self._dispatch_table
+        arity = node.arity
+        if arity == 0:
+            return dispatch[node.__class__](self, node)
+        if depth == 0:
+            return self.fold_on_stack(node)
+        if arity == 2:
+            left, right = node.left, node.right
+            left = dispatch[left.__class__](self, left) if left.arity == 0 else self.fold(left, depth - 1)
+            right = dispatch[right.__class__](self, right) if right.arity == 0 else self.fold(right, depth - 1)
+            return dispatch[node.__class__](self, node, left, right)
+        operand = node.expression
+        operand = dispatch[operand.__class__](self, operand) if operand.arity == 0 else self.fold(operand, depth - 1)
+        return dispatch[node.__class__](self, node, operand)
+
+    def fold_on_stack(self, node):
+        dispatch = self._dispatch_table
+        # the nodes in post-order, reversed: each node is followed by its operands, the last one first
+        nodes = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            arity = node.arity
+            if arity == 2:
+                stack.append(node.left)
+                stack.append(node.right)
+            elif arity == 1:
+                stack.append(node.expression)
+        values = []
+        for node in reversed(nodes):
+            arity = node.arity
+            if arity == 0:
+                values.append(dispatch[node.__class__](self, node))
+            elif arity == 2:
+                right = values.pop()
+                values[-1] = dispatch[node.__class__](self, node, values[-1], right)
             else:
-                return f"({serialize(expression.left)} {expression.op} {serialize(expression.right)})"
-        elif isinstance(expression, NotExpression):
-            return f"z3.Not({serialize(expression.expression)})"
-        elif isinstance(expression, BooleanLiteralExpression):
-            if expression.value == "TRUE":
-                return f"True"
-            elif expression.value == "FALSE":
-                return "False"
-        return str(expression)
+                values[-1] = dispatch[node.__class__](self, node, values[-1])
+        return values[0]
+
+
+class ExpressionPrinter(Fold):
+    ''' text of an expression, as printed in the VCs '''
+
+    def visit_BinaryExpression(self, expression, left, right):
+        return f"({left} {BINARY_OPERATOR_TEXT_MAPPING.get(expression.op, expression.op)} {right})"
+
+    def visit_UnaryExpression(self, expression, operand):
+        return f"({expression.op} {operand})"
+
+    def visit_NotExpression(self, expression, operand):
+        return f"(!{operand})"
+
+    def visit_UnaryMinusExpression(self, expression, operand):
+        return f"(!{operand})"
+
+    def visit_VariableExpression(self, expression):
+        return expression.name
+
+    def visit_ReturnValueVariableExpression(self, expression):
+        return expression.name
+
+    def visit_LiteralExpression(self, expression):
+        return str(expression.value)
+
+_expression_printer = ExpressionPrinter()
 
 
 def check_expression_type(expression, expected_type):
-    if (isinstance(expression, IntUnaryExpression) \
-    or isinstance(expression, IntBinaryExpression) \
-    or isinstance(expression, IntLiteralExpression) \
-    or (isinstance(expression, VariableExpression) and expression.type == DataType.INT) \
-    or (isinstance(expression, ReturnValueVariableExpression))) \
-    and (expected_type == DataType.INT):
-        return True
-    elif (isinstance(expression, BooleanUnaryExpression) \
-    or isinstance(expression, BooleanBinaryExpression) \
-    or isinstance(expression, BooleanLiteralExpression) \
-    or (isinstance(expression, VariableExpression) and expression.type == DataType.BOOL) \
-    or (isinstance(expression, ReturnValueVariableExpression))) \
-    and expected_type == DataType.BOOL:
-        return True
-    else:
-        return False
+    ''' the type of every expression is inferred once, when the node is built '''
+    return expression.type == expected_type
 
 def assert_expression_type(expression, expected_type):
-    if (isinstance(expression, IntUnaryExpression) \
-    or isinstance(expression, IntBinaryExpression) \
-    or isinstance(expression, IntLiteralExpression) \
-    or (isinstance(expression, VariableExpression) and expression.type == DataType.INT) \
-    or (isinstance(expression, ReturnValueVariableExpression))) \
-    and (expected_type == DataType.INT):
+    if expression.type == expected_type:
         return True
-    elif (isinstance(expression, BooleanUnaryExpression) \
-    or isinstance(expression, BooleanBinaryExpression) \
-    or isinstance(expression, BooleanLiteralExpression) \
-    or (isinstance(expression, VariableExpression) and expression.type == DataType.BOOL) \
-    or (isinstance(expression, ReturnValueVariableExpression))) \
-    and expected_type == DataType.BOOL:
-        return True
-    else:
-        raise InvalidExpressionType()
+    raise InvalidExpressionType(f"Invalid Expression Type: expected {expected_type.name} expression, got "
+                                f"{expression.type.name if expression.type else 'untyped'} expression {expression}",
+                                expression)
 
 class Expression:
+    # number of operands, the attributes holding them are left and right, or expression
+    arity = 0
+
     def __init__(self):
         pass
 
+    def children(self):
+        return ()
+
+    def __repr__(self):
+        return _expression_printer.visit(self)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        register_node_class(cls)
+
                                     ###### BINARY EXPRESSIONS ######
 
-class BinaryExpression:
-    def __init__(self, left, right, op):
+class BinaryExpression(Expression):
+    arity = 2
+
+    def __init__(self, left, right, op, type=None):
         self.left = left
         self.right = right
         self.op = op
+        self.type = type
 
-    def __repr__(self):
-        if self.op in BINARY_OPERATOR_TEXT_MAPPING:
-            return f"({self.left} {BINARY_OPERATOR_TEXT_MAPPING[self.op]} {self.right})"
-        return f"({self.left} {self.op} {self.right})"
+    def children(self):
+        return (self.left, self.right)
 
 class IntBinaryExpression(BinaryExpression):
     def __init__(self, left, right, op):
         assert_expression_type(left, DataType.INT)
         assert_expression_type(right, DataType.INT)
-        super().__init__(left, right, op)
+        super().__init__(left, right, op, DataType.INT)
 
 class BooleanBinaryExpression(BinaryExpression):
     def __init__(self, left, right, op):
-        super().__init__(left, right, op)
+        assert_expression_type(left, DataType.BOOL)
+        assert_expression_type(right, DataType.BOOL)
+        super().__init__(left, right, op, DataType.BOOL)
 
 class ComparisonBinaryExpression(BooleanBinaryExpression):
     def __init__(self, left, right, op):
-        if (check_expression_type(left, DataType.INT) and
-            check_expression_type(right, DataType.INT)) or \
-                (check_expression_type(left, DataType.BOOL) and
-                 check_expression_type(right, DataType.BOOL)):
-            super().__init__(left, right, op)
-        else:
-            raise InvalidExpressionType()
+        # == compares two expressions of the same type, the other comparators only integers
+        expected_type = left.type if op == "==" and left.type is not None else DataType.INT
+        assert_expression_type(left, expected_type)
+        assert_expression_type(right, expected_type)
+        BinaryExpression.__init__(self, left, right, op, DataType.BOOL)
 
 class ImpliesExpression(BooleanBinaryExpression):
     def __init__(self, left, right, op):
-        assert_expression_type(left, DataType.BOOL)
-        assert_expression_type(right, DataType.BOOL)
         super().__init__(left, right, op)
 
                                     ###### UNARY EXPRESSIONS ######
-class UnaryExpression:
-    def __init__(self, expression, op):
+class UnaryExpression(Expression):
+    arity = 1
+
+    def __init__(self, expression, op, type=None):
         self.expression = expression
         self.op = op
-    
-    def __repr__(self):
-        return f"({self.op} {self.expression})"
+        self.type = type
+
+    def children(self):
+        return (self.expression,)
 
 class IntUnaryExpression(UnaryExpression):
     def __init__(self, expression, op):
         assert_expression_type(expression, DataType.INT)
-        super().__init__(expression, op)
+        super().__init__(expression, op, DataType.INT)
 
 class BooleanUnaryExpression(UnaryExpression):
     def __init__(self, expression, op):
         assert_expression_type(expression, DataType.BOOL)
-        super().__init__(expression, op)
+        super().__init__(expression, op, DataType.BOOL)
 
 class NotExpression(BooleanUnaryExpression):
     def __init__(self, expression,op="NOT"):
         super().__init__(expression, op)
 
-    def __repr__(self):
-        return f"(!{self.expression})"
-
 class UnaryMinusExpression(IntUnaryExpression):
     def __init__(self, expression,op):
         super().__init__(expression, op)
 
-    def __repr__(self):
-        return f"(!{self.expression})"
-
                                 ###### PARAMETERS & VARIABLES ######
 
-class VariableExpression:
+class VariableExpression(Expression):
     def __init__(self, name, type):
         self.name = name
         self.type = type
 
-    def __repr__(self):
-        return self.name
-
-class ReturnValueVariableExpression:
-    def __init__(self):
+class ReturnValueVariableExpression(Expression):
+    def __init__(self, type=None):
+        # the type of rv is the return type of the function it belongs to
         self.name = "rv"
-        self.type = None
-
-    def __repr__(self):
-        return self.name
+        self.type = type
 
                 ###### LITERAL EXPRESSION ######
-class LiteralExpression:
+class LiteralExpression(Expression):
     def __init__(self, value, type):
         self.value = value
         self.type = type
 
-    def __repr__(self):
-        return str(self.value)
-
 class BooleanLiteralExpression(LiteralExpression):
     def __init__(self, value):
         super().__init__(value, DataType.BOOL)
@@ -227,4 +280,4 @@ BINARY_OPERATOR_TEXT_MAPPING= {
     BinaryOperator.AND: "^",
     BinaryOperator.OR: "v",
     BinaryOperator.IMPLIES: "=>",
-}
\ No newline at end of file
+}
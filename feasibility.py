@@ -0,0 +1,269 @@
+from typing import Union, List, Dict
+
+from expr import *
+from statement import *
+from visitor import Visitor
+from vectorized import free_variables
+
+# Cheap detection of basic paths whose assumptions contradict each other, so the collector can drop them
+# (and every path extending them) before a VC is built. The check is syntactic: a condition is infeasible
+# if it is the negation of a fact known on the path, or if it bounds a variable outside the interval the
+# facts give to it. Facts are the conjuncts of the annotation starting the path and of its assumptions that
+# do not mention a variable assigned since. Missing a contradiction only costs a VC, the check is never wrong.
+
+# nodes of the normalized form of a condition, a constant is an empty conjunction (TRUE) or disjunction (FALSE)
+AND = "and"
+OR = "or"
+LITERAL = "literal"
+
+# canonical comparison operator -> (swap the operands, operator of the atom, polarity of the comparison)
+# every comparison becomes either l < r or l == r, with a polarity
+COMPARISON_ATOMS = {
+    "<": (False, "<", True),
+    ">=": (False, "<", False),
+    ">": (True, "<", True),
+    "<=": (True, "<", False),
+    "==": (False, "==", True),
+}
+
+
+class Operands:
+    ''' the operands of a connective, and their polarity, left to Normalizer.normalize, kind is AND or OR, or
+    None for a negation, whose single operand is its normal form '''
+    def __init__(self, kind:Union[None, str], operands:list):
+        self.kind = kind
+        self.operands = operands
+
+
+class Normalizer(Visitor):
+    ''' negation normal form of a condition as (AND, children), (OR, children) or
+    (LITERAL, atom, polarity, bound, variables), bound is (variable, low, high) for the comparisons
+    of a variable with an integer literal and None otherwise. The children of a conjunction are never
+    conjunctions, and those of a disjunction never disjunctions. '''
+
+    def normalize(self, expression, polarity:bool, depth:Union[None, int]=None):
+        ''' the connectives are normalized by recursion down to depth levels (RECURSION_DEPTH by default), and the
+        deeper ones on an explicit stack, the conditions can be nested arbitrarily deep '''
+        if depth is None:
+            depth = get_recursion_depth()
+        formula = self._dispatch_table[expression.__class__](self, expression, polarity)
+        if formula.__class__ is not Operands:
+            return formula
+        if depth == 0:
+            return self.normalize_on_stack(expression, polarity)
+        return combine(formula, [self.normalize(operand, operand_polarity, depth - 1)
+                                 for operand, operand_polarity in formula.operands])
+
+    def normalize_on_stack(self, expression, polarity:bool):
+        dispatch = self._dispatch_table
+        formulas = []
+        stack = [(expression, polarity)]
+        while stack:
+            item = stack.pop()
+            if item.__class__ is Operands:
+                # every operand of the connective is normalized
+                count = len(item.operands)
+                children = formulas[-count:]
+                del formulas[-count:]
+                formulas.append(combine(item, children))
+                continue
+            expression, polarity = item
+            formula = dispatch[expression.__class__](self, expression, polarity)
+            if formula.__class__ is Operands:
+                stack.append(formula)
+                stack.extend(reversed(formula.operands))
+            else:
+                formulas.append(formula)
+        return formulas[0]
+
+    def visit_BooleanBinaryExpression(self, expression, polarity:bool):
+        left, right = expression.left, expression.right
+        if expression.op == "=>":
+            # l => r is NOT(l) v r
+            return Operands(OR if polarity else AND, [(left, not polarity), (right, polarity)])
+        if (expression.op == "^") == polarity:
+            return Operands(AND, [(left, polarity), (right, polarity)])
+        return Operands(OR, [(left, polarity), (right, polarity)])
+
+    def visit_ComparisonBinaryExpression(self, expression, polarity:bool):
+        swap, operator, comparison_polarity = COMPARISON_ATOMS[expression.op]
+        left, right = (expression.right, expression.left) if swap else (expression.left, expression.right)
+        left_key, right_key = repr(left), repr(right)
+        if operator == "==" and right_key < left_key:
+            left, right, left_key, right_key = right, left, right_key, left_key
+        polarity = polarity == comparison_polarity
+        return (LITERAL, (operator, left_key, right_key), polarity, comparison_bound(operator, left, right, polarity),
+                frozenset(free_variables(expression)))
+
+    def visit_NotExpression(self, expression, polarity:bool):
+        return Operands(None, [(expression.expression, not polarity)])
+
+    def visit_BooleanLiteralExpression(self, expression, polarity:bool):
+        return (AND if (expression.value == "TRUE") == polarity else OR, [])
+
+    def visit_Expression(self, expression, polarity:bool):
+        # Boolean variable
+        return (LITERAL, repr(expression), polarity, None, frozenset(free_variables(expression)))
+
+
+def combine(connective:Operands, children:list):
+    ''' normal form of a connective from those of its operands '''
+    if connective.kind is None:
+        return children[0]
+    flattened = []
+    for child in children:
+        if child[0] == connective.kind:
+            flattened.extend(child[1])
+        else:
+            flattened.append(child)
+    return (connective.kind, flattened)
+
+
+_normalizer = Normalizer()
+
+
+def normalize(expression, polarity:bool=True):
+    return _normalizer.normalize(expression, polarity)
+
+
+def comparison_bound(operator:str, left, right, polarity:bool):
+    ''' (variable, low, high) equivalent to the literal, None is unbounded '''
+    if isinstance(left, VariableExpression) and isinstance(right, IntLiteralExpression):
+        value = right.value
+        if operator == "==":
+            return (left.name, value, value) if polarity else None
+        # left < value, or left >= value
+        return (left.name, None, value - 1) if polarity else (left.name, value, None)
+    if isinstance(left, IntLiteralExpression) and isinstance(right, VariableExpression):
+        value = left.value
+        if operator == "==":
+            return (right.name, value, value) if polarity else None
+        # value < right, or value >= right
+        return (right.name, value + 1, None) if polarity else (right.name, None, value)
+    return None
+
+
+class Facts:
+    ''' literals known to hold at a point of a path, and the interval of the variables they bound '''
+
+    def __init__(self):
+        # (atom, polarity) -> variables of the literal
+        self.literals = {}
+        self.bounds = {}
+        self.inconsistent = False
+
+    def copy(self) -> "Facts":
+        facts = Facts()
+        facts.literals = dict(self.literals)
+        facts.bounds = dict(self.bounds)
+        facts.inconsistent = self.inconsistent
+        return facts
+
+    def assume(self, formula) -> "Facts":
+        ''' the facts with the conjuncts of a normalized condition added, the facts are never modified once built
+        so that the paths extending the same path share them '''
+        facts = self.copy()
+        facts.add(formula, set())
+        return facts
+
+    def assign(self, variable:str) -> "Facts":
+        ''' the facts without those mentioning a variable that is assigned '''
+        if variable not in self.bounds and not any(variable in variables for variables in self.literals.values()):
+            return self
+        facts = Facts()
+        facts.literals = {literal: variables for literal, variables in self.literals.items()
+                          if variable not in variables}
+        facts.bounds = {name: bound for name, bound in self.bounds.items() if name != variable}
+        facts.inconsistent = self.inconsistent
+        return facts
+
+    def add(self, formula, killed:set):
+        ''' the conjuncts of a normalized condition that do not mention a killed variable '''
+        # a normalized condition is flat, only the disjunctions under a conjunction are skipped
+        for formula in formula[1] if formula[0] == AND else [formula]:
+            kind = formula[0]
+            if kind == OR:
+                # only FALSE, a disjunction is not a single fact
+                if not formula[1]:
+                    self.inconsistent = True
+            elif not (formula[4] & killed):
+                self.literals[(formula[1], formula[2])] = formula[4]
+                if formula[3] is not None:
+                    variable, low, high = formula[3]
+                    known_low, known_high = self.bounds.get(variable, (None, None))
+                    if low is not None and (known_low is None or low > known_low):
+                        known_low = low
+                    if high is not None and (known_high is None or high < known_high):
+                        known_high = high
+                    self.bounds[variable] = (known_low, known_high)
+
+    def contradicts(self, formula, depth:Union[None, int]=None) -> bool:
+        ''' the connectives are evaluated by recursion down to depth levels (RECURSION_DEPTH by default), and the
+        deeper ones bottom up on an explicit stack, a formula can be nested arbitrarily deep '''
+        if self.inconsistent:
+            return True
+        if depth is None:
+            depth = get_recursion_depth()
+        kind = formula[0]
+        if kind != AND and kind != OR:
+            return self.contradicts_literal(formula)
+        if depth == 0:
+            return self.contradicts_on_stack(formula)
+        return contradicts_connective(kind, (self.contradicts(child, depth - 1) for child in formula[1]))
+
+    def contradicts_on_stack(self, formula) -> bool:
+        values = []
+        stack = [formula]
+        while stack:
+            formula = stack.pop()
+            if formula.__class__ is int:
+                # the operands of the connective below are evaluated
+                count = formula
+                kind = stack.pop()
+                children = values[-count:] if count else []
+                del values[len(values) - count:]
+                values.append(contradicts_connective(kind, children))
+                continue
+            kind = formula[0]
+            if kind == AND or kind == OR:
+                stack.append(kind)
+                stack.append(len(formula[1]))
+                stack.extend(formula[1])
+            else:
+                values.append(self.contradicts_literal(formula))
+        return values[0]
+
+    def contradicts_literal(self, formula) -> bool:
+        if (formula[1], not formula[2]) in self.literals:
+            return True
+        if formula[3] is not None:
+            variable, low, high = formula[3]
+            known_low, known_high = self.bounds.get(variable, (None, None))
+            if low is not None and known_high is not None and low > known_high:
+                return True
+            if high is not None and known_low is not None and high < known_low:
+                return True
+        return False
+
+
+def contradicts_connective(kind:str, contradictions) -> bool:
+    ''' whether the facts contradict a conjunction or disjunction, from whether they contradict each child '''
+    return any(contradictions) if kind == AND else all(contradictions)
+
+
+def path_facts(path:List[Statement]) -> Facts:
+    ''' facts holding at the end of a path, a fact is dropped if one of its variables is assigned after it,
+    the path collector builds the same facts incrementally with Facts.assume and Facts.assign '''
+    facts = Facts()
+    killed = set()
+    for statement in reversed(path):
+        if isinstance(statement, AssignmentStatement):
+            killed.add(statement.variable)
+        elif isinstance(statement, (AssumptionStatement, AnnotationStatement)):
+            facts.add(normalize(statement.expression), killed)
+    return facts
+
+
+def is_infeasible(path:List[Statement], condition) -> bool:
+    ''' true if the condition can not hold at the end of the path '''
+    return path_facts(path).contradicts(normalize(condition))
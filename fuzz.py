@@ -0,0 +1,66 @@
+import sys
+import time
+import argparse
+from collections import Counter
+from typing import List
+
+import numpy as np
+
+from IR import load_program
+from interpreter import compile_program, DEFAULT_MAX_STEPS, PRECONDITION_FALSE, POSTCONDITION_VIOLATED, \
+    INVARIANT_VIOLATED, CompiledFunction
+from vectorized import random_columns
+
+# Fuzzing of the contracts of a .tpl file: every function is compiled and run on random inputs, an input
+# satisfying @PRE after which @POST (or a loop invariant) does not hold is a bug the verifier must also report.
+
+
+# integer inputs are small by default, the number of loop iterations usually grows with them
+DEFAULT_BOUND = 100
+
+
+def random_inputs(compiled_function:CompiledFunction, count:int, generator:np.random.Generator,
+                  bound:int=DEFAULT_BOUND) -> List[tuple]:
+    ''' count random tuples of parameter values in [-bound, bound], half of the integers are boundary values '''
+    columns = random_columns(dict(compiled_function.parameters), count, generator, bound)
+    return list(zip(*(columns[name].tolist() for name, parameter_type in compiled_function.parameters)))
+
+
+def main(argv:List[str]) -> int:
+    arg_parser = argparse.ArgumentParser(description="Run the functions of a .tpl file on random inputs "
+                                                     "and check their contracts.")
+    arg_parser.add_argument("file", help="path of the .tpl file")
+    arg_parser.add_argument("-n", "--inputs", type=int, default=100000, help="number of inputs per function")
+    arg_parser.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS,
+                            help="maximal number of loop iterations of a run")
+    arg_parser.add_argument("--bound", type=int, default=DEFAULT_BOUND,
+                            help="integer inputs are drawn from [-BOUND, BOUND]")
+    arg_parser.add_argument("--seed", type=int, default=0, help="seed of the random inputs")
+    args = arg_parser.parse_args(argv)
+
+    compiled_functions = compile_program(load_program(args.file), args.max_steps)
+    generator = np.random.default_rng(args.seed)
+
+    is_invalid = False
+    for function_name, compiled_function in compiled_functions.items():
+        inputs = random_inputs(compiled_function, args.inputs, generator, args.bound)
+        start = time.perf_counter()
+        outcomes = compiled_function.check_batch(inputs)
+        duration = time.perf_counter() - start
+
+        print(f"Fuzzing function: {function_name} ({len(inputs)} inputs in {duration:.3f}s, "
+              f"{len(inputs) / duration:.0f} runs/s)")
+        for outcome, count in sorted(Counter(outcomes).items()):
+            print(f"  {outcome}: {count}")
+        for outcome in (POSTCONDITION_VIOLATED, INVARIANT_VIOLATED):
+            if outcome in outcomes:
+                is_invalid = True
+                print(f"  first input with {outcome}: {function_name}{inputs[outcomes.index(outcome)]}")
+        if outcomes.count(PRECONDITION_FALSE) == len(outcomes):
+            print("  no input satisfied the precondition")
+
+    return 1 if is_invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,110 @@
+import hashlib
+import re
+from typing import Union, List, Tuple
+
+from parser import parse_program, reset_functions, set_functions, get_functions, exists_functions, ParseError
+from statement import Statement, Program
+
+# Incremental parsing of a file edited between two parses, e.g. by a watch mode or an editor. The file is split
+# into the spans of its top-level functions, and a function whose text is the same as in the previous parse is
+# reused, with its symbol table, instead of being lexed and parsed again.
+
+# the tokens delimiting the functions: braces are single character tokens that never occur inside another token,
+# so the spans can be found without running the (much slower) lexer on the whole file
+_DELIMITERS = re.compile(r"[{}]|\b(?:INT|BOOL)[ \t\n]+FUNCTION\b")
+
+# characters the lexer ignores between tokens
+_IGNORED = " \t\n"
+
+
+def function_spans(source:str) -> Union[None, List[Tuple[int, int, int]]]:
+    ''' (start offset, end offset, first line) of every top-level function, None if the source is not a sequence
+    of functions with balanced braces, it is then parsed as a whole and the parser reports the error '''
+    spans = []
+    start = None
+    end = 0
+    depth = 0
+    for match in _DELIMITERS.finditer(source):
+        token = match.group()
+        if start is None:
+            if token in "{}" or source[end:match.start()].strip(_IGNORED):
+                return None
+            start = match.start()
+        elif token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                end = match.end()
+                spans.append((start, end, 1 + source.count("\n", 0, start)))
+                start = None
+    if start is not None or source[end:].strip(_IGNORED):
+        return None
+    return spans
+
+
+def shift_line_numbers(function:Statement, delta:int):
+    ''' move the statements of a function delta lines down, the function was parsed at another position '''
+    stack = [function]
+    seen = set()
+    while stack:
+        statement = stack.pop()
+        if id(statement) in seen:
+            continue
+        seen.add(id(statement))
+        if statement.lineno is not None:
+            statement.lineno += delta
+        for value in vars(statement).values():
+            if isinstance(value, Statement):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, Statement))
+
+
+class IncrementalParser:
+    ''' parse_program for the successive versions of a file, only the functions whose text changed since the
+    previous version are parsed, the others are the same FunctionDeclarationStatement objects as before '''
+
+    def __init__(self):
+        # hash of the text of a function -> [function, symbol table, first line]
+        self.functions = {}
+        # number of functions parsed and reused by the last parse
+        self.parsed = 0
+        self.reused = 0
+
+    def parse(self, source:str) -> Program:
+        spans = function_spans(source)
+        if spans is None:
+            reset_functions()
+            self.functions = {}
+            program = parse_program(source)
+            self.parsed, self.reused = len(program.statements), 0
+            return program
+
+        reset_functions()
+        functions = {}
+        statements = []
+        parsed = reused = 0
+        for start, end, line in spans:
+            key = hashlib.sha256(source[start:end].encode()).hexdigest()
+            entry = self.functions.get(key)
+            if entry is None or key in functions:
+                # the function is parsed alone, the line numbers still count from the start of the file
+                function = parse_program(source[start:end], line).statements[0]
+                entry = [function, get_functions(function.function_name), line]
+                parsed += 1
+            else:
+                function, symbol_table, first_line = entry
+                if exists_functions(function.function_name):
+                    raise ParseError("Functions should not have identical names.")
+                set_functions(function.function_name, symbol_table)
+                if first_line != line:
+                    shift_line_numbers(function, line - first_line)
+                    entry[2] = line
+                reused += 1
+            functions[key] = entry
+            statements.append(function)
+        # only the functions of the current version are kept
+        self.functions = functions
+        self.parsed, self.reused = parsed, reused
+        return Program(statements)
@@ -0,0 +1,222 @@
+from typing import Union, List, Dict, Iterable
+
+from expr import *
+from statement import *
+from visitor import Visitor
+
+# Concrete execution of .tpl functions.
+# A function is compiled once into Python source, which is then executed with exec, so running it
+# costs as much as running the equivalent Python function instead of walking its AST at every step.
+
+# maximal number of iterations, over all the loops, of a single run of a function
+DEFAULT_MAX_STEPS = 10000
+
+# outcomes of checking the contract of a function on an input
+PRECONDITION_FALSE = "precondition false"
+CONTRACT_HOLDS = "contract holds"
+POSTCONDITION_VIOLATED = "postcondition violated"
+INVARIANT_VIOLATED = "invariant violated"
+STEP_LIMIT_EXCEEDED = "step limit exceeded"
+
+
+class StepLimitExceeded(Exception):
+    def __init__(self, function_name:str, max_steps:int):
+        super().__init__(f"{function_name} did not return within {max_steps} loop iterations.")
+
+
+def python_name(variable:str) -> str:
+    ''' .tpl variables are prefixed so they never clash with Python keywords or with the generated names '''
+    return "v_" + variable
+
+
+class PythonSerializer(Fold):
+    ''' Python source of an expression, the integers of Python are unbounded like the integers of z3 '''
+
+    @staticmethod
+    def serialize(expression) -> str:
+        return _python_serializer.visit(expression)
+
+    def visit_VariableExpression(self, expression) -> str:
+        return python_name(expression.name)
+
+    def visit_ReturnValueVariableExpression(self, expression) -> str:
+        return python_name(expression.name)
+
+    def visit_BooleanLiteralExpression(self, expression) -> str:
+        return "True" if expression.value == "TRUE" else "False"
+
+    def visit_IntLiteralExpression(self, expression) -> str:
+        return str(expression.value)
+
+    def visit_BinaryExpression(self, expression, left:str, right:str) -> str:
+        prefix, infix = PYTHON_SERIALIZATION[expression.op]
+        return prefix + left + infix + right + ")"
+
+    def visit_NotExpression(self, expression, operand:str) -> str:
+        return "(not " + operand + ")"
+
+    def visit_IntUnaryExpression(self, expression, operand:str) -> str:
+        return "(-" + operand + ")"
+
+
+_python_serializer = PythonSerializer()
+
+# operator -> (text before the left operand, text between the operands), the right operand is followed by ")"
+PYTHON_SERIALIZATION = {
+    "=>": ("((not ", ") or "),
+    "^": ("(", " and "),
+    "v": ("(", " or "),
+    "==": ("(", " == "),
+    "<": ("(", " < "),
+    "<=": ("(", " <= "),
+    ">": ("(", " > "),
+    ">=": ("(", " >= "),
+    BinaryOperator.PLUS: ("(", " + "),
+    BinaryOperator.MINUS: ("(", " - "),
+    BinaryOperator.TIMES: ("(", " * "),
+}
+
+
+class FunctionCompiler(Visitor):
+    ''' Python source of the body of a function.
+
+    A RETURN either returns the value (run mode) or evaluates the postcondition on the final state
+    (contract mode, where the loop invariants are also checked every time the loop condition is). '''
+
+    def __init__(self, function:FunctionDeclarationStatement, check_contract:bool):
+        self.function = function
+        self.check_contract = check_contract
+        self.lines = []
+        self.indentation = ""
+
+    def compile(self, entry_point:str) -> str:
+        function = self.function
+        parameters = ", ".join(python_name(parameter.variable) for parameter in function.parameter_list)
+        self.emit(f"def {entry_point}({parameters}):")
+        self.indentation = "    "
+        self.emit("steps = max_steps")
+        for statement in function.body:
+            if isinstance(statement, DeclarationStatement):
+                self.visit(statement)
+        if self.check_contract:
+            pre = PythonSerializer.serialize(function.precondition.expression)
+            self.emit(f"if not {pre}:")
+            self.emit("    return PRECONDITION_FALSE")
+        self.indentation = ""
+        self.visit_block(function.get_body_after_annotations())
+        return "\n".join(self.lines) + "\n"
+
+    def emit(self, line:str):
+        self.lines.append(self.indentation + line)
+
+    def visit_block(self, statements:List[Statement]):
+        indentation = self.indentation
+        self.indentation += "    "
+        if not statements:
+            self.emit("pass")
+        for statement in statements:
+            self.visit(statement)
+        self.indentation = indentation
+
+    def visit_DeclarationStatement(self, statement):
+        # the value of a variable read before it is assigned is arbitrary for the verifier
+        self.emit(f"{python_name(statement.variable)} = {'False' if statement.type == 'bool' else '0'}")
+
+    def visit_AssignmentStatement(self, statement):
+        self.emit(f"{python_name(statement.variable)} = {PythonSerializer.serialize(statement.expression)}")
+
+    def visit_IfThenElseStatement(self, statement):
+        self.emit(f"if {PythonSerializer.serialize(statement.condition)}:")
+        self.visit_block(statement.then_body)
+        self.emit("else:")
+        self.visit_block(statement.else_body)
+
+    def visit_WhileLoopStatement(self, statement):
+        condition = PythonSerializer.serialize(statement.condition)
+        if self.check_contract and statement.invariant is not None:
+            self.emit("while True:")
+            self.emit(f"    if not {PythonSerializer.serialize(statement.invariant.expression)}:")
+            self.emit("        return INVARIANT_VIOLATED")
+            self.emit(f"    if not {condition}:")
+            self.emit("        break")
+        else:
+            self.emit(f"while {condition}:")
+        self.emit("    steps -= 1")
+        self.emit("    if steps < 0:")
+        self.emit(f"        raise StepLimitExceeded({self.function.function_name!r}, max_steps)")
+        self.visit_block(statement.body)
+
+    def visit_ReturnStatement(self, statement):
+        value = PythonSerializer.serialize(statement.expression)
+        if self.check_contract:
+            post = PythonSerializer.serialize(self.function.postcondition.expression)
+            self.emit(f"{python_name('rv')} = {value}")
+            self.emit(f"return CONTRACT_HOLDS if {post} else POSTCONDITION_VIOLATED")
+        else:
+            self.emit(f"return {value}")
+
+    def visit_AnnotationStatement(self, statement):
+        # the loop annotations are attached to their loops by the validation
+        pass
+
+
+class CompiledFunction:
+    ''' a .tpl function compiled to Python, called with the values of its parameters in order '''
+
+    def __init__(self, function:FunctionDeclarationStatement, max_steps:int=DEFAULT_MAX_STEPS):
+        self.function_name = function.function_name
+        self.parameters = [(parameter.variable, DataType.BOOL if parameter.type == "bool" else DataType.INT)
+                           for parameter in function.parameter_list]
+        self.max_steps = max_steps
+        self.source = FunctionCompiler(function, False).compile("run") + \
+            FunctionCompiler(function, True).compile("check")
+        namespace = {
+            "max_steps": max_steps,
+            "StepLimitExceeded": StepLimitExceeded,
+            "PRECONDITION_FALSE": PRECONDITION_FALSE,
+            "CONTRACT_HOLDS": CONTRACT_HOLDS,
+            "POSTCONDITION_VIOLATED": POSTCONDITION_VIOLATED,
+            "INVARIANT_VIOLATED": INVARIANT_VIOLATED,
+        }
+        exec(compile(self.source, f"<tpl function {self.function_name}>", "exec"), namespace)
+        self.run = namespace["run"]
+        self.check = namespace["check"]
+
+    def __call__(self, *arguments):
+        return self.run(*arguments)
+
+    def check_outcome(self, *arguments) -> str:
+        ''' outcome of the contract on one input, a run over the step bound is not an error '''
+        try:
+            return self.check(*arguments)
+        except StepLimitExceeded:
+            return STEP_LIMIT_EXCEEDED
+
+    def run_batch(self, inputs:Iterable[tuple]) -> list:
+        run = self.run
+        return [run(*arguments) for arguments in inputs]
+
+    def check_batch(self, inputs:Iterable[tuple]) -> List[str]:
+        check_outcome = self.check_outcome
+        return [check_outcome(*arguments) for arguments in inputs]
+
+    def arguments_of(self, assignment:Dict[str, object]) -> tuple:
+        ''' parameter values of an assignment of variables (such as a counterexample),
+        missing parameters are 0 or FALSE '''
+        return tuple(assignment.get(name, False if parameter_type == DataType.BOOL else 0)
+                     for name, parameter_type in self.parameters)
+
+
+def compile_function(function:FunctionDeclarationStatement, max_steps:int=DEFAULT_MAX_STEPS) -> CompiledFunction:
+    return CompiledFunction(function, max_steps)
+
+
+def compile_program(program:Program, max_steps:int=DEFAULT_MAX_STEPS) -> Dict[str, CompiledFunction]:
+    return {function.function_name: CompiledFunction(function, max_steps) for function in program.statements}
+
+
+def replay_counter_example(compiled_function:CompiledFunction, counter_example:Dict[str, object]) -> str:
+    ''' outcome of running the function on the parameter values of a counterexample of a basic path starting
+    at its precondition, POSTCONDITION_VIOLATED confirms the counterexample is a real bug and not only a too
+    weak loop invariant '''
+    return compiled_function.check_outcome(*compiled_function.arguments_of(counter_example))
@@ -0,0 +1,342 @@
+import math
+from typing import Union, List, Dict, Tuple
+
+from expr import *
+from statement import *
+
+# Interval abstract interpretation of the functions, to discharge the easy VCs without z3.
+# An abstract state maps a variable to the interval (low, high) of its values, a missing variable can take any value
+# and None is the state of an unreachable point. Booleans are the intervals of 0 (FALSE) and 1 (TRUE), so that a
+# condition evaluates to (1, 1) when it holds in every state of the interval, and the bounds of integers are
+# -math.inf and math.inf when they are unbounded.
+#
+# discharges follows a basic path from the state of its first annotation, refined by its assumptions, and checks
+# that its last annotation holds: the VC is then valid, whatever the states reaching the path. analyze_function
+# runs the body of a function from @PRE, joining the states of the branches and widening at the WHILE loops, and
+# returns the states reaching the head of each loop. They do not prove a VC, which must hold for every state of the
+# invariant, but holds_when_reached tells when a VC starting at an invariant holds in the states that do reach it,
+# so that its counterexamples are never reached and the invariant is too weak.
+
+INTERVAL_LOGIC_SUFFIX = "/intervals"
+
+# iterations of a loop joined before the bounds still growing are widened to infinity
+WIDENING_DELAY = 3
+
+FALSE = (0, 0)
+TRUE = (1, 1)
+BOOLEAN = (0, 1)
+INTEGER = (-math.inf, math.inf)
+
+
+def multiply_bounds(left, right):
+    # 0 * inf is 0, the bound of a product with 0
+    if left == 0 or right == 0:
+        return 0
+    return left * right
+
+
+def multiply(left:tuple, right:tuple) -> tuple:
+    products = [multiply_bounds(a, b) for a in left for b in right]
+    return (min(products), max(products))
+
+
+def compare(operator:str, left:tuple, right:tuple) -> tuple:
+    ''' interval of the Boolean value of a comparison '''
+    (left_low, left_high), (right_low, right_high) = left, right
+    if operator == "<":
+        can_hold, can_fail = left_low < right_high, left_high >= right_low
+    elif operator == "<=":
+        can_hold, can_fail = left_low <= right_high, left_high > right_low
+    elif operator == ">":
+        can_hold, can_fail = left_high > right_low, left_low <= right_high
+    elif operator == ">=":
+        can_hold, can_fail = left_high >= right_low, left_low < right_high
+    else:
+        can_hold = left_low <= right_high and right_low <= left_high
+        can_fail = not (left_low == left_high == right_low == right_high)
+    return (0 if can_fail else 1, 1 if can_hold else 0)
+
+
+INTERVAL_OPERATORS = {
+    "^": lambda left, right: (min(left[0], right[0]), min(left[1], right[1])),
+    "v": lambda left, right: (max(left[0], right[0]), max(left[1], right[1])),
+    "=>": lambda left, right: (max(1 - left[1], right[0]), max(1 - left[0], right[1])),
+    BinaryOperator.PLUS: lambda left, right: (left[0] + right[0], left[1] + right[1]),
+    BinaryOperator.MINUS: lambda left, right: (left[0] - right[1], left[1] - right[0]),
+    BinaryOperator.TIMES: multiply,
+}
+
+
+class IntervalEvaluator(Fold):
+    ''' interval of the value of an expression in an abstract state '''
+
+    def __init__(self):
+        self.state = {}
+
+    def evaluate(self, state:dict, expression) -> tuple:
+        self.state = state
+        return self.visit(expression)
+
+    def visit_VariableExpression(self, expression):
+        return self.state.get(expression.name, BOOLEAN if expression.type == DataType.BOOL else INTEGER)
+
+    def visit_ReturnValueVariableExpression(self, expression):
+        return self.visit_VariableExpression(expression)
+
+    def visit_BooleanLiteralExpression(self, expression):
+        return TRUE if expression.value == "TRUE" else FALSE
+
+    def visit_IntLiteralExpression(self, expression):
+        value = int(expression.value)
+        return (value, value)
+
+    def visit_BinaryExpression(self, expression, left, right):
+        operator = INTERVAL_OPERATORS.get(expression.op)
+        if operator is None:
+            return compare(expression.op, left, right)
+        return operator(left, right)
+
+    def visit_NotExpression(self, expression, operand):
+        return (1 - operand[1], 1 - operand[0])
+
+    def visit_IntUnaryExpression(self, expression, operand):
+        return (-operand[1], -operand[0])
+
+
+_evaluator = IntervalEvaluator()
+
+
+def evaluate(state:dict, expression) -> tuple:
+    return _evaluator.evaluate(state, expression)
+
+
+# comparison -> comparison holding when it does not
+NEGATED_COMPARISONS = {"<": ">=", "<=": ">", ">": "<=", ">=": "<", "==": "!=", "!=": "=="}
+
+# comparison -> the same comparison with its operands swapped
+SWAPPED_COMPARISONS = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "==": "==", "!=": "!="}
+
+
+def is_conjunction(expression, polarity:bool) -> bool:
+    return isinstance(expression, BooleanBinaryExpression) and not isinstance(expression, ComparisonBinaryExpression) \
+        and (expression.op == "^") == polarity
+
+
+def is_disjunction(expression, polarity:bool) -> bool:
+    return isinstance(expression, BooleanBinaryExpression) and not isinstance(expression, ComparisonBinaryExpression) \
+        and (expression.op == "^") != polarity
+
+
+def operands(expression, polarity:bool) -> List[Tuple[object, bool]]:
+    ''' (operand, polarity) of a conjunction or disjunction with the polarity, l => r is NOT(l) v r '''
+    if expression.op == "=>":
+        return [(expression.left, not polarity), (expression.right, polarity)]
+    return [(expression.left, polarity), (expression.right, polarity)]
+
+
+def flatten(expression, polarity:bool, is_connective) -> List[Tuple[object, bool]]:
+    ''' the operands of the nested connectives at the root of the condition, negations pushed down '''
+    result = []
+    stack = [(expression, polarity)]
+    while stack:
+        expression, polarity = stack.pop()
+        if isinstance(expression, NotExpression):
+            stack.append((expression.expression, not polarity))
+        elif is_connective(expression, polarity):
+            stack.extend(reversed(operands(expression, polarity)))
+        else:
+            result.append((expression, polarity))
+    return result
+
+
+def meet(state:dict, name:str, interval:tuple) -> Union[None, dict]:
+    low, high = state.get(name, INTEGER)
+    low, high = max(low, interval[0]), min(high, interval[1])
+    if low > high:
+        return None
+    state = dict(state)
+    state[name] = (low, high)
+    return state
+
+
+def refine_literal(state:dict, expression, polarity:bool) -> Union[None, dict]:
+    ''' the state restricted to the values satisfying a condition that is not a conjunction '''
+    value = evaluate(state, expression)
+    if value == (FALSE if polarity else TRUE):
+        return None
+    if isinstance(expression, (VariableExpression, ReturnValueVariableExpression)):
+        return meet(state, expression.name, TRUE if polarity else FALSE)
+    if not isinstance(expression, ComparisonBinaryExpression):
+        return state
+    operator = expression.op if polarity else NEGATED_COMPARISONS[expression.op]
+    left, right = evaluate(state, expression.left), evaluate(state, expression.right)
+    for variable, operator, bound in [(expression.left, operator, right),
+                                      (expression.right, SWAPPED_COMPARISONS[operator], left)]:
+        if not isinstance(variable, (VariableExpression, ReturnValueVariableExpression)):
+            continue
+        low, high = bound
+        if operator == "<":
+            state = meet(state, variable.name, (-math.inf, high - 1))
+        elif operator == "<=":
+            state = meet(state, variable.name, (-math.inf, high))
+        elif operator == ">":
+            state = meet(state, variable.name, (low + 1, math.inf))
+        elif operator == ">=":
+            state = meet(state, variable.name, (low, math.inf))
+        elif operator == "==":
+            state = meet(state, variable.name, bound)
+        elif low == high:
+            # != a constant only moves the bounds equal to it
+            value_low, value_high = state.get(variable.name, INTEGER)
+            state = meet(state, variable.name, (value_low + (value_low == low), value_high - (value_high == low)))
+        if state is None:
+            return None
+    return state
+
+
+def refine(state:Union[None, dict], expression, polarity:bool=True) -> Union[None, dict]:
+    ''' the state restricted to the values satisfying the condition (or its negation), None if there are none.
+    A disjunction of conditions is the join of the states restricted by each of them, the connectives nested
+    deeper are only evaluated '''
+    for conjunct, conjunct_polarity in flatten(expression, polarity, is_conjunction):
+        if state is None:
+            return None
+        if is_disjunction(conjunct, conjunct_polarity):
+            states = [refine_literal(state, disjunct, disjunct_polarity)
+                      for disjunct, disjunct_polarity in flatten(conjunct, conjunct_polarity, is_disjunction)]
+            joined = None
+            for disjunct_state in states:
+                joined = join(joined, disjunct_state)
+            state = joined
+        else:
+            state = refine_literal(state, conjunct, conjunct_polarity)
+    return state
+
+
+def join(left:Union[None, dict], right:Union[None, dict]) -> Union[None, dict]:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return {name: (min(interval[0], right[name][0]), max(interval[1], right[name][1]))
+            for name, interval in left.items() if name in right}
+
+
+def widen(previous:Union[None, dict], state:Union[None, dict]) -> Union[None, dict]:
+    ''' state (which contains previous) with the bounds that grew since previous made infinite '''
+    if previous is None or state is None:
+        return state
+    return {name: (low if low >= previous[name][0] else -math.inf, high if high <= previous[name][1] else math.inf)
+            for name, (low, high) in state.items() if name in previous}
+
+
+class IntervalAnalysis(Visitor):
+    ''' states reaching the head of the loops of a function, see analyze
+
+    As the other passes over the blocks, the statements run on a stack of tasks (handler, arguments...)
+    instead of recursing: a handler pushed below the statements of a block runs once they are executed. '''
+
+    def __init__(self):
+        self.state = None
+        self.tasks = []
+        # id of the invariant of a loop -> state at the head of the loop
+        self.loop_heads = {}
+
+    def analyze(self, function:FunctionDeclarationStatement) -> Dict[int, dict]:
+        self.state = refine({}, function.precondition.expression)
+        self.loop_heads = {}
+        self.push_block(function.get_body_after_annotations())
+        while self.tasks:
+            handler, *arguments = self.tasks.pop()
+            handler(*arguments)
+        return self.loop_heads
+
+    def push_block(self, statements:List[Statement]):
+        self.tasks.extend((self.execute, statement) for statement in reversed(statements))
+
+    def execute(self, statement:Statement):
+        if self.state is not None:
+            self._dispatch_table[statement.__class__](self, statement)
+
+    def visit_AssignmentStatement(self, statement):
+        self.state = dict(self.state)
+        self.state[statement.variable] = evaluate(self.state, statement.expression)
+
+    def visit_IfThenElseStatement(self, statement):
+        self.tasks.append((self.start_else, statement, self.state))
+        self.push_block(statement.then_body)
+        self.state = refine(self.state, statement.condition, True)
+
+    def start_else(self, statement:IfThenElseStatement, state:dict):
+        self.tasks.append((self.join_branches, self.state))
+        self.push_block(statement.else_body)
+        self.state = refine(state, statement.condition, False)
+
+    def join_branches(self, then_state:Union[None, dict]):
+        self.state = join(then_state, self.state)
+
+    def visit_WhileLoopStatement(self, statement):
+        self.iterate(statement, self.state, self.state, 0)
+
+    def iterate(self, statement:WhileLoopStatement, entry:dict, head:dict, iteration:int):
+        ''' run the body from the state of the loop head '''
+        self.tasks.append((self.next_iteration, statement, entry, head, iteration))
+        self.push_block(statement.body)
+        self.state = refine(head, statement.condition, True)
+
+    def next_iteration(self, statement:WhileLoopStatement, entry:dict, head:dict, iteration:int):
+        joined = join(head, self.state)
+        next_head = joined if iteration < WIDENING_DELAY else widen(head, joined)
+        if next_head != head:
+            self.iterate(statement, entry, next_head, iteration + 1)
+            return
+        # the head is stable, one more iteration narrows the bounds widened to infinity: the states reaching the
+        # head are the entry state and those of the iterations started from a stable head
+        self.tasks.append((self.exit_loop, statement, entry))
+        self.push_block(statement.body)
+        self.state = refine(head, statement.condition, True)
+
+    def exit_loop(self, statement:WhileLoopStatement, entry:dict):
+        head = join(entry, self.state)
+        # a loop nested in another one is analyzed at every iteration of the outer loop
+        key = id(statement.invariant)
+        self.loop_heads[key] = join(self.loop_heads.get(key), head)
+        self.state = refine(head, statement.condition, False)
+
+    def visit_ReturnStatement(self, statement):
+        self.state = None
+
+    def visit_DeclarationStatement(self, statement):
+        pass
+
+
+def analyze_function(function:FunctionDeclarationStatement) -> Dict[int, dict]:
+    ''' id of the invariant of each loop reachable from @PRE -> state at the head of the loop '''
+    return IntervalAnalysis().analyze(function)
+
+
+def holds(basic_path:List[Statement], state:dict) -> bool:
+    ''' true if the last annotation of the basic path (with the RETURN already replaced by an assignment of rv) holds
+    at its end, from the state met with its first annotation '''
+    state = refine(state, basic_path[0].expression)
+    for statement in basic_path[1:-1]:
+        if state is None:
+            return True
+        if isinstance(statement, AssignmentStatement):
+            state = dict(state)
+            state[statement.variable] = evaluate(state, statement.expression)
+        elif isinstance(statement, AssumptionStatement):
+            state = refine(state, statement.expression)
+    return state is None or evaluate(state, basic_path[-1].expression) == TRUE
+
+
+def discharges(basic_path:List[Statement]) -> bool:
+    ''' true if the intervals prove the VC of the basic path, from its first annotation and its assumptions only '''
+    return holds(basic_path, {})
+
+
+def holds_when_reached(basic_path:List[Statement], loop_heads:Dict[int, dict]) -> bool:
+    ''' true if the VC of a basic path starting at a loop invariant holds in the states of the loop head, false
+    for a loop never reached (not in loop_heads) '''
+    state = loop_heads.get(id(basic_path[0]))
+    return state is not None and holds(basic_path, state)
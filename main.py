@@ -1,29 +1,153 @@
-from IR import generate_basic_paths
+from IR import generate_basic_paths, DFS, BFS, SUBSTITUTION, SSA
+from bmc import DEFAULT_BMC_MAX_DEPTH
+from events import add_event_listener
+from incremental import IncrementalParser
+from metrics import PrometheusExporter
+from portfolio import check_configurations, write_portfolio_log, DEFAULT_PORTFOLIO
+from profiling import enable_memory_profiling
+from solvers import parse_function_tactics, InvalidFunctionTactics
+from vectorized import DEFAULT_EXHAUSTIVE_MAX_VARIABLES, DEFAULT_RANDOM_TESTS
+import os
 import sys
+import time
+import argparse
 # and  sys.argv[1] == "DEBUG":
 
 
-class InputError(Exception):
-    def __init__(self, message="program takes only the file path as input"):
-        super().__init__(message)
-
 class UnsupportedFileExtension(Exception):
     def __init__(self, message="Only .tpl files are supported."):
         super().__init__(message)
 
-if len(sys.argv) < 2:
-    raise InputError(message="Usage: python main.py <file>")
+arg_parser = argparse.ArgumentParser(description="Verify the functions of a .tpl file.")
+arg_parser.add_argument("file", help="path of the .tpl file")
+arg_parser.add_argument("--smt2-dir", default=None,
+                        help="also export every VC as an SMT-LIB2 file into this directory")
+arg_parser.add_argument("--cache-dir", default=None,
+                        help="reuse the parsed and validated program of unchanged files from this directory")
+arg_parser.add_argument("--tactics", action="append", default=[], metavar="FUNCTION=TACTIC,...",
+                        help="solve the VCs of FUNCTION (* for every function) with this pipeline of z3 tactics, "
+                             "e.g. simpleMul=simplify,solve-eqs,propagate-values,qfnia")
+arg_parser.add_argument("--exhaustive-max-variables", type=int, default=DEFAULT_EXHAUSTIVE_MAX_VARIABLES,
+                        metavar="N",
+                        help="decide the VCs of Boolean functions with at most N variables by evaluating them "
+                             "on every assignment instead of calling z3 (0 always uses z3)")
+arg_parser.add_argument("--random-tests", type=int, default=DEFAULT_RANDOM_TESTS, metavar="N",
+                        help="look for a counterexample of each VC among N random inputs before calling z3 "
+                             "(0 disables the testing)")
+arg_parser.add_argument("--no-pruning", action="store_true",
+                        help="collect every syntactic path, even the branches whose condition contradicts the path")
+arg_parser.add_argument("--no-intervals", action="store_true",
+                        help="give every VC to the solvers, even those proved by intervals along their path")
+arg_parser.add_argument("--no-deduplication", action="store_true",
+                        help="check every VC, even those equal to an earlier VC up to the names of the variables")
+arg_parser.add_argument("--path-order", choices=[DFS, BFS], default=DFS,
+                        help="order in which the basic paths of a function are enumerated and checked")
+arg_parser.add_argument("--max-paths", type=int, default=None, metavar="N",
+                        help="report a path explosion for the functions with more than N basic paths")
+arg_parser.add_argument("--encoding", choices=[SUBSTITUTION, SSA], default=SUBSTITUTION,
+                        help="build the VCs by backward substitution, or in SSA form where their size is linear "
+                             "in the length of the paths")
+arg_parser.add_argument("--bit-width", type=int, default=None, metavar="N",
+                        help="encode INT as N-bit signed bit-vectors, and check that no operation overflows")
+arg_parser.add_argument("--bmc", type=int, nargs="?", const=DEFAULT_BMC_MAX_DEPTH, default=None, metavar="MAX_DEPTH",
+                        help="instead of proving the basic paths, look for a counterexample to @POST by unrolling "
+                             f"the loops 0, 1, ... MAX_DEPTH times (default {DEFAULT_BMC_MAX_DEPTH}), ignoring "
+                             "the loop invariants")
+arg_parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="check the VCs in N threads, each with its own z3 context (ignored with --memory-profile)")
+arg_parser.add_argument("--portfolio", nargs="?", const=",".join(DEFAULT_PORTFOLIO), default=None,
+                        metavar="CONFIG,...",
+                        help="race these z3 configurations on every nonlinear VC in parallel processes "
+                             f"(default: {','.join(DEFAULT_PORTFOLIO)})")
+arg_parser.add_argument("--portfolio-log", default=None, metavar="FILE",
+                        help="append the winning configuration of every race to this JSON lines file")
+arg_parser.add_argument("--memory-profile", type=int, nargs="?", const=10, default=None, metavar="TOP",
+                        help="report the peak and retained memory of each phase and function, and the TOP "
+                             "allocation sites of each phase (default 10, 0 only measures the phases)")
+arg_parser.add_argument("--metrics-file", default=None, metavar="FILE",
+                        help="add the counters and latency histograms of the run to this Prometheus text file "
+                             "(for the textfile collector of the node exporter)")
+arg_parser.add_argument("--watch", action="store_true",
+                        help="verify the file again every time it changes, only the changed functions are parsed again")
+arg_parser.add_argument("--replay", action="store_true",
+                        help="run the function on the inputs of the counterexamples to tell real bugs from "
+                             "loop invariants too weak to prove the function")
+
+def watch(file_path, verify):
+    ''' verify the file every time its modification time changes, until interrupted '''
+    incremental_parser = IncrementalParser()
+    modification_time = None
+    try:
+        while True:
+            current_modification_time = os.stat(file_path).st_mtime_ns
+            if current_modification_time != modification_time:
+                modification_time = current_modification_time
+                try:
+                    verify(incremental_parser)
+                except Exception as e:
+                    # the file is being edited, the next version may be valid
+                    print(f"{type(e).__name__}: {e}")
+                print(f"Parsed {incremental_parser.parsed} functions, reused {incremental_parser.reused}")
+                print(f"Watching {file_path} for changes...")
+            time.sleep(0.2)
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv):
+    # the racing processes of a portfolio import this module, the verification only runs as a script
+    args = arg_parser.parse_args(argv)
+
+    try:
+        function_tactics = parse_function_tactics(args.tactics)
+    except InvalidFunctionTactics as e:
+        arg_parser.error(str(e))
 
-if len(sys.argv) > 2 :
-    raise InputError()
+    portfolio = args.portfolio.split(",") if args.portfolio is not None else None
+    if portfolio is not None:
+        check_configurations(portfolio)
 
-if sys.argv[1].split("/")[-1].split(".")[-1] != "tpl" :
-    raise UnsupportedFileExtension()
+    if args.file.split("/")[-1].split(".")[-1] != "tpl" :
+        raise UnsupportedFileExtension()
 
+    if args.memory_profile is not None:
+        memory_profiler = enable_memory_profiling(args.memory_profile)
 
-generate_basic_paths(sys.argv[1])
+    if args.metrics_file is not None:
+        exporter = PrometheusExporter()
+        add_event_listener(exporter)
+
+    def verify(incremental_parser=None):
+        try:
+            generate_basic_paths(args.file, smt2_dir=args.smt2_dir, cache_dir=args.cache_dir,
+                                 function_tactics=function_tactics,
+                                 exhaustive_max_variables=args.exhaustive_max_variables,
+                                 random_tests=args.random_tests, replay=args.replay,
+                                 prune=not args.no_pruning, deduplicate=not args.no_deduplication,
+                                 path_order=args.path_order, max_paths=args.max_paths, jobs=args.jobs,
+                                 encoding=args.encoding, portfolio=portfolio, bit_width=args.bit_width,
+                                 incremental_parser=incremental_parser, bmc_max_depth=args.bmc,
+                                 intervals=not args.no_intervals)
+        finally:
+            if args.metrics_file is not None:
+                # every run of --watch is a run of the metrics
+                exporter.write(args.metrics_file)
+
+    if args.watch:
+        watch(args.file, verify)
+    else:
+        verify()
     # script = generate_z3_script(trees)
     # export_z3pyscript("z3_script.py", script)
     # run_z3pyscript("z3_script.py", timeout=30)
     # generate_graph(basic_paths)
 
+    if args.portfolio_log is not None:
+        write_portfolio_log(args.portfolio_log)
+
+    if args.memory_profile is not None:
+        memory_profiler.print_report()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,162 @@
+import os
+import time
+from typing import Union, Dict, Tuple
+
+from events import EventListener, UNKNOWN
+
+# Metrics of the verification runs in the Prometheus text format, written to a file read by the textfile collector
+# of the node exporter. The counters and histograms of a run are added to those already in the file, so they grow
+# across runs and the throughput (VCs per second), the rate of unknown VCs and the tail latencies are computed
+# from them by Prometheus, the gauges describe the last run only.
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+# upper bounds of the buckets of the duration histograms, in seconds, they must not change between runs
+DURATION_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300]
+
+# name -> (type, help), in the order they are written
+METRICS = {
+    "tpl_runs_total": (COUNTER, "Verification runs."),
+    "tpl_functions_total": (COUNTER, "Functions verified, by result (verified or not_verified)."),
+    "tpl_function_duration_seconds": (HISTOGRAM, "Time to verify a function."),
+    "tpl_paths_total": (COUNTER, "Basic paths generated."),
+    "tpl_vcs_built_total": (COUNTER, "VCs built, by logic."),
+    "tpl_vc_build_duration_seconds": (HISTOGRAM, "Time to build a VC, by logic."),
+    "tpl_vcs_solved_total": (COUNTER, "VCs checked, by logic and result (valid, invalid or unknown)."),
+    "tpl_vcs_deduplicated_total": (COUNTER, "VCs answered by an equal VC checked earlier, by logic and result."),
+    "tpl_vc_solve_duration_seconds": (HISTOGRAM, "Time to check a VC, by logic."),
+    "tpl_last_run_timestamp_seconds": (GAUGE, "End of the last run, in seconds since the epoch."),
+    "tpl_last_run_duration_seconds": (GAUGE, "Wall time of the last run."),
+    "tpl_last_run_vcs_solved": (GAUGE, "VCs checked by the last run."),
+    "tpl_last_run_vcs_per_second": (GAUGE, "VCs checked per second of wall time by the last run."),
+    "tpl_last_run_unknown_ratio": (GAUGE, "Fraction of the VCs checked by the last run that were unknown."),
+}
+
+_HISTOGRAM_SUFFIXES = ["_bucket", "_sum", "_count"]
+
+
+def sample_name(name:str, labels:Tuple[Tuple[str, str], ...]=()) -> str:
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{label}="{value}"' for label, value in labels) + "}"
+
+
+def metric_of(sample:str) -> Union[None, str]:
+    ''' name of the metric a sample belongs to, None if it is not one of METRICS '''
+    name = sample.partition("{")[0]
+    if name in METRICS:
+        return name
+    for suffix in _HISTOGRAM_SUFFIXES:
+        if name.endswith(suffix) and METRICS.get(name[:-len(suffix)], (None,))[0] == HISTOGRAM:
+            return name[:-len(suffix)]
+    return None
+
+
+def format_value(value:float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def read_samples(file_path:str) -> Dict[str, float]:
+    ''' sample name with its labels -> value, of a file written by PrometheusExporter.write '''
+    samples = {}
+    try:
+        with open(file_path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                sample, _, value = line.rpartition(" ")
+                try:
+                    samples[sample] = float(value)
+                except ValueError:
+                    # not written by this module, the sample is dropped
+                    pass
+    except FileNotFoundError:
+        pass
+    return samples
+
+
+class PrometheusExporter(EventListener):
+    ''' accumulates the metrics of a run, write adds them to the file and starts a new run '''
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # sample name with its labels -> value, the histogram buckets are created in increasing order
+        self.samples = {}
+        self.start = time.time()
+        self.vcs_solved = 0
+        self.vcs_unknown = 0
+
+    def increment(self, name:str, labels:Tuple[Tuple[str, str], ...]=(), value:float=1):
+        sample = sample_name(name, labels)
+        self.samples[sample] = self.samples.get(sample, 0) + value
+
+    def observe(self, name:str, value:float, labels:Tuple[Tuple[str, str], ...]=()):
+        for bound in DURATION_BUCKETS:
+            self.increment(name + "_bucket", labels + (("le", str(bound)),), 1 if value <= bound else 0)
+        self.increment(name + "_bucket", labels + (("le", "+Inf"),))
+        self.increment(name + "_sum", labels, value)
+        self.increment(name + "_count", labels)
+
+    def function_finished(self, function_name:str, verified:bool, duration:float):
+        self.increment("tpl_functions_total", (("result", "verified" if verified else "not_verified"),))
+        self.observe("tpl_function_duration_seconds", duration)
+
+    def path_generated(self, function_name:str, path_index:int, basic_path:list):
+        self.increment("tpl_paths_total")
+
+    def vc_built(self, function_name:str, path_index:int, logic:str, duration:float):
+        self.increment("tpl_vcs_built_total", (("logic", logic),))
+        self.observe("tpl_vc_build_duration_seconds", duration, (("logic", logic),))
+
+    def vc_solved(self, function_name:str, path_index:int, logic:str, result:str, duration:float,
+                  overflow:bool, duplicate:bool):
+        labels = (("logic", logic), ("result", result))
+        if duplicate:
+            self.increment("tpl_vcs_deduplicated_total", labels)
+            return
+        self.increment("tpl_vcs_solved_total", labels)
+        self.observe("tpl_vc_solve_duration_seconds", duration, (("logic", logic),))
+        self.vcs_solved += 1
+        if result == UNKNOWN:
+            self.vcs_unknown += 1
+
+    def write(self, file_path:str):
+        ''' add the metrics of the run to those of the file (replace the gauges), and start a new run '''
+        end = time.time()
+        duration = end - self.start
+        self.increment("tpl_runs_total")
+        gauges = {
+            "tpl_last_run_timestamp_seconds": end,
+            "tpl_last_run_duration_seconds": duration,
+            "tpl_last_run_vcs_solved": self.vcs_solved,
+            "tpl_last_run_vcs_per_second": self.vcs_solved / duration if duration > 0 else 0,
+            "tpl_last_run_unknown_ratio": self.vcs_unknown / self.vcs_solved if self.vcs_solved else 0,
+        }
+
+        samples = read_samples(file_path)
+        for sample, value in self.samples.items():
+            samples[sample] = samples.get(sample, 0) + value
+        samples.update(gauges)
+
+        # metric -> lines of its samples
+        lines = {}
+        for sample, value in samples.items():
+            name = metric_of(sample)
+            if name is not None:
+                lines.setdefault(name, []).append(f"{sample} {format_value(value)}")
+        text = []
+        for name, (metric_type, help) in METRICS.items():
+            if name in lines:
+                text += [f"# HELP {name} {help}", f"# TYPE {name} {metric_type}"] + lines[name]
+
+        # the collector may read the file at any time, it is written then renamed
+        temporary_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as f:
+            f.write("\n".join(text) + "\n")
+        os.replace(temporary_path, file_path)
+        self.reset()
@@ -1,6 +1,6 @@
 import copy
 
-from lexer import tokens
+from lexer import tokens, lexer
 import ply.yacc as yacc
 from expr import *
 from statement import *
@@ -12,7 +12,10 @@ from statement import *
 # program : statement_list
 #
 # statement_list : statement
-#               | statement statement_list
+#               | statement_list statement
+#
+# The lists are left-recursive: the parser reduces each element as soon as it is read and the action appends it to
+# the list, so a list of any length is built in linear time with a constant parser stack.
 #
 # statement : annotation
 #           | assignment
@@ -53,6 +56,9 @@ from statement import *
 # variables of the function being currently parsed
 variables = {}
 
+# return type of the function being currently parsed, this is the type of rv
+return_type = None
+
 # name -> [variables_dict]
 functions = {}
 
@@ -76,6 +82,17 @@ class ParseError(Exception):
     pass
 
 
+def parse_program(source, first_line=1):
+    ''' parse a whole .tpl file, the state left by a previous (possibly failed) parse is discarded,
+    first_line is the line number of the start of the source, in a file it is a part of '''
+    global variables
+    global return_type
+    variables = {}
+    return_type = None
+    lexer.lineno = first_line
+    return parser.parse(source, lexer=lexer)
+
+
 def p_program(p):
     '''program : function_list'''
     p[0] = Program(p[1])
@@ -83,29 +100,53 @@ def p_program(p):
 
 def p_function_list(p):
     '''function_list : function_declaration
-                    | function_declaration function_list'''
+                    | function_list function_declaration'''
     if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 3:
-        p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
+
+# A NOP is either followed by the rest of the list, or ends it with a semicolon.
 
 def p_statement_list(p):
-    '''statement_list : statement
-                    | statement statement_list
-                    | statement_with_no_semi_col statement_list
-                    | statement_with_no_semi_col
-                    | NOP SEMICOLON
-                    | NOP statement_list'''
+    '''statement_list : statement_item
+                    | statement_prefix statement_item'''
+    if len(p) == 2:
+        p[0] = [p[1]]
+    elif len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
+
+def p_statement_list_nop(p):
+    '''statement_list : NOP SEMICOLON
+                    | statement_prefix NOP SEMICOLON'''
+    if len(p) == 3:
+        p[0] = []
+    elif len(p) == 4:
+        p[0] = p[1]
+
+def p_statement_prefix(p):
+    '''statement_prefix : statement_item
+                    | statement_prefix statement_item'''
     if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 3:
-        if p[1] == "NOP":
-            if p[2] == ";":
-                p[0] = []
-            else:
-                p[0] = p[2]
-        else:
-            p[0] = [p[1]] + p[2]
+        p[1].append(p[2])
+        p[0] = p[1]
+
+def p_statement_prefix_nop(p):
+    '''statement_prefix : NOP
+                    | statement_prefix NOP'''
+    if len(p) == 2:
+        p[0] = []
+    elif len(p) == 3:
+        p[0] = p[1]
+
+def p_statement_item(p):
+    '''statement_item : statement
+                    | statement_with_no_semi_col'''
+    p[0] = p[1]
 
 
 def p_statement_with_no_semi_col(p):
@@ -124,25 +165,42 @@ def p_statement(p):
     p[0] = p[1]
 
 def p_function_declaration(p):
-    '''function_declaration : BOOL_TYPE FUNCTION VARIABLE LPAREN parameter_list RPAREN LBRACE function_body RBRACE
-                        | INT_TYPE FUNCTION VARIABLE LPAREN parameter_list RPAREN LBRACE function_body RBRACE'''
+    '''function_declaration : function_header LPAREN parameter_list RPAREN LBRACE function_body RBRACE'''
     global variables
     global functions
+    global return_type
 
-    if p[1] == "BOOL":
-        p[0] = BoolFunctionDeclarationStatement(p[3], p[5], p[8])
-    elif p[1] == "INT":
-        p[0] = IntFunctionDeclarationStatement(p[3], p[5], p[8])
+    function_type, function_name, lineno = p[1]
+    if function_type == "BOOL":
+        p[0] = BoolFunctionDeclarationStatement(function_name, p[3], p[6])
+    elif function_type == "INT":
+        p[0] = IntFunctionDeclarationStatement(function_name, p[3], p[6])
     else:
         raise ParseError("Invalid function declaration")
+    p[0].lineno = lineno
 
-    if exists_functions(p[3]):
+    if exists_functions(function_name):
         raise ParseError("Functions should not have identical names.")
 
 
     # functions[p[3]] = [copy.copy(variables)]
-    set_functions(p[3], [copy.copy(variables)])
+    set_functions(function_name, [copy.copy(variables)])
     variables = {}
+    return_type = None
+
+
+def p_function_header(p):
+    '''function_header : BOOL_TYPE FUNCTION VARIABLE
+                        | INT_TYPE FUNCTION VARIABLE'''
+    # reduced before the body is parsed, so rv can be typed as soon as it is used
+    global return_type
+    if p[1] == "BOOL":
+        return_type = DataType.BOOL
+    elif p[1] == "INT":
+        return_type = DataType.INT
+    else:
+        raise ParseError("Invalid function declaration")
+    p[0] = (p[1], p[3], p.lineno(1))
 
 
 def p_function_body(p):
@@ -158,19 +216,22 @@ def p_function_body(p):
 def p_return_statememnt(p):
     'return_statement : RETURN expression'
     p[0] = ReturnStatement(p[2])
+    p[0].lineno = p.lineno(1)
 
 def p_parameter_list(p):
     '''parameter_list : declaration
-                    | declaration COMMA parameter_list'''
+                    | parameter_list COMMA declaration'''
     if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 4:
-        p[0] = [p[1]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_while_loop(p):
     'while_loop : WHILE LPAREN expression RPAREN LBRACE statement_list RBRACE'
     condition, body = p[3], p[6]
     p[0] = WhileLoopStatement(condition, body)
+    p[0].lineno = p.lineno(1)
 
 def p_bool_declaration(p):
     'declaration : BOOL_TYPE VARIABLE'
@@ -183,6 +244,7 @@ def p_bool_declaration(p):
     else:
         variables[variable_name] = DataType.BOOL
         p[0] = BooleanDeclarationStatement(variable_name)
+        p[0].lineno = p.lineno(1)
 
 def p_int_declaration(p):
     'declaration : INT_TYPE VARIABLE'
@@ -195,6 +257,7 @@ def p_int_declaration(p):
     else:
         variables[variable_name] = DataType.INT
         p[0] = IntDeclarationStatement(variable_name)
+        p[0].lineno = p.lineno(1)
 
 
 def p_annotation(p):
@@ -211,6 +274,7 @@ def p_annotation(p):
         p[0] = LoopAnnotationStatement(expression)
     else:
         p[0] = AnnotationStatement(expression)
+    p[0].lineno = p.lineno(1)
     # else:
         # raise ParseError('Invalid annotation')
 
@@ -219,6 +283,7 @@ def p_assumption(p):
     # if p[2].eval_type == "bool":
     expression = p[2]
     p[0] = AssumptionStatement(expression)
+    p[0].lineno = p.lineno(1)
     # else:
         # raise ParseError('Invalid assumption')
 
@@ -227,12 +292,15 @@ def p_assumption(p):
 def p_assignment(p):
     'assignment : VARIABLE ASSIGNMENT expression'
     variable, expression = p[1], p[3]
+    if variable not in variables:
+        raise ParseError(f"variable {variable} assigned but not declared")
     if variables[variable] == DataType.INT:
         p[0] = IntAssignmentStatement(variable, expression)
     elif variables[variable] == DataType.BOOL:
         p[0] = BooleanAssignmentStatement(variable, expression)
     else:
         raise ParseError('Invalid assignment expression')
+    p[0].lineno = p.lineno(1)
 
 def p_expression_plus(p):
     'expression : expression PLUS expression'
@@ -281,7 +349,7 @@ def p_expression_variable(p):
     elif variables.get(p[1]) == DataType.BOOL:
         p[0] = VariableExpression(p[1], DataType.BOOL)
     elif p[1] == "rv":
-        p[0] = ReturnValueVariableExpression()
+        p[0] = ReturnValueVariableExpression(return_type)
     else:
         raise ParseError(f"variable used but not declared" )
 
@@ -323,6 +391,7 @@ def p_formula_not(p):
 def p_if_then_else(p):
     'if_then_else : IF LPAREN expression RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE'
     p[0] = IfThenElseStatement(p[3], p[6], p[10])
+    p[0].lineno = p.lineno(1)
     # if p[2].eval_type == "bool":
         # p[2]=condition, p[4]=body then, p[6]=body else
         # p[0] = Node('if_then_else', None, (p[2], p[4], p[6]), None,None)
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'rightASSIGNMENTleftIMPLIESleftBOOLEAN_OPERATORnonassocCOMPARATORleftPLUSMINUSleftTIMESrightUMINUSANNOTATION ASSIGNMENT ASSUME BOOLEAN_OPERATOR BOOL_TYPE COMMA COMPARATOR ELSE FALSE FUNCTION IF IMPLIES INT_TYPE LBRACE LOOP_ANNOTATION LPAREN MINUS NUMBER PLUS POST_ANNOTATION PRE_ANNOTATION RBRACE RETURN RPAREN THEN TIMES TRUE TRUTH_VALUES VARIABLE WHILEprogram : statement_liststatement_list : statement\n                    | statement statement_liststatement : assignment\n             | expression\n             | annotation\n             | while_loop\n             | if_then_else\n             | assumption\n             | declaration\n             | function_declaration\n             | return_statementfunction_declaration : FUNCTION VARIABLE LPAREN parameter_list RPAREN LBRACE statement_list RBRACEreturn_statement : RETURN expressionparameter_list : declaration\n                    | declaration COMMA parameter_listwhile_loop : WHILE LPAREN expression RPAREN LBRACE statement_list RBRACEdeclaration : BOOL_TYPE VARIABLEdeclaration : INT_TYPE VARIABLEannotation : PRE_ANNOTATION expression\n                  | POST_ANNOTATION expression\n                  | ANNOTATION expression\n                  | LOOP_ANNOTATION expressionassumption : ASSUME expressionassignment : VARIABLE ASSIGNMENT expressionexpression : expression PLUS expressionexpression : expression MINUS expressionexpression : expression TIMES expressionexpression : LPAREN expression RPARENexpression : NUMBERexpression : TRUE\n                | FALSEexpression : VARIABLEexpression : MINUS expression %prec UMINUSexpression : expression COMPARATOR expressionexpression : expression BOOLEAN_OPERATOR expressionexpression : expression IMPLIES expressionif_then_else : IF LPAREN expression RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE'
+_lr_signature = 'rightASSIGNMENTleftIMPLIESleftBOOLEAN_OPERATORnonassocCOMPARATORleftPLUSMINUSleftTIMESrightUMINUSASSIGNMENT ASSUME BOOLEAN_OPERATOR BOOL_TYPE COMMA COMPARATOR DECLARE ELSE FALSE FUNCTION IF IMPLIES INT_TYPE LBRACE LOOP_ANNOTATION LPAREN MINUS NOP NOT NUMBER PLUS POST_ANNOTATION PRE_ANNOTATION RBRACE RETURN RPAREN SEMICOLON TIMES TRUE VARIABLE WHILEprogram : function_listfunction_list : function_declaration\n                    | function_list function_declarationstatement_list : statement_item\n                    | statement_prefix statement_itemstatement_list : NOP SEMICOLON\n                    | statement_prefix NOP SEMICOLONstatement_prefix : statement_item\n                    | statement_prefix statement_itemstatement_prefix : NOP\n                    | statement_prefix NOPstatement_item : statement\n                    | statement_with_no_semi_colstatement_with_no_semi_col : while_loop\n                 | if_then_else\n    statement : assignment SEMICOLON\n             | expression SEMICOLON\n             | annotation SEMICOLON\n             | assumption SEMICOLON\n             | return_statement SEMICOLONfunction_declaration : function_header LPAREN parameter_list RPAREN LBRACE function_body RBRACEfunction_header : BOOL_TYPE FUNCTION VARIABLE\n                        | INT_TYPE FUNCTION VARIABLEfunction_body : DECLARE LPAREN parameter_list RPAREN SEMICOLON statement_list\n                    | statement_listreturn_statement : RETURN expressionparameter_list : declaration\n                    | parameter_list COMMA declarationwhile_loop : WHILE LPAREN expression RPAREN LBRACE statement_list RBRACEdeclaration : BOOL_TYPE VARIABLEdeclaration : INT_TYPE VARIABLEannotation : PRE_ANNOTATION expression\n                  | POST_ANNOTATION expression\n                  | LOOP_ANNOTATION expressionassumption : ASSUME expressionassignment : VARIABLE ASSIGNMENT expressionexpression : expression PLUS expressionexpression : expression MINUS expressionexpression : expression TIMES expressionexpression : LPAREN expression RPARENexpression : NUMBERexpression : TRUE\n                | FALSEexpression : VARIABLEexpression : MINUS expression %prec UMINUSexpression : expression COMPARATOR expressionexpression : expression BOOLEAN_OPERATOR expressionexpression : expression IMPLIES expressionexpression : NOT LPAREN  expression RPARENif_then_else : IF LPAREN expression RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE'
     
-_lr_action_items = {'VARIABLE':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,27,28,29,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[13,13,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,39,39,-30,-31,-32,39,39,39,39,39,48,49,50,39,39,39,39,39,39,39,39,-34,-33,-20,-21,-22,-23,39,39,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,13,13,13,-17,-13,13,-38,]),'LPAREN':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,29,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[15,15,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,15,15,-30,-31,-32,15,15,15,15,45,46,15,15,15,15,15,15,15,15,15,-34,-33,-20,-21,-22,-23,15,15,-24,-18,-19,62,-14,-26,-27,-28,-35,-36,-37,-25,-29,15,15,15,-17,-13,15,-38,]),'NUMBER':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,29,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[16,16,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,16,16,-30,-31,-32,16,16,16,16,16,16,16,16,16,16,16,16,16,-34,-33,-20,-21,-22,-23,16,16,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,16,16,16,-17,-13,16,-38,]),'TRUE':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,29,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[17,17,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,17,17,-30,-31,-32,17,17,17,17,17,17,17,17,17,17,17,17,17,-34,-33,-20,-21,-22,-23,17,17,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,17,17,17,-17,-13,17,-38,]),'FALSE':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,29,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[18,18,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,18,18,-30,-31,-32,18,18,18,18,18,18,18,18,18,18,18,18,18,-34,-33,-20,-21,-22,-23,18,18,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,18,18,18,-17,-13,18,-38,]),'MINUS':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,67,68,73,75,79,80,82,],[14,14,-4,32,-6,-7,-8,-9,-10,-11,-12,-33,14,14,-30,-31,-32,14,14,14,14,14,14,14,14,14,14,14,14,14,-34,-33,32,32,32,32,32,14,14,32,-18,-19,32,-26,-27,-28,32,32,32,32,-29,32,32,14,14,14,-17,-13,14,-38,]),'PRE_ANNOTATION':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[19,19,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,19,19,19,-17,-13,19,-38,]),'POST_ANNOTATION':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[20,20,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,20,20,20,-17,-13,20,-38,]),'ANNOTATION':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[21,21,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,21,21,21,-17,-13,21,-38,]),'LOOP_ANNOTATION':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[22,22,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,22,22,22,-17,-13,22,-38,]),'WHILE':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[23,23,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,23,23,23,-17,-13,23,-38,]),'IF':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[24,24,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,24,24,24,-17,-13,24,-38,]),'ASSUME':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[25,25,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,25,25,25,-17,-13,25,-38,]),'BOOL_TYPE':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,62,67,68,70,73,75,79,80,82,],[26,26,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,26,26,26,26,26,-17,-13,26,-38,]),'INT_TYPE':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,62,67,68,70,73,75,79,80,82,],[27,27,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,27,27,27,27,27,-17,-13,27,-38,]),'FUNCTION':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[28,28,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,28,28,28,-17,-13,28,-38,]),'RETURN':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,67,68,73,75,79,80,82,],[29,29,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,29,29,29,-17,-13,29,-38,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,16,17,18,30,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,75,79,82,],[0,-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-3,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,-17,-13,-38,]),'RBRACE':([3,4,5,6,7,8,9,10,11,12,13,16,17,18,30,38,39,41,42,43,44,47,48,49,51,52,53,54,55,56,57,58,59,71,72,75,77,79,81,82,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-33,-30,-31,-32,-3,-34,-33,-20,-21,-22,-23,-24,-18,-19,-14,-26,-27,-28,-35,-36,-37,-25,-29,75,76,-17,79,-13,82,-38,]),'PLUS':([5,13,16,17,18,38,39,40,41,42,43,44,47,51,52,53,54,55,56,57,58,59,60,61,],[31,-33,-30,-31,-32,-34,-33,31,31,31,31,31,31,31,-26,-27,-28,31,31,31,31,-29,31,31,]),'TIMES':([5,13,16,17,18,38,39,40,41,42,43,44,47,51,52,53,54,55,56,57,58,59,60,61,],[33,-33,-30,-31,-32,-34,-33,33,33,33,33,33,33,33,33,33,-28,33,33,33,33,-29,33,33,]),'COMPARATOR':([5,13,16,17,18,38,39,40,41,42,43,44,47,51,52,53,54,55,56,57,58,59,60,61,],[34,-33,-30,-31,-32,-34,-33,34,34,34,34,34,34,34,-26,-27,-28,None,34,34,34,-29,34,34,]),'BOOLEAN_OPERATOR':([5,13,16,17,18,38,39,40,41,42,43,44,47,51,52,53,54,55,56,57,58,59,60,61,],[35,-33,-30,-31,-32,-34,-33,35,35,35,35,35,35,35,-26,-27,-28,-35,-36,35,35,-29,35,35,]),'IMPLIES':([5,13,16,17,18,38,39,40,41,42,43,44,47,51,52,53,54,55,56,57,58,59,60,61,],[36,-33,-30,-31,-32,-34,-33,36,36,36,36,36,36,36,-26,-27,-28,-35,-36,-37,36,-29,36,36,]),'ASSIGNMENT':([13,],[37,]),'RPAREN':([16,17,18,38,39,40,48,49,52,53,54,55,56,57,59,60,61,65,66,74,],[-30,-31,-32,-34,-33,59,-18,-19,-26,-27,-28,-35,-36,-37,-29,63,64,69,-15,-16,]),'COMMA':([48,49,66,],[-18,-19,70,]),'LBRACE':([63,64,69,78,],[67,68,73,80,]),'ELSE':([76,],[78,]),}
+_lr_action_items = {'BOOL_TYPE':([0,2,3,7,8,18,54,55,],[5,5,-2,-3,13,13,-21,13,]),'INT_TYPE':([0,2,3,7,8,18,54,55,],[6,6,-2,-3,14,14,-21,14,]),'$end':([1,2,3,7,54,],[0,-1,-2,-3,-21,]),'LPAREN':([4,15,16,21,23,25,27,28,29,30,31,37,38,40,44,45,46,47,48,49,50,51,56,57,59,60,61,62,63,64,65,66,67,68,69,70,72,78,79,97,98,99,103,106,108,],[8,-22,-23,23,23,55,-8,23,-10,-12,-13,-14,-15,23,72,23,23,23,23,23,78,79,-9,-11,-16,-17,23,23,23,23,23,23,-18,-19,-20,23,23,23,23,23,23,23,-29,23,-50,]),'FUNCTION':([5,6,],[9,10,]),'VARIABLE':([9,10,13,14,21,23,27,28,29,30,31,37,38,40,45,46,47,48,49,56,57,59,60,61,62,63,64,65,66,67,68,69,70,72,78,79,97,98,99,103,106,108,],[15,16,19,20,39,53,-8,39,-10,-12,-13,-14,-15,53,53,53,53,53,53,-9,-11,-16,-17,53,53,53,53,53,53,-18,-19,-20,53,53,53,53,39,39,39,-29,39,-50,]),'RPAREN':([11,12,19,20,22,41,42,43,52,53,71,80,81,83,84,85,86,87,88,90,91,92,94,],[17,-27,-30,-31,-28,-41,-42,-43,80,-44,-45,-40,93,-37,-38,-39,-46,-47,-48,94,95,96,-49,]),'COMMA':([11,12,19,20,22,81,],[18,-27,-30,-31,-28,18,]),'LBRACE':([17,95,96,105,],[21,98,99,106,]),'DECLARE':([21,],[25,]),'NOP':([21,27,28,29,30,31,37,38,56,57,59,60,67,68,69,97,98,99,103,106,108,],[29,-8,57,-10,-12,-13,-14,-15,-9,-11,-16,-17,-18,-19,-20,29,29,29,-29,29,-50,]),'NUMBER':([21,23,27,28,29,30,31,37,38,40,45,46,47,48,49,56,57,59,60,61,62,63,64,65,66,67,68,69,70,72,78,79,97,98,99,103,106,108,],[41,41,-8,41,-10,-12,-13,-14,-15,41,41,41,41,41,41,-9,-11,-16,-17,41,41,41,41,41,41,-18,-19,-20,41,41,41,41,41,41,41,-29,41,-50,]),'TRUE':([21,23,27,28,29,30,31,37,38,40,45,46,47,48,49,56,57,59,60,61,62,63,64,65,66,67,68,69,70,72,78,79,97,98,99,103,106,108,],[42,42,-8,42,-10,-12,-13,-14,-15,42,42,42,42,42,42,-9,-11,-16,-17,42,42,42,42,42,42,-18,-19,-20,42,42,42,42,42,42,42,-29,42,-50,]),'FALSE':([21,23,27,28,29,30,31,37,38,40,45,46,47,48,49,56,57,59,60,61,62,63,64,65,66,67,68,69,70,72,78,79,97,98,99,103,106,108,],[43,43,-8,43,-10,-12,-13,-14,-15,43,43,43,43,43,43,-9,-11,-16,-17,43,43,43,43,43,43,-18,-19,-20,43,43,43,43,43,43,43,-29,43,-50,]),'MINUS':([21,23,27,28,29,30,31,33,37,38,39,40,41,42,43,45,46,47,48,49,52,53,56,57,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,85,86,87,88,89,90,91,92,94,97,98,99,103,106,108,],[40,40,-8,40,-10,-12,-13,62,-14,-15,-44,40,-41,-42,-43,40,40,40,40,40,62,-44,-9,-11,-16,-17,40,40,40,40,40,40,-18,-19,-20,40,-45,40,62,62,62,62,62,40,40,-40,-37,-38,-39,62,62,62,62,62,62,62,-49,40,40,40,-29,40,-50,]),'NOT':([21,23,27,28,29,30,31,37,38,40,45,46,47,48,49,56,57,59,60,61,62,63,64,65,66,67,68,69,70,72,78,79,97,98,99,103,106,108,],[44,44,-8,44,-10,-12,-13,-14,-15,44,44,44,44,44,44,-9,-11,-16,-17,44,44,44,44,44,44,-18,-19,-20,44,44,44,44,44,44,44,-29,44,-50,]),'PRE_ANNOTATION':([21,27,28,29,30,31,37,38,56,57,59,60,67,68,69,97,98,99,103,106,108,],[45,-8,45,-10,-12,-13,-14,-15,-9,-11,-16,-17,-18,-19,-20,45,45,45,-29,45,-50,]),'POST_ANNOTATION':([21,27,28,29,30,31,37,38,56,57,59,60,67,68,69,97,98,99,103,106,108,],[46,-8,46,-10,-12,-13,-14,-15,-9,-11,-16,-17,-18,-19,-20,46,46,46,-29,46,-50,]),'LOOP_ANNOTATION':([21,27,28,29,30,31,37,38,56,57,59,60,67,68,69,97,98,99,103,106,108,],[47,-8,47,-10,-12,-13,-14,-15,-9,-11,-16,-17,-18,-19,-20,47,47,47,-29,47,-50,]),'ASSUME':([21,27,28,29,30,31,37,38,56,57,59,60,67,68,69,97,98,99,103,106,108,],[48,-8,48,-10,-12,-13,-14,-15,-9,-11,-16,-17,-18,-19,-20,48,48,48,-29,48,-50,]),'RETURN':([21,27,28,29,30,31,37,38,56,57,59,60,67,68,69,97,98,99,103,106,108,],[49,-8,49,-10,-12,-13,-14,-15,-9,-11,-16,-17,-18,-19,-20,49,49,49,-29,49,-50,]),'WHILE':([21,27,28,29,30,31,37,38,56,57,59,60,67,68,69,97,98,99,103,106,108,],[50,-8,50,-10,-12,-13,-14,-15,-9,-11,-16,-17,-18,-19,-20,50,50,50,-29,50,-50,]),'IF':([21,27,28,29,30,31,37,38,56,57,59,60,67,68,69,97,98,99,103,106,108,],[51,-8,51,-10,-12,-13,-14,-15,-9,-11,-16,-17,-18,-19,-20,51,51,51,-29,51,-50,]),'RBRACE':([24,26,27,30,31,37,38,56,58,59,60,67,68,69,82,100,101,102,103,107,108,],[54,-25,-4,-12,-13,-14,-15,-5,-6,-16,-17,-18,-19,-20,-7,-24,103,104,-29,108,-50,]),'SEMICOLON':([29,32,33,34,35,36,39,41,42,43,53,57,71,73,74,75,76,77,80,83,84,85,86,87,88,89,93,94,],[58,59,60,67,68,69,-44,-41,-42,-43,-44,82,-45,-32,-33,-34,-35,-26,-40,-37,-38,-39,-46,-47,-48,-36,97,-49,]),'PLUS':([33,39,41,42,43,52,53,71,73,74,75,76,77,80,83,84,85,86,87,88,89,90,91,92,94,],[61,-44,-41,-42,-43,61,-44,-45,61,61,61,61,61,-40,-37,-38,-39,61,61,61,61,61,61,61,-49,]),'TIMES':([33,39,41,42,43,52,53,71,73,74,75,76,77,80,83,84,85,86,87,88,89,90,91,92,94,],[63,-44,-41,-42,-43,63,-44,-45,63,63,63,63,63,-40,63,63,-39,63,63,63,63,63,63,63,-49,]),'COMPARATOR':([33,39,41,42,43,52,53,71,73,74,75,76,77,80,83,84,85,86,87,88,89,90,91,92,94,],[64,-44,-41,-42,-43,64,-44,-45,64,64,64,64,64,-40,-37,-38,-39,None,64,64,64,64,64,64,-49,]),'BOOLEAN_OPERATOR':([33,39,41,42,43,52,53,71,73,74,75,76,77,80,83,84,85,86,87,88,89,90,91,92,94,],[65,-44,-41,-42,-43,65,-44,-45,65,65,65,65,65,-40,-37,-38,-39,-46,-47,65,65,65,65,65,-49,]),'IMPLIES':([33,39,41,42,43,52,53,71,73,74,75,76,77,80,83,84,85,86,87,88,89,90,91,92,94,],[66,-44,-41,-42,-43,66,-44,-45,66,66,66,66,66,-40,-37,-38,-39,-46,-47,-48,66,66,66,66,-49,]),'ASSIGNMENT':([39,],[70,]),'ELSE':([104,],[105,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,3,67,68,73,80,],[2,30,71,72,77,81,]),'statement':([0,3,67,68,73,80,],[3,3,3,3,3,3,]),'assignment':([0,3,67,68,73,80,],[4,4,4,4,4,4,]),'expression':([0,3,14,15,19,20,21,22,25,29,31,32,33,34,35,36,37,45,46,67,68,73,80,],[5,5,38,40,41,42,43,44,47,51,52,53,54,55,56,57,58,60,61,5,5,5,5,]),'annotation':([0,3,67,68,73,80,],[6,6,6,6,6,6,]),'while_loop':([0,3,67,68,73,80,],[7,7,7,7,7,7,]),'if_then_else':([0,3,67,68,73,80,],[8,8,8,8,8,8,]),'assumption':([0,3,67,68,73,80,],[9,9,9,9,9,9,]),'declaration':([0,3,62,67,68,70,73,80,],[10,10,66,10,10,66,10,10,]),'function_declaration':([0,3,67,68,73,80,],[11,11,11,11,11,11,]),'return_statement':([0,3,67,68,73,80,],[12,12,12,12,12,12,]),'parameter_list':([62,70,],[65,74,]),}
+_lr_goto_items = {'program':([0,],[1,]),'function_list':([0,],[2,]),'function_declaration':([0,2,],[3,7,]),'function_header':([0,2,],[4,4,]),'parameter_list':([8,55,],[11,81,]),'declaration':([8,18,55,],[12,22,12,]),'function_body':([21,],[24,]),'statement_list':([21,97,98,99,106,],[26,100,101,102,107,]),'statement_item':([21,28,97,98,99,106,],[27,56,27,27,27,27,]),'statement_prefix':([21,97,98,99,106,],[28,28,28,28,28,]),'statement':([21,28,97,98,99,106,],[30,30,30,30,30,30,]),'statement_with_no_semi_col':([21,28,97,98,99,106,],[31,31,31,31,31,31,]),'assignment':([21,28,97,98,99,106,],[32,32,32,32,32,32,]),'expression':([21,23,28,40,45,46,47,48,49,61,62,63,64,65,66,70,72,78,79,97,98,99,106,],[33,52,33,71,73,74,75,76,77,83,84,85,86,87,88,89,90,91,92,33,33,33,33,]),'annotation':([21,28,97,98,99,106,],[34,34,34,34,34,34,]),'assumption':([21,28,97,98,99,106,],[35,35,35,35,35,35,]),'return_statement':([21,28,97,98,99,106,],[36,36,36,36,36,36,]),'while_loop':([21,28,97,98,99,106,],[37,37,37,37,37,37,]),'if_then_else':([21,28,97,98,99,106,],[38,38,38,38,38,38,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,42 +27,54 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statement_list','program',1,'p_program','parser.py',69),
-  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',73),
-  ('statement_list -> statement statement_list','statement_list',2,'p_statement_list','parser.py',74),
-  ('statement -> assignment','statement',1,'p_statement','parser.py',81),
-  ('statement -> expression','statement',1,'p_statement','parser.py',82),
-  ('statement -> annotation','statement',1,'p_statement','parser.py',83),
-  ('statement -> while_loop','statement',1,'p_statement','parser.py',84),
-  ('statement -> if_then_else','statement',1,'p_statement','parser.py',85),
-  ('statement -> assumption','statement',1,'p_statement','parser.py',86),
-  ('statement -> declaration','statement',1,'p_statement','parser.py',87),
-  ('statement -> function_declaration','statement',1,'p_statement','parser.py',88),
-  ('statement -> return_statement','statement',1,'p_statement','parser.py',89),
-  ('function_declaration -> FUNCTION VARIABLE LPAREN parameter_list RPAREN LBRACE statement_list RBRACE','function_declaration',8,'p_function_declaration','parser.py',93),
-  ('return_statement -> RETURN expression','return_statement',2,'p_return_statement','parser.py',97),
-  ('parameter_list -> declaration','parameter_list',1,'p_parameter_list','parser.py',101),
-  ('parameter_list -> declaration COMMA parameter_list','parameter_list',3,'p_parameter_list','parser.py',102),
-  ('while_loop -> WHILE LPAREN expression RPAREN LBRACE statement_list RBRACE','while_loop',7,'p_while_loop','parser.py',109),
-  ('declaration -> BOOL_TYPE VARIABLE','declaration',2,'p_bool_declaration','parser.py',114),
-  ('declaration -> INT_TYPE VARIABLE','declaration',2,'p_int_declaration','parser.py',123),
-  ('annotation -> PRE_ANNOTATION expression','annotation',2,'p_annotation','parser.py',133),
-  ('annotation -> POST_ANNOTATION expression','annotation',2,'p_annotation','parser.py',134),
-  ('annotation -> ANNOTATION expression','annotation',2,'p_annotation','parser.py',135),
-  ('annotation -> LOOP_ANNOTATION expression','annotation',2,'p_annotation','parser.py',136),
-  ('assumption -> ASSUME expression','assumption',2,'p_assumption','parser.py',151),
-  ('assignment -> VARIABLE ASSIGNMENT expression','assignment',3,'p_assignment','parser.py',161),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_plus','parser.py',171),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_minus','parser.py',179),
-  ('expression -> expression TIMES expression','expression',3,'p_expression_times','parser.py',187),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_parenthesis_expr','parser.py',195),
-  ('expression -> NUMBER','expression',1,'p_expression_num','parser.py',199),
-  ('expression -> TRUE','expression',1,'p_expression_bool','parser.py',203),
-  ('expression -> FALSE','expression',1,'p_expression_bool','parser.py',204),
-  ('expression -> VARIABLE','expression',1,'p_expression_variable','parser.py',209),
-  ('expression -> MINUS expression','expression',2,'p_expr_uminus','parser.py',219),
-  ('expression -> expression COMPARATOR expression','expression',3,'p_formula_comparison','parser.py',226),
-  ('expression -> expression BOOLEAN_OPERATOR expression','expression',3,'p_formula_logic_op','parser.py',234),
-  ('expression -> expression IMPLIES expression','expression',3,'p_formula_implies','parser.py',242),
-  ('if_then_else -> IF LPAREN expression RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE','if_then_else',11,'p_if_then_else','parser.py',250),
+  ('program -> function_list','program',1,'p_program','parser.py',97),
+  ('function_list -> function_declaration','function_list',1,'p_function_list','parser.py',102),
+  ('function_list -> function_list function_declaration','function_list',2,'p_function_list','parser.py',103),
+  ('statement_list -> statement_item','statement_list',1,'p_statement_list','parser.py',113),
+  ('statement_list -> statement_prefix statement_item','statement_list',2,'p_statement_list','parser.py',114),
+  ('statement_list -> NOP SEMICOLON','statement_list',2,'p_statement_list_nop','parser.py',122),
+  ('statement_list -> statement_prefix NOP SEMICOLON','statement_list',3,'p_statement_list_nop','parser.py',123),
+  ('statement_prefix -> statement_item','statement_prefix',1,'p_statement_prefix','parser.py',130),
+  ('statement_prefix -> statement_prefix statement_item','statement_prefix',2,'p_statement_prefix','parser.py',131),
+  ('statement_prefix -> NOP','statement_prefix',1,'p_statement_prefix_nop','parser.py',139),
+  ('statement_prefix -> statement_prefix NOP','statement_prefix',2,'p_statement_prefix_nop','parser.py',140),
+  ('statement_item -> statement','statement_item',1,'p_statement_item','parser.py',147),
+  ('statement_item -> statement_with_no_semi_col','statement_item',1,'p_statement_item','parser.py',148),
+  ('statement_with_no_semi_col -> while_loop','statement_with_no_semi_col',1,'p_statement_with_no_semi_col','parser.py',153),
+  ('statement_with_no_semi_col -> if_then_else','statement_with_no_semi_col',1,'p_statement_with_no_semi_col','parser.py',154),
+  ('statement -> assignment SEMICOLON','statement',2,'p_statement','parser.py',160),
+  ('statement -> expression SEMICOLON','statement',2,'p_statement','parser.py',161),
+  ('statement -> annotation SEMICOLON','statement',2,'p_statement','parser.py',162),
+  ('statement -> assumption SEMICOLON','statement',2,'p_statement','parser.py',163),
+  ('statement -> return_statement SEMICOLON','statement',2,'p_statement','parser.py',164),
+  ('function_declaration -> function_header LPAREN parameter_list RPAREN LBRACE function_body RBRACE','function_declaration',7,'p_function_declaration','parser.py',168),
+  ('function_header -> BOOL_TYPE FUNCTION VARIABLE','function_header',3,'p_function_header','parser.py',193),
+  ('function_header -> INT_TYPE FUNCTION VARIABLE','function_header',3,'p_function_header','parser.py',194),
+  ('function_body -> DECLARE LPAREN parameter_list RPAREN SEMICOLON statement_list','function_body',6,'p_function_body','parser.py',207),
+  ('function_body -> statement_list','function_body',1,'p_function_body','parser.py',208),
+  ('return_statement -> RETURN expression','return_statement',2,'p_return_statememnt','parser.py',217),
+  ('parameter_list -> declaration','parameter_list',1,'p_parameter_list','parser.py',222),
+  ('parameter_list -> parameter_list COMMA declaration','parameter_list',3,'p_parameter_list','parser.py',223),
+  ('while_loop -> WHILE LPAREN expression RPAREN LBRACE statement_list RBRACE','while_loop',7,'p_while_loop','parser.py',231),
+  ('declaration -> BOOL_TYPE VARIABLE','declaration',2,'p_bool_declaration','parser.py',237),
+  ('declaration -> INT_TYPE VARIABLE','declaration',2,'p_int_declaration','parser.py',250),
+  ('annotation -> PRE_ANNOTATION expression','annotation',2,'p_annotation','parser.py',264),
+  ('annotation -> POST_ANNOTATION expression','annotation',2,'p_annotation','parser.py',265),
+  ('annotation -> LOOP_ANNOTATION expression','annotation',2,'p_annotation','parser.py',266),
+  ('assumption -> ASSUME expression','assumption',2,'p_assumption','parser.py',282),
+  ('assignment -> VARIABLE ASSIGNMENT expression','assignment',3,'p_assignment','parser.py',293),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_plus','parser.py',306),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_minus','parser.py',314),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_times','parser.py',322),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_parenthesis_expr','parser.py',330),
+  ('expression -> NUMBER','expression',1,'p_expression_num','parser.py',334),
+  ('expression -> TRUE','expression',1,'p_expression_bool','parser.py',338),
+  ('expression -> FALSE','expression',1,'p_expression_bool','parser.py',339),
+  ('expression -> VARIABLE','expression',1,'p_expression_variable','parser.py',344),
+  ('expression -> MINUS expression','expression',2,'p_expr_uminus','parser.py',357),
+  ('expression -> expression COMPARATOR expression','expression',3,'p_formula_comparison','parser.py',364),
+  ('expression -> expression BOOLEAN_OPERATOR expression','expression',3,'p_formula_logic_op','parser.py',372),
+  ('expression -> expression IMPLIES expression','expression',3,'p_formula_implies','parser.py',380),
+  ('expression -> NOT LPAREN expression RPAREN','expression',4,'p_formula_not','parser.py',388),
+  ('if_then_else -> IF LPAREN expression RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE','if_then_else',11,'p_if_then_else','parser.py',392),
 ]
@@ -0,0 +1,145 @@
+import json
+import threading
+import multiprocessing
+import multiprocessing.connection
+from collections import Counter
+from typing import Union, List, Dict
+
+import z3
+
+from solvers import make_solver, QF_NIA
+
+# Portfolio solving of the hard VCs: several z3 configurations race on the same VC, each in its own process,
+# the first definitive answer (sat or unsat) is kept and the other processes are killed. The winner of every
+# race is recorded, so the default configuration can be tuned on real workloads.
+
+# configuration name -> (tactics, None for z3.SolverFor(logic), solver parameters)
+PORTFOLIO_CONFIGURATIONS = {
+    "default": (None, {}),
+    "qfnia": (["simplify", "propagate-values", "qfnia"], {}),
+    "nlsat": (["simplify", "propagate-values", "qfnra-nlsat"], {}),
+    "seed-1": (None, {"random_seed": 1}),
+    "seed-2": (None, {"random_seed": 2}),
+    # bit-blasting under bounds on the variables, only its sat answers are definitive, z3 reports the others unknown
+    "bit-blast": (["simplify", "propagate-values", "nla2bv", "smt"], {}),
+}
+
+DEFAULT_PORTFOLIO = list(PORTFOLIO_CONFIGURATIONS)
+
+# logics of the VCs given to the portfolio, the others are decided quickly enough by a single solver
+PORTFOLIO_LOGICS = [QF_NIA]
+
+_STATUSES = {"sat": z3.sat, "unsat": z3.unsat, "unknown": z3.unknown}
+
+
+class UnknownConfiguration(Exception):
+    def __init__(self, name:str):
+        super().__init__(f"Unknown portfolio configuration {name}, expected one of "
+                         f"{', '.join(PORTFOLIO_CONFIGURATIONS)}.")
+
+
+def check_configurations(names:List[str]):
+    for name in names:
+        if name not in PORTFOLIO_CONFIGURATIONS:
+            raise UnknownConfiguration(name)
+
+
+def solve_configuration(smt2:str, logic:str, name:str, connection):
+    ''' runs in a racing process, sends (name, status, counterexample, reason of an unknown status) '''
+    from IR import model_assignment
+
+    tactics, parameters = PORTFOLIO_CONFIGURATIONS[name]
+    solver = make_solver(logic, tactics)
+    for parameter, value in parameters.items():
+        solver.set(parameter, value)
+    solver.from_string(smt2)
+    status = solver.check()
+    if status == z3.sat:
+        connection.send((name, "sat", model_assignment(solver.model()), None))
+    elif status == z3.unknown:
+        connection.send((name, "unknown", None, solver.reason_unknown()))
+    else:
+        connection.send((name, "unsat", None, None))
+    connection.close()
+
+
+_multiprocessing_context = None
+
+
+def get_multiprocessing_context():
+    ''' racing processes are forked from a server that already imported z3, which is much faster than starting
+    a new interpreter, and safe even when the races are started by several threads '''
+    global _multiprocessing_context
+    if _multiprocessing_context is None:
+        _multiprocessing_context = multiprocessing.get_context("forkserver")
+        _multiprocessing_context.set_forkserver_preload(["IR", "portfolio"])
+    return _multiprocessing_context
+
+
+def race(smt2:str, logic:str, configurations:List[str]) -> tuple:
+    ''' (status, counterexample, reason of an unknown status, winning configuration or None) of the SMT-LIB2
+    script, solved by every configuration in parallel until one of them answers sat or unsat '''
+    context = get_multiprocessing_context()
+    processes = {}
+    for name in configurations:
+        reader, writer = context.Pipe(duplex=False)
+        process = context.Process(target=solve_configuration, args=(smt2, logic, name, writer), daemon=True)
+        process.start()
+        # the reader sees the end of the pipe once the process exits, even if it crashes
+        writer.close()
+        processes[reader] = (name, process)
+
+    reasons = []
+    try:
+        while processes:
+            for reader in multiprocessing.connection.wait(list(processes)):
+                name, process = processes.pop(reader)
+                try:
+                    _, status, counter_example, reason = reader.recv()
+                except EOFError:
+                    process.join()
+                    reasons.append(f"{name}: exited with code {process.exitcode}")
+                    continue
+                finally:
+                    reader.close()
+                if status != "unknown":
+                    return _STATUSES[status], counter_example, None, name
+                reasons.append(f"{name}: {reason}")
+        return z3.unknown, None, "; ".join(reasons), None
+    finally:
+        for name, process in processes.values():
+            process.kill()
+        for reader, (name, process) in processes.items():
+            reader.close()
+            process.join()
+
+
+# (logic, winning configuration or None, duration in seconds) of every race
+portfolio_races = []
+_races_lock = threading.Lock()
+
+
+def reset_portfolio_statistics():
+    global portfolio_races
+    portfolio_races = []
+
+
+def record_race(logic:str, winner:Union[None, str], duration:float):
+    with _races_lock:
+        portfolio_races.append((logic, winner, duration))
+
+
+def print_portfolio_statistics():
+    if not portfolio_races:
+        return
+    wins = Counter(winner or "none" for logic, winner, duration in portfolio_races)
+    print("Portfolio wins:")
+    for winner, count in wins.most_common():
+        print(f"  {winner}: {count} VCs")
+
+
+def write_portfolio_log(file_path:str):
+    ''' append the races as JSON lines, the log of many runs shows which configuration to use by default '''
+    with open(file_path, "a") as f:
+        for logic, winner, duration in portfolio_races:
+            f.write(json.dumps({"logic": logic, "winner": winner, "duration": round(duration, 6)}) + "\n")
@@ -0,0 +1,133 @@
+import contextlib
+import os
+import tracemalloc
+from collections import Counter
+from typing import Union, List, Dict
+
+# Opt-in memory profiling of the verification phases with tracemalloc.
+# While it is enabled, every phase records the peak of the memory allocated during it and the memory it leaves
+# allocated (retained), per function, and the source lines that allocated the most in it.
+
+PARSE = "parse"
+VALIDATION = "validation"
+PATH_COLLECTION = "path collection"
+VC_BUILD = "VC build"
+SOLVE = "solve"
+
+PHASES = [PARSE, VALIDATION, PATH_COLLECTION, VC_BUILD, SOLVE]
+
+# allocations of the profiler itself are not reported
+_IGNORED_FILES = [tracemalloc.__file__, contextlib.__file__, os.path.abspath(__file__)]
+
+
+class PhaseMemory:
+    def __init__(self):
+        self.calls = 0
+        # bytes
+        self.peak = 0
+        self.retained = 0
+
+
+class MemoryProfiler:
+    ''' top is the number of allocation sites reported per phase, 0 skips the snapshots they are computed from.
+    Snapshots are much slower than measuring the peak and the retained memory, so the sites are only sampled
+    from the first site_samples runs of each phase for each function. '''
+
+    def __init__(self, top:int=10, site_samples:int=8):
+        self.top = top
+        self.site_samples = site_samples
+        # (phase, function name) -> PhaseMemory
+        self.phases = {}
+        # phase -> Counter of "file:line" -> bytes allocated and still alive at the end of the phase
+        self.sites = {}
+
+    def start(self):
+        tracemalloc.start()
+
+    def stop(self):
+        tracemalloc.stop()
+
+    def snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, file_name) for file_name in _IGNORED_FILES])
+
+    @contextlib.contextmanager
+    def phase(self, name:str, function_name:Union[None, str]=None):
+        ''' phases must not be nested, the peak of the outer one would be lost '''
+        memory = self.phases.setdefault((name, function_name), PhaseMemory())
+        before = self.snapshot() if self.top and memory.calls < self.site_samples else None
+        start_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            size, peak = tracemalloc.get_traced_memory()
+            memory.calls += 1
+            memory.peak = max(memory.peak, peak - start_size)
+            memory.retained += size - start_size
+            if before is not None:
+                sites = self.sites.setdefault(name, Counter())
+                for statistic in self.snapshot().compare_to(before, "lineno"):
+                    if statistic.size_diff > 0:
+                        sites[str(statistic.traceback[0])] += statistic.size_diff
+
+    def print_report(self):
+        print("Memory per phase:")
+        print(f"  {'phase':<16} {'function':<24} {'calls':>6} {'peak KiB':>10} {'retained KiB':>13}")
+        for (name, function_name), memory in sorted(self.phases.items(),
+                                                    key=lambda item: (PHASES.index(item[0][0])
+                                                                      if item[0][0] in PHASES else len(PHASES),
+                                                                      item[0][1] or "")):
+            print(f"  {name:<16} {function_name or '-':<24} {memory.calls:>6} {memory.peak / 1024:>10.1f} "
+                  f"{memory.retained / 1024:>13.1f}")
+        if self.top:
+            print(f"Top allocation sites per phase (first {self.site_samples} runs of each phase per function):")
+            for name in PHASES:
+                if name not in self.sites:
+                    continue
+                print(f"  {name}:")
+                for site, size in self.sites[name].most_common(self.top):
+                    print(f"    {site}: {size / 1024:.1f} KiB")
+
+
+_memory_profiler = None
+
+
+def enable_memory_profiling(top:int=10, site_samples:int=8) -> MemoryProfiler:
+    global _memory_profiler
+    _memory_profiler = MemoryProfiler(top, site_samples)
+    _memory_profiler.start()
+    return _memory_profiler
+
+
+def disable_memory_profiling():
+    global _memory_profiler
+    if _memory_profiler is not None:
+        _memory_profiler.stop()
+    _memory_profiler = None
+
+
+def get_memory_profiler() -> Union[None, MemoryProfiler]:
+    return _memory_profiler
+
+
+def memory_phase(name:str, function_name:Union[None, str]=None):
+    ''' context manager measuring a phase if the profiling is enabled, doing nothing otherwise '''
+    if _memory_profiler is None:
+        return contextlib.nullcontext()
+    return _memory_profiler.phase(name, function_name)
+
+
+def profiled_iterator(iterable, name:str, function_name:Union[None, str]=None):
+    ''' the items of iterable, producing each one counts as the phase (for the generator of the basic paths) '''
+    if _memory_profiler is None:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    while True:
+        with _memory_profiler.phase(name, function_name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
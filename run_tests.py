@@ -1,47 +1,249 @@
+import io
 import os
-from logging import exception
-from os import walk
-from IR import *
-from parser import *
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+import traceback
+import contextlib
+import importlib.util
+import unittest
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union, List, Dict
 
 SHOULD_PASS = "tests/should_pass"
 SHOULD_FAIL = "tests/should_fail"
 SHOULD_THROW_ERROR = "tests/should_throw_error"
+# test_*.py files of unittest test cases, for what a .tpl file can not check: the outputs of a run other than its
+# verdict, the tools around the verifier
+UNIT_TESTS = "tests/unit"
 
+CATEGORIES = [SHOULD_PASS, SHOULD_FAIL, SHOULD_THROW_ERROR, UNIT_TESTS]
 
-for (dirpath, dirnames, filenames) in walk(SHOULD_PASS):
-
-    for filename in filenames:
-        reset_functions()
-        print("")
-        print("### running tests for " + filename + " ###")
-        print("")
-        assert(generate_basic_paths(os.path.join(dirpath, filename)))
-        print("")
-        print("# Test passed for " + filename + " #")
-
-for (dirpath, dirnames, filenames) in walk(SHOULD_FAIL):
-    for filename in filenames:
-        reset_functions()
-        print("")
-        print("### running tests for " + filename + " ###")
-        print("")
-        assert (not(generate_basic_paths(os.path.join(dirpath, filename))))
-        print("# Test passed for " + filename + " #")
-
-for (dirpath, dirnames, filenames) in walk(SHOULD_THROW_ERROR):
-    for filename in filenames:
-        reset_functions()
-        print("")
-        print("### running tests for " + filename + " ###")
-        print("")
-        try:
-            generate_basic_paths(os.path.join(dirpath, filename))
-        except BaseException as e:
-            assert(True)
+# a test file can have a JSON file of the same name with this extension instead of .tpl, the keyword arguments of
+# generate_basic_paths it is verified with, e.g. {"bit_width": 8}, or a list of them, one test each
+OPTIONS_EXTENSION = ".options.json"
+
+# a test over its budget fails, the budget is the baseline time times the factor, plus the slack in seconds
+DEFAULT_BUDGET_FACTOR = 2.0
+DEFAULT_BUDGET_SLACK = 1.0
+
+
+class TestResult:
+    def __init__(self, file_path:str, category:str, options:dict, passed:bool, message:str, output:str,
+                 wall_time:float, solver_time:float):
+        self.file_path = file_path
+        self.category = category
+        self.options = options
+        self.passed = passed
+        self.message = message
+        self.output = output
+        self.wall_time = wall_time
+        self.solver_time = solver_time
+
+    @property
+    def name(self) -> str:
+        return test_name(self.file_path, self.options)
+
+
+def collect_tests(categories:List[str]) -> List[tuple]:
+    ''' (file path, category, options) of every .tpl file of the categories, once for each of its options, and of
+    every test_*.py file of UNIT_TESTS, a single file is tested against the category of its directory '''
+    tests = []
+    for category in categories:
+        if os.path.isfile(category):
+            file_paths = [category]
+            category = os.path.normpath(os.path.dirname(category))
+        else:
+            file_paths = [os.path.join(dirpath, filename) for (dirpath, dirnames, filenames) in os.walk(category)
+                          for filename in sorted(filenames) if is_test_file(filename, category)]
+        for file_path in file_paths:
+            if category == UNIT_TESTS:
+                tests.append((file_path, category, {}))
+            else:
+                tests.extend((file_path, category, options) for options in test_options(file_path))
+    return tests
+
+
+def is_test_file(filename:str, category:str) -> bool:
+    if category == UNIT_TESTS:
+        return filename.startswith("test_") and filename.endswith(".py")
+    return filename.endswith(".tpl")
+
+
+def test_options(file_path:str) -> List[dict]:
+    ''' keyword arguments of generate_basic_paths for each test of the test file, see OPTIONS_EXTENSION '''
+    try:
+        with open(file_path[:-len(".tpl")] + OPTIONS_EXTENSION) as f:
+            options = json.load(f)
+    except FileNotFoundError:
+        return [{}]
+    return options if isinstance(options, list) else [options]
+
+
+def test_name(file_path:str, options:dict) -> str:
+    ''' the file path, followed by the options if there are some, e.g. tests/should_pass/abs.tpl {"jobs": 4} '''
+    return f"{file_path} {json.dumps(options, sort_keys=True)}" if options else file_path
+
+
+def run_test(file_path:str, category:str, options:dict, recursion_depth:Union[None, int]=None) -> TestResult:
+    ''' run one test file and compare the outcome with its category, runs in a fresh process, with a recursion
+    depth the passes recurse down to that many levels instead of RECURSION_DEPTH '''
+    from solvers import get_solver_statistics
+    from expr import set_recursion_depth
+
+    if recursion_depth is not None:
+        set_recursion_depth(recursion_depth)
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        if category == UNIT_TESTS:
+            passed, message = run_unit_test(file_path, output)
+        else:
+            passed, message = verify(file_path, category, options, output)
+    wall_time = time.perf_counter() - start
+    solver_time = sum(duration for count, duration in get_solver_statistics().values())
+    return TestResult(file_path, category, options, passed, message, output.getvalue(), wall_time, solver_time)
+
+
+def verify(file_path:str, category:str, options:dict, output:io.StringIO) -> tuple:
+    ''' (passed, message) of a .tpl test, verified with the options '''
+    from IR import generate_basic_paths
+
+    try:
+        is_valid = generate_basic_paths(file_path, **options)
+    except BaseException as e:
+        if category == SHOULD_THROW_ERROR:
             print(e)
+            return True, ""
+        traceback.print_exc(file=output)
+        return False, f"unexpected {type(e).__name__}: {e}"
+    if category == SHOULD_PASS:
+        return is_valid, "" if is_valid else "verification failed"
+    if category == SHOULD_FAIL:
+        return not is_valid, "" if not is_valid else "verification succeeded"
+    return False, "no error was raised"
+
+
+def run_unit_test(file_path:str, output:io.StringIO) -> tuple:
+    ''' (passed, message) of a test_*.py file, its test cases are run by unittest '''
+    try:
+        module_name = os.path.splitext(os.path.basename(file_path))[0]
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+    except BaseException as e:
+        traceback.print_exc(file=output)
+        return False, f"unexpected {type(e).__name__}: {e}"
+    result = unittest.TextTestRunner(stream=output, verbosity=2).run(suite)
+    if result.wasSuccessful():
+        return True, ""
+    return False, f"{len(result.failures)} failures, {len(result.errors)} errors"
+
+
+def run_tests(tests:List[tuple], jobs:Union[None, int]=None,
+              recursion_depth:Union[None, int]=None) -> List[TestResult]:
+    ''' every test runs in its own process, so no parser or solver state is shared between files '''
+    jobs = jobs or os.cpu_count() or 1
+    # the processes are forked from a server that already imported the verifier, which is much faster than
+    # starting a new interpreter for every test
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(["IR"])
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, max_tasks_per_child=1) as executor:
+        futures = [executor.submit(run_test, file_path, category, options, recursion_depth)
+                   for file_path, category, options in tests]
+        return [future.result() for future in futures]
+
+
+def check_budgets(results:List[TestResult], baseline:Dict[str, float], factor:float, slack:float):
+    ''' fail the tests slower than their baseline allows '''
+    for result in results:
+        if result.name not in baseline:
+            continue
+        budget = baseline[result.name] * factor + slack
+        if result.passed and result.wall_time > budget:
+            result.passed = False
+            result.message = f"over its time budget: {result.wall_time:.3f}s > {budget:.3f}s " \
+                             f"(baseline {baseline[result.name]:.3f}s)"
+
+
+def write_junit_xml(results:List[TestResult], file_path:str):
+    test_suites = ElementTree.Element("testsuites")
+    for category in CATEGORIES:
+        category_results = [result for result in results if result.category == category]
+        test_suite = ElementTree.SubElement(test_suites, "testsuite", {
+            "name": category,
+            "tests": str(len(category_results)),
+            "failures": str(sum(not result.passed for result in category_results)),
+            "time": f"{sum(result.wall_time for result in category_results):.3f}",
+        })
+        for result in category_results:
+            test_case = ElementTree.SubElement(test_suite, "testcase", {
+                "classname": category.replace("/", "."),
+                "name": test_name(os.path.basename(result.file_path), result.options),
+                "file": result.file_path,
+                "time": f"{result.wall_time:.3f}",
+            })
+            properties = ElementTree.SubElement(test_case, "properties")
+            ElementTree.SubElement(properties, "property", {"name": "solver_time",
+                                                            "value": f"{result.solver_time:.3f}"})
+            if not result.passed:
+                failure = ElementTree.SubElement(test_case, "failure", {"message": result.message})
+                failure.text = result.output
+            ElementTree.SubElement(test_case, "system-out").text = result.output
+    ElementTree.ElementTree(test_suites).write(file_path, encoding="utf-8", xml_declaration=True)
+
+
+def main(argv:List[str]) -> int:
+    arg_parser = argparse.ArgumentParser(description="Run the tests in parallel.")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=None, help="number of parallel test processes")
+    arg_parser.add_argument("-v", "--verbose", action="store_true", help="print the output of every test")
+    arg_parser.add_argument("--junit-xml", default=None, metavar="FILE", help="write the results as JUnit XML")
+    arg_parser.add_argument("--baseline", default=None, metavar="FILE",
+                            help="JSON file of the wall time of each test, a test much slower than it fails")
+    arg_parser.add_argument("--record-baseline", default=None, metavar="FILE",
+                            help="write the wall time of each test to this JSON file")
+    arg_parser.add_argument("--budget-factor", type=float, default=DEFAULT_BUDGET_FACTOR,
+                            help="a test fails if it takes more than FACTOR times its baseline, plus the slack")
+    arg_parser.add_argument("--budget-slack", type=float, default=DEFAULT_BUDGET_SLACK,
+                            help="seconds added to every budget, so that short tests do not fail on noise")
+    arg_parser.add_argument("--recursion-depth", type=int, default=None, metavar="N",
+                            help="recurse down to N levels in the passes over the programs and the VCs, "
+                                 "0 runs them on their explicit stacks only")
+    arg_parser.add_argument("paths", nargs="*", default=CATEGORIES,
+                            help="test categories or test files to run (default: all the categories)")
+    args = arg_parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_tests(collect_tests(args.paths), args.jobs, args.recursion_depth)
+    wall_time = time.perf_counter() - start
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            check_budgets(results, json.load(f), args.budget_factor, args.budget_slack)
+    if args.record_baseline is not None:
+        with open(args.record_baseline, "w") as f:
+            json.dump({result.name: round(result.wall_time, 6) for result in results}, f, indent=2,
+                      sort_keys=True)
+    if args.junit_xml is not None:
+        write_junit_xml(results, args.junit_xml)
+
+    for result in results:
+        if args.verbose or not result.passed:
             print("")
-            print("# Test passed for " + filename + " #")
-        else:
-            assert(False)
+            print("### output of " + result.name + " ###")
+            print(result.output)
+        status = "PASS" if result.passed else "FAIL"
+        print(f"{status} {result.name} ({result.wall_time:.3f}s, solver {result.solver_time:.3f}s)"
+              + (f": {result.message}" if result.message else ""))
+
+    failures = sum(not result.passed for result in results)
+    print(f"{len(results) - failures} passed, {failures} failed in {wall_time:.3f}s")
+    return 1 if failures else 0
+
 
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,350 @@
+import io
+import os
+import sys
+import json
+import time
+import hashlib
+import socket
+import argparse
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, List, Dict
+
+from events import add_event_listener, remove_event_listener
+from IR import load_source, verify_function, DFS, BFS, SUBSTITUTION, SSA
+from metrics import PrometheusExporter
+from parser import reset_functions
+import portfolio
+from portfolio import check_configurations, reset_portfolio_statistics, record_race, print_portfolio_statistics, \
+    DEFAULT_PORTFOLIO
+from solvers import reset_solver_statistics, get_solver_statistics, add_solver_statistics, print_solver_statistics, \
+    parse_function_tactics, InvalidFunctionTactics
+from vectorized import DEFAULT_EXHAUSTIVE_MAX_VARIABLES, DEFAULT_RANDOM_TESTS
+
+# Sharded verification through a queue directory on a filesystem shared by several machines.
+# The coordinator (submit) writes one job manifest per function into pending/, each worker claims jobs by
+# renaming them into claimed/, which only one of the workers racing for a job can do, verifies the function and
+# writes its result into results/. merge then prints the report generate_basic_paths gives for each file.
+# Renames are only atomic within one filesystem, the whole queue must live on the same one.
+
+PENDING = "pending"
+CLAIMED = "claimed"
+RESULTS = "results"
+SOURCES = "sources"
+
+QUEUE_DIRECTORIES = [PENDING, CLAIMED, RESULTS, SOURCES]
+
+# list of the submitted files, in order
+FILES_MANIFEST = "files.json"
+
+
+class QueueNotEmpty(Exception):
+    def __init__(self, message="The queue directory already holds jobs, merge them and use another directory."):
+        super().__init__(message)
+
+
+def job_name(file_index:int, function_index:int) -> str:
+    return f"{file_index:06d}-{function_index:04d}.json"
+
+
+def write_json_atomically(file_path:str, data):
+    ''' write then rename, so that a reader on another machine never sees a partial file '''
+    temporary_path = f"{file_path}.{socket.gethostname()}.{os.getpid()}.tmp"
+    with open(temporary_path, "w") as f:
+        json.dump(data, f)
+    os.replace(temporary_path, file_path)
+
+
+def read_json(file_path:str):
+    with open(file_path) as f:
+        return json.load(f)
+
+
+def submit(queue_dir:str, files:List[str], options:Dict[str, object]) -> int:
+    ''' write a job for every function of the files, returns the number of jobs. A file that can not be
+    parsed or validated gets no job, its error is reported by merge '''
+    for directory in QUEUE_DIRECTORIES:
+        os.makedirs(os.path.join(queue_dir, directory), exist_ok=True)
+    if os.path.exists(os.path.join(queue_dir, FILES_MANIFEST)):
+        raise QueueNotEmpty()
+
+    jobs = 0
+    files_manifest = []
+    for file_index, file_path in enumerate(files):
+        with open(file_path) as f:
+            source = f.read()
+        try:
+            # the function names of a program are registered globally, they only have to be unique per file
+            reset_functions()
+            program = load_source(source)
+        except Exception as e:
+            files_manifest.append({"file": file_path, "functions": [], "error": f"{type(e).__name__}: {e}"})
+            continue
+        source_path = os.path.join(queue_dir, SOURCES, f"{file_index:06d}.tpl")
+        with open(source_path, "w") as f:
+            f.write(source)
+        function_names = [function.function_name for function in program.statements]
+        files_manifest.append({"file": file_path, "functions": function_names, "error": None})
+        for function_index, function_name in enumerate(function_names):
+            write_json_atomically(os.path.join(queue_dir, PENDING, job_name(file_index, function_index)), {
+                "file": file_path,
+                "file_index": file_index,
+                "function": function_name,
+                "function_index": function_index,
+                "options": options,
+            })
+            jobs += 1
+    # written last, a worker started early finds the jobs and merge only starts from a complete submission
+    write_json_atomically(os.path.join(queue_dir, FILES_MANIFEST), files_manifest)
+    return jobs
+
+
+def claim(queue_dir:str) -> Union[None, str]:
+    ''' name of a job moved from pending/ to claimed/ by this process, None once there are no pending jobs '''
+    for name in sorted(os.listdir(os.path.join(queue_dir, PENDING))):
+        if not name.endswith(".json"):
+            continue
+        pending_path = os.path.join(queue_dir, PENDING, name)
+        try:
+            # the modification time of a claimed job is its claim time, see requeue. It is set before the rename,
+            # which keeps it, so a job is never seen in claimed/ with the time it was submitted or requeued at
+            os.utime(pending_path)
+            os.rename(pending_path, os.path.join(queue_dir, CLAIMED, name))
+        except FileNotFoundError:
+            # claimed by another worker first
+            continue
+        return name
+    return None
+
+
+def run_job(queue_dir:str, name:str, worker:str, cache_dir:Union[None, str]=None,
+            executor:Union[None, ThreadPoolExecutor]=None, loaded:Union[None, dict]=None) -> dict:
+    ''' verify the function of a claimed job and write its result, loaded keeps the last program parsed by
+    the worker, the jobs of a file are claimed one after the other so the file is mostly parsed once. The VCs are
+    deduplicated within the function only, the other jobs of the file may run on other workers: the digests of its
+    VCs are in the result so that merge can tell how many were checked again '''
+    manifest = read_json(os.path.join(queue_dir, CLAIMED, name))
+    options = manifest["options"]
+    loaded = {} if loaded is None else loaded
+    vc_results = {} if options["deduplicate"] else None
+
+    reset_solver_statistics()
+    reset_portfolio_statistics()
+    output = io.StringIO()
+    start = time.perf_counter()
+    error = None
+    is_valid = False
+    with contextlib.redirect_stdout(output):
+        try:
+            if loaded.get("file_index") != manifest["file_index"]:
+                with open(os.path.join(queue_dir, SOURCES, f"{manifest['file_index']:06d}.tpl")) as f:
+                    reset_functions()
+                    loaded["program"] = load_source(f.read(), cache_dir)
+                loaded["file_index"] = manifest["file_index"]
+            function = loaded["program"].statements[manifest["function_index"]]
+            is_valid = verify_function(function, manifest["file"], None, options["function_tactics"],
+                                       options["exhaustive_max_variables"], options["random_tests"],
+                                       options["replay"], options["prune"], options["path_order"],
+                                       options["max_paths"], vc_results,
+                                       executor, options["encoding"], options["portfolio"],
+                                       options["bit_width"], options.get("intervals", True))
+        except Exception as e:
+            loaded.clear()
+            error = f"{type(e).__name__}: {e}"
+
+    result = {
+        "file_index": manifest["file_index"],
+        "function": manifest["function"],
+        "function_index": manifest["function_index"],
+        "valid": is_valid,
+        "error": error,
+        "output": output.getvalue(),
+        "statistics": get_solver_statistics(),
+        "races": portfolio.portfolio_races,
+        "vcs": sorted(vc_digest(vc) for vc in vc_results) if vc_results is not None else [],
+        "worker": worker,
+        "duration": time.perf_counter() - start,
+    }
+    write_json_atomically(os.path.join(queue_dir, RESULTS, name), result)
+    try:
+        os.remove(os.path.join(queue_dir, CLAIMED, name))
+    except FileNotFoundError:
+        # requeued while it was running, the result of the other run replaces this one
+        pass
+    return result
+
+
+def vc_digest(canonical_vc:str) -> str:
+    return hashlib.sha1(canonical_vc.encode()).hexdigest()
+
+
+def work(queue_dir:str, worker:str, cache_dir:Union[None, str]=None, max_jobs:Union[None, int]=None,
+         jobs:int=1, metrics_file:Union[None, str]=None) -> int:
+    ''' claim and run jobs until there are none left (or max_jobs were run), returns the number of jobs run,
+    jobs is the number of threads checking the VCs of a function, the metrics of every job are added to
+    metrics_file if one is given (see metrics.py) '''
+    executor = ThreadPoolExecutor(jobs) if jobs > 1 else None
+    exporter = None
+    if metrics_file is not None:
+        exporter = PrometheusExporter()
+        add_event_listener(exporter)
+    loaded = {}
+    count = 0
+    try:
+        while max_jobs is None or count < max_jobs:
+            name = claim(queue_dir)
+            if name is None:
+                break
+            result = run_job(queue_dir, name, worker, cache_dir, executor, loaded)
+            count += 1
+            if exporter is not None:
+                exporter.write(metrics_file)
+            status = "error" if result["error"] else "valid" if result["valid"] else "invalid"
+            print(f"{worker}: {name} {result['function']} {status} ({result['duration']:.3f}s)")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if exporter is not None:
+            remove_event_listener(exporter)
+    return count
+
+
+def requeue(queue_dir:str, older_than:float) -> int:
+    ''' move back to pending/ the jobs claimed more than older_than seconds ago, whose worker probably died '''
+    count = 0
+    now = time.time()
+    claimed_dir = os.path.join(queue_dir, CLAIMED)
+    for name in sorted(os.listdir(claimed_dir)):
+        claimed_path = os.path.join(claimed_dir, name)
+        try:
+            if name.endswith(".json") and now - os.path.getmtime(claimed_path) > older_than:
+                os.rename(claimed_path, os.path.join(queue_dir, PENDING, name))
+                count += 1
+        except FileNotFoundError:
+            # finished in the meantime
+            pass
+    return count
+
+
+def merge(queue_dir:str) -> bool:
+    ''' print the report of every submitted file from the results of its jobs, in the order of the submission,
+    true if every function of every file was verified. Each job deduplicates the VCs of its own function only, so
+    a VC equal to one of another function of the file is checked again and printed without (same VC as ...),
+    unlike in the report of main.py: the number of such VCs is printed with the statistics of the file '''
+    is_invalid = False
+    for file_index, file_entry in enumerate(read_json(os.path.join(queue_dir, FILES_MANIFEST))):
+        print("File: " + file_entry["file"])
+        if file_entry["error"] is not None:
+            is_invalid = True
+            print("Error: " + file_entry["error"])
+            continue
+        reset_solver_statistics()
+        reset_portfolio_statistics()
+        checked_vcs = set()
+        checked_again = 0
+        for function_index, function_name in enumerate(file_entry["functions"]):
+            name = job_name(file_index, function_index)
+            try:
+                result = read_json(os.path.join(queue_dir, RESULTS, name))
+            except FileNotFoundError:
+                is_invalid = True
+                print(f"Missing result! {function_name} (job {name}) was not verified")
+                continue
+            print(result["output"], end="")
+            if result["error"] is not None:
+                print("Error: " + result["error"])
+            if not result["valid"]:
+                is_invalid = True
+            add_solver_statistics(result["statistics"])
+            for race in result["races"]:
+                record_race(*race)
+            vcs = set(result.get("vcs", []))
+            checked_again += len(vcs & checked_vcs)
+            checked_vcs |= vcs
+        if checked_again:
+            print(f"{checked_again} VCs equal to a VC of another function were checked again by their own job, "
+                  f"main.py reports them as (same VC as ...)")
+        print_solver_statistics()
+        print_portfolio_statistics()
+    return not is_invalid
+
+
+def main(argv:List[str]) -> int:
+    arg_parser = argparse.ArgumentParser(description="Verify .tpl files on several machines through a queue "
+                                                     "directory on a shared filesystem.")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+
+    submit_parser = commands.add_parser("submit", help="write a job for every function of the files")
+    submit_parser.add_argument("queue", help="queue directory")
+    submit_parser.add_argument("files", nargs="+", help=".tpl files")
+    submit_parser.add_argument("--tactics", action="append", default=[], metavar="FUNCTION=TACTIC,...",
+                               help="see main.py")
+    submit_parser.add_argument("--exhaustive-max-variables", type=int, default=DEFAULT_EXHAUSTIVE_MAX_VARIABLES,
+                               metavar="N", help="see main.py")
+    submit_parser.add_argument("--random-tests", type=int, default=DEFAULT_RANDOM_TESTS, metavar="N",
+                               help="see main.py")
+    submit_parser.add_argument("--no-pruning", action="store_true", help="see main.py")
+    submit_parser.add_argument("--no-deduplication", action="store_true", help="see main.py")
+    submit_parser.add_argument("--no-intervals", action="store_true", help="see main.py")
+    submit_parser.add_argument("--path-order", choices=[DFS, BFS], default=DFS, help="see main.py")
+    submit_parser.add_argument("--max-paths", type=int, default=None, metavar="N", help="see main.py")
+    submit_parser.add_argument("--encoding", choices=[SUBSTITUTION, SSA], default=SUBSTITUTION, help="see main.py")
+    submit_parser.add_argument("--bit-width", type=int, default=None, metavar="N", help="see main.py")
+    submit_parser.add_argument("--replay", action="store_true", help="see main.py")
+    submit_parser.add_argument("--portfolio", nargs="?", const=",".join(DEFAULT_PORTFOLIO), default=None,
+                               metavar="CONFIG,...", help="see main.py")
+
+    work_parser = commands.add_parser("work", help="run pending jobs until there are none left")
+    work_parser.add_argument("queue", help="queue directory")
+    work_parser.add_argument("--worker", default=f"{socket.gethostname()}-{os.getpid()}",
+                             help="name of the worker in the results (default: host name and process id)")
+    work_parser.add_argument("--cache-dir", default=None, help="see main.py")
+    work_parser.add_argument("--max-jobs", type=int, default=None, metavar="N", help="stop after N jobs")
+    work_parser.add_argument("--jobs", type=int, default=1, metavar="N", help="see main.py")
+    work_parser.add_argument("--metrics-file", default=None, metavar="FILE", help="see main.py")
+
+    requeue_parser = commands.add_parser("requeue", help="make the jobs of dead workers pending again")
+    requeue_parser.add_argument("queue", help="queue directory")
+    requeue_parser.add_argument("--older-than", type=float, required=True, metavar="SECONDS",
+                                help="requeue the jobs claimed more than SECONDS ago")
+
+    merge_parser = commands.add_parser("merge", help="print the report of the submitted files")
+    merge_parser.add_argument("queue", help="queue directory")
+
+    args = arg_parser.parse_args(argv)
+
+    if args.command == "submit":
+        try:
+            function_tactics = parse_function_tactics(args.tactics)
+        except InvalidFunctionTactics as e:
+            arg_parser.error(str(e))
+        portfolio = args.portfolio.split(",") if args.portfolio is not None else None
+        if portfolio is not None:
+            check_configurations(portfolio)
+        jobs = submit(args.queue, args.files, {
+            "function_tactics": function_tactics,
+            "exhaustive_max_variables": args.exhaustive_max_variables,
+            "random_tests": args.random_tests,
+            "replay": args.replay,
+            "prune": not args.no_pruning,
+            "deduplicate": not args.no_deduplication,
+            "intervals": not args.no_intervals,
+            "path_order": args.path_order,
+            "max_paths": args.max_paths,
+            "encoding": args.encoding,
+            "portfolio": portfolio,
+            "bit_width": args.bit_width,
+        })
+        print(f"Submitted {jobs} jobs")
+    elif args.command == "work":
+        jobs = work(args.queue, args.worker, args.cache_dir, args.max_jobs, args.jobs, args.metrics_file)
+        print(f"{args.worker}: ran {jobs} jobs")
+    elif args.command == "requeue":
+        print(f"Requeued {requeue(args.queue, args.older_than)} jobs")
+    elif args.command == "merge":
+        return 0 if merge(args.queue) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
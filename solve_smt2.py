@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union
+
+# Offline solving of the VCs exported with `python3 main.py <file> --smt2-dir <dir>`.
+# Every .smt2 file asserts the negation of one VC, so "unsat" means the basic path is valid
+# and "sat" means it is invalid (the model is the counter example).
+
+
+class SolverNotFound(Exception):
+    def __init__(self, message="z3 binary not found, use --z3 to give its path."):
+        super().__init__(message)
+
+
+class SolveResult:
+    def __init__(self, file_path:str, status:str, model:str, duration:float):
+        self.file_path = file_path
+        self.status = status
+        self.model = model
+        self.duration = duration
+
+    def __repr__(self):
+        return f"{self.file_path}: {self.status} ({self.duration:.3f}s)"
+
+
+def collect_smt2_files(paths:List[str]) -> List[str]:
+    ''' expand directories into the sorted list of the .smt2 files they contain '''
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for (dirpath, dirnames, filenames) in os.walk(path):
+                files.extend(os.path.join(dirpath, filename) for filename in filenames
+                             if filename.endswith(".smt2"))
+        else:
+            files.append(path)
+    return sorted(files)
+
+
+def solve_file(file_path:str, z3_binary:str="z3", timeout:Union[None, int]=None) -> SolveResult:
+    ''' run the z3 binary on a single SMT-LIB2 file '''
+    command = [z3_binary, "-model"]
+    if timeout is not None:
+        command.append(f"-T:{timeout}")
+    command.append(file_path)
+
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True)
+    except FileNotFoundError:
+        raise SolverNotFound()
+    duration = time.perf_counter() - start
+
+    lines = completed.stdout.strip().splitlines()
+    status = lines[0].strip() if lines else "error"
+    if status not in ("sat", "unsat", "unknown", "timeout"):
+        status = "error"
+    model = "\n".join(lines[1:]) if status == "sat" else ""
+    return SolveResult(file_path, status, model, duration)
+
+
+def solve_files(files:List[str], z3_binary:str="z3", jobs:Union[None, int]=None,
+                timeout:Union[None, int]=None) -> List[SolveResult]:
+    ''' solve the files in parallel z3 subprocesses, results are returned in the order of files '''
+    jobs = jobs or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(lambda file_path: solve_file(file_path, z3_binary, timeout), files))
+
+
+def main(argv:List[str]) -> int:
+    arg_parser = argparse.ArgumentParser(description="Solve exported VCs with a local z3 binary.")
+    arg_parser.add_argument("paths", nargs="+", help=".smt2 files or directories containing them")
+    arg_parser.add_argument("--z3", default="z3", help="path of the z3 binary")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=None, help="number of parallel z3 processes")
+    arg_parser.add_argument("--timeout", type=int, default=None, help="per file timeout in seconds")
+    args = arg_parser.parse_args(argv)
+
+    files = collect_smt2_files(args.paths)
+    start = time.perf_counter()
+    results = solve_files(files, args.z3, args.jobs, args.timeout)
+    wall_time = time.perf_counter() - start
+
+    is_invalid = False
+    for result in results:
+        if result.status == "unsat":
+            print(f"{result.file_path}: Valid! ({result.duration:.3f}s)")
+        elif result.status == "sat":
+            is_invalid = True
+            print(f"{result.file_path}: Invalid! ({result.duration:.3f}s)")
+            print("Counter example: ", result.model)
+        else:
+            is_invalid = True
+            print(f"{result.file_path}: {result.status} ({result.duration:.3f}s)")
+
+    print(f"Solved {len(results)} VCs in {wall_time:.3f}s")
+    return 1 if is_invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
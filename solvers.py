@@ -0,0 +1,331 @@
+import operator
+import threading
+import time
+from typing import Union, List, Dict
+
+import z3
+
+from expr import *
+
+# Every VC is classified by the logic it needs and checked by a solver configured for that logic.
+
+QF_BOOL = "QF_BOOL"
+QF_LIA = "QF_LIA"
+QF_NIA = "QF_NIA"
+# INT encoded as fixed-width bit-vectors, see Z3Translator
+QF_BV = "QF_BV"
+
+# logic -> tactic pipeline used instead of z3.SolverFor(logic), z3 has no dedicated propositional logic
+DEFAULT_TACTICS = {
+    QF_BOOL: ["simplify", "propagate-values", "sat"],
+}
+
+# logic -> logic declared in the exported SMT-LIB2 files
+SMTLIB_LOGICS = {
+    QF_BOOL: "QF_UF",
+    QF_LIA: "QF_LIA",
+    QF_NIA: "QF_NIA",
+    QF_BV: "QF_BV",
+}
+
+# flags computed by the LogicClassifier for each subexpression
+_INT = 1
+_NONLINEAR = 2
+_VARIABLE = 4
+
+
+class LogicClassifier(Fold):
+    ''' smallest logic among QF_BOOL, QF_LIA and QF_NIA the expression belongs to '''
+
+    def classify(self, expression) -> str:
+        flags = self.visit(expression)
+        if flags & _NONLINEAR:
+            return QF_NIA
+        if flags & _INT:
+            return QF_LIA
+        return QF_BOOL
+
+    def visit_IntBinaryExpression(self, expression, left:int, right:int) -> int:
+        flags = left | right | _INT
+        # a product is linear as long as one of its factors is a constant
+        if expression.op == BinaryOperator.TIMES and left & _VARIABLE and right & _VARIABLE:
+            flags |= _NONLINEAR
+        return flags
+
+    def visit_BinaryExpression(self, expression, left:int, right:int) -> int:
+        return left | right
+
+    def visit_UnaryExpression(self, expression, flags:int) -> int:
+        return flags | _INT if expression.type == DataType.INT else flags
+
+    def visit_VariableExpression(self, expression) -> int:
+        return _VARIABLE | _INT if expression.type == DataType.INT else _VARIABLE
+
+    def visit_ReturnValueVariableExpression(self, expression) -> int:
+        return _VARIABLE | _INT if expression.type == DataType.INT else _VARIABLE
+
+    def visit_LiteralExpression(self, expression) -> int:
+        return _INT if expression.type == DataType.INT else 0
+
+
+_logic_classifier = LogicClassifier()
+
+
+def classify_logic(expression, bit_width:Union[None, int]=None) -> str:
+    ''' with a bit width the integers are bit-vectors, and every VC using them is QF_BV '''
+    logic = _logic_classifier.classify(expression)
+    if bit_width is not None and logic != QF_BOOL:
+        return QF_BV
+    return logic
+
+
+def has_arithmetic(expression) -> bool:
+    ''' true if the expression has an arithmetic operation, which could overflow '''
+    stack = [expression]
+    while stack:
+        expression = stack.pop()
+        if isinstance(expression, (IntBinaryExpression, IntUnaryExpression)):
+            return True
+        stack.extend(expression.children())
+    return False
+
+
+class Z3Translator(Fold):
+    ''' z3 term of an expression in the given z3 context (the global one for None), every variable is a z3
+    constant of its type. Terms of different contexts can not be mixed, and a context must not be used by two
+    threads at the same time.
+
+    With a bit width, INT is a signed bit-vector of that width whose arithmetic wraps around, and the
+    condition for each operation not to overflow is recorded, see no_overflow. '''
+
+    def __init__(self, context:Union[None, z3.Context]=None, bit_width:Union[None, int]=None):
+        self.context = context
+        self.bit_width = bit_width
+        # with a bit width: the expressions translated so far, the condition of each operation of theirs
+        # not to overflow and the term of the hypothesis of each implication, by id of the node
+        self.translated = []
+        self.overflow_conditions = {}
+        self.hypotheses = {}
+
+    def translate(self, expression) -> z3.ExprRef:
+        term = self.visit(expression)
+        if self.bit_width is not None:
+            self.translated.append(expression)
+        return term
+
+    def no_overflow(self) -> z3.BoolRef:
+        ''' true if no operation of the expressions translated so far overflows, an operation in the conclusion
+        of an implication only needs not to overflow when the hypothesis holds '''
+        conditions = []
+        if self.overflow_conditions:
+            fold = NoOverflow(self.overflow_conditions, self.hypotheses)
+            for expression in self.translated:
+                condition = fold.visit(expression)
+                if condition is not None:
+                    conditions.append(condition)
+        return z3.And(*conditions) if conditions else z3.BoolVal(True, self.context)
+
+    def forget_overflow(self):
+        ''' no_overflow is then about the expressions translated after the call '''
+        self.translated = []
+        self.overflow_conditions = {}
+        self.hypotheses = {}
+
+    def visit_BinaryExpression(self, expression, left, right):
+        if self.bit_width is not None:
+            if expression.op in Z3_OVERFLOW_CONDITIONS:
+                self.overflow_conditions[id(expression)] = Z3_OVERFLOW_CONDITIONS[expression.op](left, right)
+            elif expression.op == "=>":
+                self.hypotheses[id(expression)] = left
+        return Z3_BINARY_OPERATORS[expression.op](left, right)
+
+    def visit_NotExpression(self, expression, operand):
+        return z3.Not(operand)
+
+    def visit_IntUnaryExpression(self, expression, operand):
+        if self.bit_width is not None:
+            self.overflow_conditions[id(expression)] = z3.BVSNegNoOverflow(operand)
+        return -operand
+
+    def visit_VariableExpression(self, expression):
+        if expression.type == DataType.BOOL:
+            return z3.Bool(expression.name, self.context)
+        if self.bit_width is not None:
+            return z3.BitVec(expression.name, self.bit_width, self.context)
+        return z3.Int(expression.name, self.context)
+
+    def visit_ReturnValueVariableExpression(self, expression):
+        return self.visit_VariableExpression(expression)
+
+    def visit_BooleanLiteralExpression(self, expression):
+        return z3.BoolVal(expression.value == "TRUE", self.context)
+
+    def visit_IntLiteralExpression(self, expression):
+        if self.bit_width is not None:
+            return z3.BitVecVal(int(expression.value), self.bit_width, self.context)
+        return z3.IntVal(int(expression.value), self.context)
+
+
+class NoOverflow(Fold):
+    ''' condition for no operation of a translated expression to overflow, None if it has no operation, from the
+    conditions and hypotheses recorded by Z3Translator. The condition of an implication is that of its hypothesis
+    and, when the hypothesis holds, that of its conclusion: each condition and hypothesis occurs once, so the
+    condition is linear in the size of the expression. '''
+
+    def __init__(self, overflow_conditions:dict, hypotheses:dict):
+        self.overflow_conditions = overflow_conditions
+        self.hypotheses = hypotheses
+
+    def visit_BinaryExpression(self, expression, left, right):
+        if right is not None and expression.op == "=>":
+            right = z3.Implies(self.hypotheses[id(expression)], right)
+        return conjunction(left, right, self.overflow_conditions.get(id(expression)))
+
+    def visit_UnaryExpression(self, expression, operand):
+        return conjunction(operand, self.overflow_conditions.get(id(expression)))
+
+    def visit_Expression(self, expression):
+        return None
+
+
+def conjunction(*conditions) -> Union[None, z3.BoolRef]:
+    ''' conjunction of the conditions that are not None, None if there is none '''
+    conditions = [condition for condition in conditions if condition is not None]
+    if len(conditions) > 1:
+        return z3.And(*conditions)
+    return conditions[0] if conditions else None
+
+
+Z3_BINARY_OPERATORS = {
+    "=>": z3.Implies,
+    "^": lambda left, right: z3.And(left, right),
+    "v": lambda left, right: z3.Or(left, right),
+    "==": operator.eq,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    BinaryOperator.PLUS: operator.add,
+    BinaryOperator.MINUS: operator.sub,
+    BinaryOperator.TIMES: operator.mul,
+}
+
+
+# operator -> condition for a signed bit-vector operation not to overflow
+Z3_OVERFLOW_CONDITIONS = {
+    BinaryOperator.PLUS: lambda left, right: z3.And(z3.BVAddNoOverflow(left, right, True),
+                                                    z3.BVAddNoUnderflow(left, right)),
+    BinaryOperator.MINUS: lambda left, right: z3.And(z3.BVSubNoOverflow(left, right),
+                                                     z3.BVSubNoUnderflow(left, right, True)),
+    BinaryOperator.TIMES: lambda left, right: z3.And(z3.BVMulNoOverflow(left, right, True),
+                                                     z3.BVMulNoUnderflow(left, right)),
+}
+
+
+_thread_state = threading.local()
+
+
+def thread_context() -> z3.Context:
+    ''' z3 context of the calling thread, created on its first use '''
+    context = getattr(_thread_state, "context", None)
+    if context is None:
+        context = _thread_state.context = z3.Context()
+    return context
+
+
+class UnknownTactic(Exception):
+    def __init__(self, name:str):
+        super().__init__(f"Unknown z3 tactic {name}, see z3.tactics() for the available ones.")
+
+
+def check_tactics(names:List[str]):
+    available = set(z3.tactics())
+    for name in names:
+        if name not in available:
+            raise UnknownTactic(name)
+
+
+class InvalidFunctionTactics(Exception):
+    def __init__(self, message="Invalid --tactics, expected FUNCTION=TACTIC,..."):
+        super().__init__(message)
+
+
+def parse_function_tactics(arguments:List[str]) -> Dict[str, List[str]]:
+    ''' tactics of each function from the FUNCTION=TACTIC,... arguments of --tactics '''
+    function_tactics = {}
+    for argument in arguments:
+        function_name, _, tactics = argument.partition("=")
+        if not tactics:
+            raise InvalidFunctionTactics(f"invalid --tactics {argument}, expected FUNCTION=TACTIC,...")
+        function_tactics[function_name] = tactics.split(",")
+        try:
+            check_tactics(function_tactics[function_name])
+        except UnknownTactic as e:
+            raise InvalidFunctionTactics(f"invalid --tactics {argument}: {e}")
+    return function_tactics
+
+
+def make_solver(logic:str, tactics:Union[None, List[str]]=None, context:Union[None, z3.Context]=None) -> z3.Solver:
+    ''' solver for a VC of the given logic, the tactics (names of z3 tactics applied in order)
+    replace the default configuration for that logic, the solver belongs to the given z3 context '''
+    if tactics is None:
+        tactics = DEFAULT_TACTICS.get(logic)
+    if tactics is None:
+        return z3.SolverFor(logic, ctx=context)
+    if len(tactics) == 1:
+        return z3.Tactic(tactics[0], context).solver()
+    return z3.Then(*tactics, ctx=context).solver()
+
+
+def get_function_tactics(function_tactics:Union[None, Dict[str, List[str]]], function_name:str) \
+        -> Union[None, List[str]]:
+    ''' tactics configured for a function, "*" configures every function without its own entry '''
+    if not function_tactics:
+        return None
+    return function_tactics.get(function_name, function_tactics.get("*"))
+
+
+# logic -> [number of VCs solved, total solving time in seconds]
+solver_statistics = {}
+# the VCs of a file can be solved by several threads
+_statistics_lock = threading.Lock()
+
+
+def reset_solver_statistics():
+    global solver_statistics
+    solver_statistics = {}
+
+
+def get_solver_statistics() -> Dict[str, list]:
+    return solver_statistics
+
+
+def record_solving_time(logic:str, duration:float):
+    with _statistics_lock:
+        statistics = solver_statistics.setdefault(logic, [0, 0.0])
+        statistics[0] += 1
+        statistics[1] += duration
+
+
+def add_solver_statistics(statistics:Dict[str, list]):
+    ''' add the statistics of another run, e.g. of a worker of a sharded run '''
+    with _statistics_lock:
+        for logic, (count, duration) in statistics.items():
+            total = solver_statistics.setdefault(logic, [0, 0.0])
+            total[0] += count
+            total[1] += duration
+
+
+def timed_check(solver:z3.Solver, logic:str):
+    ''' solver.check(), accounted in the statistics of the logic '''
+    start = time.perf_counter()
+    result = solver.check()
+    record_solving_time(logic, time.perf_counter() - start)
+    return result
+
+
+def print_solver_statistics():
+    print("Solving time per logic:")
+    for logic in sorted(solver_statistics):
+        count, duration = solver_statistics[logic]
+        print(f"  {logic}: {count} VCs in {duration:.3f}s ({duration / count * 1000:.2f}ms per VC)")
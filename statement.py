@@ -1,13 +1,19 @@
 from abc import abstractmethod
 from typing import Union, List
 
-from expr import BooleanUnaryExpression, BooleanBinaryExpression, BooleanLiteralExpression, IntUnaryExpression, \
-    IntBinaryExpression, IntLiteralExpression, VariableExpression, DataType, assert_expression_type
+from expr import DataType, assert_expression_type
+from visitor import register_node_class
 
 
 class Statement:
     def __init__(self):
         self.context = None
+        # line of the statement in the .tpl file, set by the parser
+        self.lineno = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        register_node_class(cls)
 
 class AssignmentStatement(Statement):
     def __init__(self, variable, expression):
@@ -17,6 +23,7 @@ class AssignmentStatement(Statement):
 
 class BooleanAssignmentStatement(AssignmentStatement):
     def __init__(self, variable, expression):
+        assert_expression_type(expression, DataType.BOOL)
         super().__init__(variable, expression)
     
     def __repr__(self):
@@ -24,6 +31,7 @@ class BooleanAssignmentStatement(AssignmentStatement):
 
 class IntAssignmentStatement(AssignmentStatement):
     def __init__(self, variable:str, expression):
+        assert_expression_type(expression, DataType.INT)
         super().__init__(variable, expression)
     
     def __repr__(self):
@@ -55,8 +63,8 @@ class ForStatement(Statement):
 
 class IfThenElseStatement(Statement):
     def __init__(self, condition, then_body, else_body):
+        assert_expression_type(condition, DataType.BOOL)
         super().__init__()
-        assert (isinstance(condition, BooleanUnaryExpression) or isinstance(condition, BooleanBinaryExpression))
         self.condition = condition
         self.then_body = then_body
         self.else_body = else_body
@@ -101,6 +109,7 @@ class LoopAnnotationStatement(AnnotationStatement):
 
 class AssumptionStatement(Statement):
     def __init__(self, expression):
+        assert_expression_type(expression, DataType.BOOL)
         super().__init__()
         self.expression = expression
 
@@ -0,0 +1,7 @@
+INT FUNCTION square(INT x) {
+    DECLARE (INT y);
+    @PRE x >= -11 ^ x <= 11;
+    @POST TRUE;
+    y := x * 12;
+    RETURN x * x;
+}
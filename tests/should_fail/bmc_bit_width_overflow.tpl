@@ -0,0 +1,5 @@
+INT FUNCTION square(INT x) {
+    @PRE TRUE;
+    @POST TRUE;
+    RETURN x * x;
+}
@@ -0,0 +1,11 @@
+INT FUNCTION countTo(INT n) {
+    DECLARE (INT i);
+    @PRE n == 20;
+    @POST rv == n + 1;
+    i := 0;
+    @LOOP i <= n;
+    WHILE (i < n) {
+        i := i + 1;
+    }
+    RETURN i;
+}
@@ -0,0 +1,20 @@
+BOOL FUNCTION is_checker_board(BOOL a, BOOL b, BOOL c, BOOL d) {
+    @PRE TRUE;
+    @POST rv == (a^c^NOT(b)^NOT(d)) v (NOT(a)^NOT(c)^b^d);
+    IF (a^c) {
+        RETURN TRUE;
+    } ELSE {
+        NOP;
+    }
+
+    IF (b^d) {
+        IF(NOT(a)^NOT(c)) {
+            RETURN TRUE;
+        } ELSE {
+            NOP;
+        }
+    } ELSE {
+        NOP;
+    }
+    RETURN FALSE;
+}
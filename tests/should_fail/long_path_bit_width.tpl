@@ -0,0 +1,1207 @@
+INT FUNCTION longPath(INT x) {
+    DECLARE (INT y);
+    @PRE x >= 0;
+    @POST rv == x + 1200;
+    y := x;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    RETURN y;
+}
@@ -0,0 +1,32 @@
+INT FUNCTION countFlags(BOOL a, BOOL b, BOOL c, BOOL d, BOOL e) {
+    DECLARE (INT count);
+    @PRE TRUE;
+    @POST rv >= 0 ^ rv <= 5;
+    count := 0;
+    IF (a) {
+        count := count + 1;
+    } ELSE {
+        NOP;
+    }
+    IF (b) {
+        count := count + 1;
+    } ELSE {
+        NOP;
+    }
+    IF (c) {
+        count := count + 1;
+    } ELSE {
+        NOP;
+    }
+    IF (d) {
+        count := count + 1;
+    } ELSE {
+        NOP;
+    }
+    IF (e) {
+        count := count + 1;
+    } ELSE {
+        NOP;
+    }
+    RETURN count;
+}
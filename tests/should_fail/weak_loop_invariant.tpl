@@ -0,0 +1,11 @@
+INT FUNCTION f(INT n) {
+    DECLARE (INT i);
+    @PRE n >= 0;
+    @POST rv >= 0;
+    i := 0;
+    @LOOP TRUE;
+    WHILE (i < n) {
+        i := i + 1;
+    }
+    RETURN i;
+}
@@ -0,0 +1,5 @@
+INT FUNCTION square(INT x) {
+    @PRE x >= -11 ^ x <= 11;
+    @POST rv >= 0;
+    RETURN x * x;
+}
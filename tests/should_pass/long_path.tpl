@@ -0,0 +1,1213 @@
+INT FUNCTION longPath(INT x) {
+    DECLARE (INT y);
+    @PRE x >= 0;
+    @POST rv == x + 1200;
+    y := x;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    y := y + 1;
+    RETURN y;
+}
+
+INT FUNCTION longCondition(INT x) {
+    @PRE x >= 0;
+    @POST rv >= 0 ^ rv >= -1 ^ rv >= -2 ^ rv >= -3 ^ rv >= -4 ^ rv >= -5 ^ rv >= -6 ^ rv >= -7 ^ rv >= -8 ^ rv >= -9 ^ rv >= -10 ^ rv >= -11 ^ rv >= -12 ^ rv >= -13 ^ rv >= -14 ^ rv >= -15 ^ rv >= -16 ^ rv >= -17 ^ rv >= -18 ^ rv >= -19 ^ rv >= -20 ^ rv >= -21 ^ rv >= -22 ^ rv >= -23 ^ rv >= -24 ^ rv >= -25 ^ rv >= -26 ^ rv >= -27 ^ rv >= -28 ^ rv >= -29 ^ rv >= -30 ^ rv >= -31 ^ rv >= -32 ^ rv >= -33 ^ rv >= -34 ^ rv >= -35 ^ rv >= -36 ^ rv >= -37 ^ rv >= -38 ^ rv >= -39 ^ rv >= -40 ^ rv >= -41 ^ rv >= -42 ^ rv >= -43 ^ rv >= -44 ^ rv >= -45 ^ rv >= -46 ^ rv >= -47 ^ rv >= -48 ^ rv >= -49 ^ rv >= -50 ^ rv >= -51 ^ rv >= -52 ^ rv >= -53 ^ rv >= -54 ^ rv >= -55 ^ rv >= -56 ^ rv >= -57 ^ rv >= -58 ^ rv >= -59 ^ rv >= -60 ^ rv >= -61 ^ rv >= -62 ^ rv >= -63 ^ rv >= -64 ^ rv >= -65 ^ rv >= -66 ^ rv >= -67 ^ rv >= -68 ^ rv >= -69 ^ rv >= -70 ^ rv >= -71 ^ rv >= -72 ^ rv >= -73 ^ rv >= -74 ^ rv >= -75 ^ rv >= -76 ^ rv >= -77 ^ rv >= -78 ^ rv >= -79 ^ rv >= -80 ^ rv >= -81 ^ rv >= -82 ^ rv >= -83 ^ rv >= -84 ^ rv >= -85 ^ rv >= -86 ^ rv >= -87 ^ rv >= -88 ^ rv >= -89 ^ rv >= -90 ^ rv >= -91 ^ rv >= -92 ^ rv >= -93 ^ rv >= -94 ^ rv >= -95 ^ rv >= -96 ^ rv >= -97 ^ rv >= -98 ^ rv >= -99 ^ rv >= -100 ^ rv >= -101 ^ rv >= -102 ^ rv >= -103 ^ rv >= -104 ^ rv >= -105 ^ rv >= -106 ^ rv >= -107 ^ rv >= -108 ^ rv >= -109 ^ rv >= -110 ^ rv >= -111 ^ rv >= -112 ^ rv >= -113 ^ rv >= -114 ^ rv >= -115 ^ rv >= -116 ^ rv >= -117 ^ rv >= -118 ^ rv >= -119 ^ rv >= -120 ^ rv >= -121 ^ rv >= -122 ^ rv >= -123 ^ rv >= -124 ^ rv >= -125 ^ rv >= -126 ^ rv >= -127 ^ rv >= -128 ^ rv >= -129 ^ rv >= -130 ^ rv >= -131 ^ rv >= -132 ^ rv >= -133 ^ rv >= -134 ^ rv >= -135 ^ rv >= -136 ^ rv >= -137 ^ rv >= -138 ^ rv >= -139 ^ rv >= -140 ^ rv >= -141 ^ rv >= -142 ^ rv >= -143 ^ rv >= -144 ^ rv >= -145 ^ rv >= -146 ^ rv >= -147 ^ rv >= -148 ^ rv >= -149 ^ rv >= -150 ^ rv >= -151 ^ rv >= -152 ^ rv >= -153 ^ rv >= -154 ^ rv >= -155 ^ rv >= -156 ^ rv >= -157 ^ rv >= -158 ^ rv >= -159 ^ rv >= -160 ^ rv >= -161 ^ rv >= -162 ^ rv >= -163 ^ rv >= -164 ^ rv >= -165 ^ rv >= -166 ^ rv >= -167 ^ rv >= -168 ^ rv >= -169 ^ rv >= -170 ^ rv >= -171 ^ rv >= -172 ^ rv >= -173 ^ rv >= -174 ^ rv >= -175 ^ rv >= -176 ^ rv >= -177 ^ rv >= -178 ^ rv >= -179 ^ rv >= -180 ^ rv >= -181 ^ rv >= -182 ^ rv >= -183 ^ rv >= -184 ^ rv >= -185 ^ rv >= -186 ^ rv >= -187 ^ rv >= -188 ^ rv >= -189 ^ rv >= -190 ^ rv >= -191 ^ rv >= -192 ^ rv >= -193 ^ rv >= -194 ^ rv >= -195 ^ rv >= -196 ^ rv >= -197 ^ rv >= -198 ^ rv >= -199 ^ rv >= -200 ^ rv >= -201 ^ rv >= -202 ^ rv >= -203 ^ rv >= -204 ^ rv >= -205 ^ rv >= -206 ^ rv >= -207 ^ rv >= -208 ^ rv >= -209 ^ rv >= -210 ^ rv >= -211 ^ rv >= -212 ^ rv >= -213 ^ rv >= -214 ^ rv >= -215 ^ rv >= -216 ^ rv >= -217 ^ rv >= -218 ^ rv >= -219 ^ rv >= -220 ^ rv >= -221 ^ rv >= -222 ^ rv >= -223 ^ rv >= -224 ^ rv >= -225 ^ rv >= -226 ^ rv >= -227 ^ rv >= -228 ^ rv >= -229 ^ rv >= -230 ^ rv >= -231 ^ rv >= -232 ^ rv >= -233 ^ rv >= -234 ^ rv >= -235 ^ rv >= -236 ^ rv >= -237 ^ rv >= -238 ^ rv >= -239 ^ rv >= -240 ^ rv >= -241 ^ rv >= -242 ^ rv >= -243 ^ rv >= -244 ^ rv >= -245 ^ rv >= -246 ^ rv >= -247 ^ rv >= -248 ^ rv >= -249 ^ rv >= -250 ^ rv >= -251 ^ rv >= -252 ^ rv >= -253 ^ rv >= -254 ^ rv >= -255 ^ rv >= -256 ^ rv >= -257 ^ rv >= -258 ^ rv >= -259 ^ rv >= -260 ^ rv >= -261 ^ rv >= -262 ^ rv >= -263 ^ rv >= -264 ^ rv >= -265 ^ rv >= -266 ^ rv >= -267 ^ rv >= -268 ^ rv >= -269 ^ rv >= -270 ^ rv >= -271 ^ rv >= -272 ^ rv >= -273 ^ rv >= -274 ^ rv >= -275 ^ rv >= -276 ^ rv >= -277 ^ rv >= -278 ^ rv >= -279 ^ rv >= -280 ^ rv >= -281 ^ rv >= -282 ^ rv >= -283 ^ rv >= -284 ^ rv >= -285 ^ rv >= -286 ^ rv >= -287 ^ rv >= -288 ^ rv >= -289 ^ rv >= -290 ^ rv >= -291 ^ rv >= -292 ^ rv >= -293 ^ rv >= -294 ^ rv >= -295 ^ rv >= -296 ^ rv >= -297 ^ rv >= -298 ^ rv >= -299 ^ rv >= -300 ^ rv >= -301 ^ rv >= -302 ^ rv >= -303 ^ rv >= -304 ^ rv >= -305 ^ rv >= -306 ^ rv >= -307 ^ rv >= -308 ^ rv >= -309 ^ rv >= -310 ^ rv >= -311 ^ rv >= -312 ^ rv >= -313 ^ rv >= -314 ^ rv >= -315 ^ rv >= -316 ^ rv >= -317 ^ rv >= -318 ^ rv >= -319 ^ rv >= -320 ^ rv >= -321 ^ rv >= -322 ^ rv >= -323 ^ rv >= -324 ^ rv >= -325 ^ rv >= -326 ^ rv >= -327 ^ rv >= -328 ^ rv >= -329 ^ rv >= -330 ^ rv >= -331 ^ rv >= -332 ^ rv >= -333 ^ rv >= -334 ^ rv >= -335 ^ rv >= -336 ^ rv >= -337 ^ rv >= -338 ^ rv >= -339 ^ rv >= -340 ^ rv >= -341 ^ rv >= -342 ^ rv >= -343 ^ rv >= -344 ^ rv >= -345 ^ rv >= -346 ^ rv >= -347 ^ rv >= -348 ^ rv >= -349 ^ rv >= -350 ^ rv >= -351 ^ rv >= -352 ^ rv >= -353 ^ rv >= -354 ^ rv >= -355 ^ rv >= -356 ^ rv >= -357 ^ rv >= -358 ^ rv >= -359 ^ rv >= -360 ^ rv >= -361 ^ rv >= -362 ^ rv >= -363 ^ rv >= -364 ^ rv >= -365 ^ rv >= -366 ^ rv >= -367 ^ rv >= -368 ^ rv >= -369 ^ rv >= -370 ^ rv >= -371 ^ rv >= -372 ^ rv >= -373 ^ rv >= -374 ^ rv >= -375 ^ rv >= -376 ^ rv >= -377 ^ rv >= -378 ^ rv >= -379 ^ rv >= -380 ^ rv >= -381 ^ rv >= -382 ^ rv >= -383 ^ rv >= -384 ^ rv >= -385 ^ rv >= -386 ^ rv >= -387 ^ rv >= -388 ^ rv >= -389 ^ rv >= -390 ^ rv >= -391 ^ rv >= -392 ^ rv >= -393 ^ rv >= -394 ^ rv >= -395 ^ rv >= -396 ^ rv >= -397 ^ rv >= -398 ^ rv >= -399 ^ rv >= -400 ^ rv >= -401 ^ rv >= -402 ^ rv >= -403 ^ rv >= -404 ^ rv >= -405 ^ rv >= -406 ^ rv >= -407 ^ rv >= -408 ^ rv >= -409 ^ rv >= -410 ^ rv >= -411 ^ rv >= -412 ^ rv >= -413 ^ rv >= -414 ^ rv >= -415 ^ rv >= -416 ^ rv >= -417 ^ rv >= -418 ^ rv >= -419 ^ rv >= -420 ^ rv >= -421 ^ rv >= -422 ^ rv >= -423 ^ rv >= -424 ^ rv >= -425 ^ rv >= -426 ^ rv >= -427 ^ rv >= -428 ^ rv >= -429 ^ rv >= -430 ^ rv >= -431 ^ rv >= -432 ^ rv >= -433 ^ rv >= -434 ^ rv >= -435 ^ rv >= -436 ^ rv >= -437 ^ rv >= -438 ^ rv >= -439 ^ rv >= -440 ^ rv >= -441 ^ rv >= -442 ^ rv >= -443 ^ rv >= -444 ^ rv >= -445 ^ rv >= -446 ^ rv >= -447 ^ rv >= -448 ^ rv >= -449 ^ rv >= -450 ^ rv >= -451 ^ rv >= -452 ^ rv >= -453 ^ rv >= -454 ^ rv >= -455 ^ rv >= -456 ^ rv >= -457 ^ rv >= -458 ^ rv >= -459 ^ rv >= -460 ^ rv >= -461 ^ rv >= -462 ^ rv >= -463 ^ rv >= -464 ^ rv >= -465 ^ rv >= -466 ^ rv >= -467 ^ rv >= -468 ^ rv >= -469 ^ rv >= -470 ^ rv >= -471 ^ rv >= -472 ^ rv >= -473 ^ rv >= -474 ^ rv >= -475 ^ rv >= -476 ^ rv >= -477 ^ rv >= -478 ^ rv >= -479 ^ rv >= -480 ^ rv >= -481 ^ rv >= -482 ^ rv >= -483 ^ rv >= -484 ^ rv >= -485 ^ rv >= -486 ^ rv >= -487 ^ rv >= -488 ^ rv >= -489 ^ rv >= -490 ^ rv >= -491 ^ rv >= -492 ^ rv >= -493 ^ rv >= -494 ^ rv >= -495 ^ rv >= -496 ^ rv >= -497 ^ rv >= -498 ^ rv >= -499 ^ rv >= -500 ^ rv >= -501 ^ rv >= -502 ^ rv >= -503 ^ rv >= -504 ^ rv >= -505 ^ rv >= -506 ^ rv >= -507 ^ rv >= -508 ^ rv >= -509 ^ rv >= -510 ^ rv >= -511 ^ rv >= -512 ^ rv >= -513 ^ rv >= -514 ^ rv >= -515 ^ rv >= -516 ^ rv >= -517 ^ rv >= -518 ^ rv >= -519 ^ rv >= -520 ^ rv >= -521 ^ rv >= -522 ^ rv >= -523 ^ rv >= -524 ^ rv >= -525 ^ rv >= -526 ^ rv >= -527 ^ rv >= -528 ^ rv >= -529 ^ rv >= -530 ^ rv >= -531 ^ rv >= -532 ^ rv >= -533 ^ rv >= -534 ^ rv >= -535 ^ rv >= -536 ^ rv >= -537 ^ rv >= -538 ^ rv >= -539 ^ rv >= -540 ^ rv >= -541 ^ rv >= -542 ^ rv >= -543 ^ rv >= -544 ^ rv >= -545 ^ rv >= -546 ^ rv >= -547 ^ rv >= -548 ^ rv >= -549 ^ rv >= -550 ^ rv >= -551 ^ rv >= -552 ^ rv >= -553 ^ rv >= -554 ^ rv >= -555 ^ rv >= -556 ^ rv >= -557 ^ rv >= -558 ^ rv >= -559 ^ rv >= -560 ^ rv >= -561 ^ rv >= -562 ^ rv >= -563 ^ rv >= -564 ^ rv >= -565 ^ rv >= -566 ^ rv >= -567 ^ rv >= -568 ^ rv >= -569 ^ rv >= -570 ^ rv >= -571 ^ rv >= -572 ^ rv >= -573 ^ rv >= -574 ^ rv >= -575 ^ rv >= -576 ^ rv >= -577 ^ rv >= -578 ^ rv >= -579 ^ rv >= -580 ^ rv >= -581 ^ rv >= -582 ^ rv >= -583 ^ rv >= -584 ^ rv >= -585 ^ rv >= -586 ^ rv >= -587 ^ rv >= -588 ^ rv >= -589 ^ rv >= -590 ^ rv >= -591 ^ rv >= -592 ^ rv >= -593 ^ rv >= -594 ^ rv >= -595 ^ rv >= -596 ^ rv >= -597 ^ rv >= -598 ^ rv >= -599 ^ rv >= -600 ^ rv >= -601 ^ rv >= -602 ^ rv >= -603 ^ rv >= -604 ^ rv >= -605 ^ rv >= -606 ^ rv >= -607 ^ rv >= -608 ^ rv >= -609 ^ rv >= -610 ^ rv >= -611 ^ rv >= -612 ^ rv >= -613 ^ rv >= -614 ^ rv >= -615 ^ rv >= -616 ^ rv >= -617 ^ rv >= -618 ^ rv >= -619 ^ rv >= -620 ^ rv >= -621 ^ rv >= -622 ^ rv >= -623 ^ rv >= -624 ^ rv >= -625 ^ rv >= -626 ^ rv >= -627 ^ rv >= -628 ^ rv >= -629 ^ rv >= -630 ^ rv >= -631 ^ rv >= -632 ^ rv >= -633 ^ rv >= -634 ^ rv >= -635 ^ rv >= -636 ^ rv >= -637 ^ rv >= -638 ^ rv >= -639 ^ rv >= -640 ^ rv >= -641 ^ rv >= -642 ^ rv >= -643 ^ rv >= -644 ^ rv >= -645 ^ rv >= -646 ^ rv >= -647 ^ rv >= -648 ^ rv >= -649 ^ rv >= -650 ^ rv >= -651 ^ rv >= -652 ^ rv >= -653 ^ rv >= -654 ^ rv >= -655 ^ rv >= -656 ^ rv >= -657 ^ rv >= -658 ^ rv >= -659 ^ rv >= -660 ^ rv >= -661 ^ rv >= -662 ^ rv >= -663 ^ rv >= -664 ^ rv >= -665 ^ rv >= -666 ^ rv >= -667 ^ rv >= -668 ^ rv >= -669 ^ rv >= -670 ^ rv >= -671 ^ rv >= -672 ^ rv >= -673 ^ rv >= -674 ^ rv >= -675 ^ rv >= -676 ^ rv >= -677 ^ rv >= -678 ^ rv >= -679 ^ rv >= -680 ^ rv >= -681 ^ rv >= -682 ^ rv >= -683 ^ rv >= -684 ^ rv >= -685 ^ rv >= -686 ^ rv >= -687 ^ rv >= -688 ^ rv >= -689 ^ rv >= -690 ^ rv >= -691 ^ rv >= -692 ^ rv >= -693 ^ rv >= -694 ^ rv >= -695 ^ rv >= -696 ^ rv >= -697 ^ rv >= -698 ^ rv >= -699 ^ rv >= -700 ^ rv >= -701 ^ rv >= -702 ^ rv >= -703 ^ rv >= -704 ^ rv >= -705 ^ rv >= -706 ^ rv >= -707 ^ rv >= -708 ^ rv >= -709 ^ rv >= -710 ^ rv >= -711 ^ rv >= -712 ^ rv >= -713 ^ rv >= -714 ^ rv >= -715 ^ rv >= -716 ^ rv >= -717 ^ rv >= -718 ^ rv >= -719 ^ rv >= -720 ^ rv >= -721 ^ rv >= -722 ^ rv >= -723 ^ rv >= -724 ^ rv >= -725 ^ rv >= -726 ^ rv >= -727 ^ rv >= -728 ^ rv >= -729 ^ rv >= -730 ^ rv >= -731 ^ rv >= -732 ^ rv >= -733 ^ rv >= -734 ^ rv >= -735 ^ rv >= -736 ^ rv >= -737 ^ rv >= -738 ^ rv >= -739 ^ rv >= -740 ^ rv >= -741 ^ rv >= -742 ^ rv >= -743 ^ rv >= -744 ^ rv >= -745 ^ rv >= -746 ^ rv >= -747 ^ rv >= -748 ^ rv >= -749 ^ rv >= -750 ^ rv >= -751 ^ rv >= -752 ^ rv >= -753 ^ rv >= -754 ^ rv >= -755 ^ rv >= -756 ^ rv >= -757 ^ rv >= -758 ^ rv >= -759 ^ rv >= -760 ^ rv >= -761 ^ rv >= -762 ^ rv >= -763 ^ rv >= -764 ^ rv >= -765 ^ rv >= -766 ^ rv >= -767 ^ rv >= -768 ^ rv >= -769 ^ rv >= -770 ^ rv >= -771 ^ rv >= -772 ^ rv >= -773 ^ rv >= -774 ^ rv >= -775 ^ rv >= -776 ^ rv >= -777 ^ rv >= -778 ^ rv >= -779 ^ rv >= -780 ^ rv >= -781 ^ rv >= -782 ^ rv >= -783 ^ rv >= -784 ^ rv >= -785 ^ rv >= -786 ^ rv >= -787 ^ rv >= -788 ^ rv >= -789 ^ rv >= -790 ^ rv >= -791 ^ rv >= -792 ^ rv >= -793 ^ rv >= -794 ^ rv >= -795 ^ rv >= -796 ^ rv >= -797 ^ rv >= -798 ^ rv >= -799 ^ rv >= -800 ^ rv >= -801 ^ rv >= -802 ^ rv >= -803 ^ rv >= -804 ^ rv >= -805 ^ rv >= -806 ^ rv >= -807 ^ rv >= -808 ^ rv >= -809 ^ rv >= -810 ^ rv >= -811 ^ rv >= -812 ^ rv >= -813 ^ rv >= -814 ^ rv >= -815 ^ rv >= -816 ^ rv >= -817 ^ rv >= -818 ^ rv >= -819 ^ rv >= -820 ^ rv >= -821 ^ rv >= -822 ^ rv >= -823 ^ rv >= -824 ^ rv >= -825 ^ rv >= -826 ^ rv >= -827 ^ rv >= -828 ^ rv >= -829 ^ rv >= -830 ^ rv >= -831 ^ rv >= -832 ^ rv >= -833 ^ rv >= -834 ^ rv >= -835 ^ rv >= -836 ^ rv >= -837 ^ rv >= -838 ^ rv >= -839 ^ rv >= -840 ^ rv >= -841 ^ rv >= -842 ^ rv >= -843 ^ rv >= -844 ^ rv >= -845 ^ rv >= -846 ^ rv >= -847 ^ rv >= -848 ^ rv >= -849 ^ rv >= -850 ^ rv >= -851 ^ rv >= -852 ^ rv >= -853 ^ rv >= -854 ^ rv >= -855 ^ rv >= -856 ^ rv >= -857 ^ rv >= -858 ^ rv >= -859 ^ rv >= -860 ^ rv >= -861 ^ rv >= -862 ^ rv >= -863 ^ rv >= -864 ^ rv >= -865 ^ rv >= -866 ^ rv >= -867 ^ rv >= -868 ^ rv >= -869 ^ rv >= -870 ^ rv >= -871 ^ rv >= -872 ^ rv >= -873 ^ rv >= -874 ^ rv >= -875 ^ rv >= -876 ^ rv >= -877 ^ rv >= -878 ^ rv >= -879 ^ rv >= -880 ^ rv >= -881 ^ rv >= -882 ^ rv >= -883 ^ rv >= -884 ^ rv >= -885 ^ rv >= -886 ^ rv >= -887 ^ rv >= -888 ^ rv >= -889 ^ rv >= -890 ^ rv >= -891 ^ rv >= -892 ^ rv >= -893 ^ rv >= -894 ^ rv >= -895 ^ rv >= -896 ^ rv >= -897 ^ rv >= -898 ^ rv >= -899 ^ rv >= -900 ^ rv >= -901 ^ rv >= -902 ^ rv >= -903 ^ rv >= -904 ^ rv >= -905 ^ rv >= -906 ^ rv >= -907 ^ rv >= -908 ^ rv >= -909 ^ rv >= -910 ^ rv >= -911 ^ rv >= -912 ^ rv >= -913 ^ rv >= -914 ^ rv >= -915 ^ rv >= -916 ^ rv >= -917 ^ rv >= -918 ^ rv >= -919 ^ rv >= -920 ^ rv >= -921 ^ rv >= -922 ^ rv >= -923 ^ rv >= -924 ^ rv >= -925 ^ rv >= -926 ^ rv >= -927 ^ rv >= -928 ^ rv >= -929 ^ rv >= -930 ^ rv >= -931 ^ rv >= -932 ^ rv >= -933 ^ rv >= -934 ^ rv >= -935 ^ rv >= -936 ^ rv >= -937 ^ rv >= -938 ^ rv >= -939 ^ rv >= -940 ^ rv >= -941 ^ rv >= -942 ^ rv >= -943 ^ rv >= -944 ^ rv >= -945 ^ rv >= -946 ^ rv >= -947 ^ rv >= -948 ^ rv >= -949 ^ rv >= -950 ^ rv >= -951 ^ rv >= -952 ^ rv >= -953 ^ rv >= -954 ^ rv >= -955 ^ rv >= -956 ^ rv >= -957 ^ rv >= -958 ^ rv >= -959 ^ rv >= -960 ^ rv >= -961 ^ rv >= -962 ^ rv >= -963 ^ rv >= -964 ^ rv >= -965 ^ rv >= -966 ^ rv >= -967 ^ rv >= -968 ^ rv >= -969 ^ rv >= -970 ^ rv >= -971 ^ rv >= -972 ^ rv >= -973 ^ rv >= -974 ^ rv >= -975 ^ rv >= -976 ^ rv >= -977 ^ rv >= -978 ^ rv >= -979 ^ rv >= -980 ^ rv >= -981 ^ rv >= -982 ^ rv >= -983 ^ rv >= -984 ^ rv >= -985 ^ rv >= -986 ^ rv >= -987 ^ rv >= -988 ^ rv >= -989 ^ rv >= -990 ^ rv >= -991 ^ rv >= -992 ^ rv >= -993 ^ rv >= -994 ^ rv >= -995 ^ rv >= -996 ^ rv >= -997 ^ rv >= -998 ^ rv >= -999 ^ rv >= -1000 ^ rv >= -1001 ^ rv >= -1002 ^ rv >= -1003 ^ rv >= -1004 ^ rv >= -1005 ^ rv >= -1006 ^ rv >= -1007 ^ rv >= -1008 ^ rv >= -1009 ^ rv >= -1010 ^ rv >= -1011 ^ rv >= -1012 ^ rv >= -1013 ^ rv >= -1014 ^ rv >= -1015 ^ rv >= -1016 ^ rv >= -1017 ^ rv >= -1018 ^ rv >= -1019 ^ rv >= -1020 ^ rv >= -1021 ^ rv >= -1022 ^ rv >= -1023 ^ rv >= -1024 ^ rv >= -1025 ^ rv >= -1026 ^ rv >= -1027 ^ rv >= -1028 ^ rv >= -1029 ^ rv >= -1030 ^ rv >= -1031 ^ rv >= -1032 ^ rv >= -1033 ^ rv >= -1034 ^ rv >= -1035 ^ rv >= -1036 ^ rv >= -1037 ^ rv >= -1038 ^ rv >= -1039 ^ rv >= -1040 ^ rv >= -1041 ^ rv >= -1042 ^ rv >= -1043 ^ rv >= -1044 ^ rv >= -1045 ^ rv >= -1046 ^ rv >= -1047 ^ rv >= -1048 ^ rv >= -1049 ^ rv >= -1050 ^ rv >= -1051 ^ rv >= -1052 ^ rv >= -1053 ^ rv >= -1054 ^ rv >= -1055 ^ rv >= -1056 ^ rv >= -1057 ^ rv >= -1058 ^ rv >= -1059 ^ rv >= -1060 ^ rv >= -1061 ^ rv >= -1062 ^ rv >= -1063 ^ rv >= -1064 ^ rv >= -1065 ^ rv >= -1066 ^ rv >= -1067 ^ rv >= -1068 ^ rv >= -1069 ^ rv >= -1070 ^ rv >= -1071 ^ rv >= -1072 ^ rv >= -1073 ^ rv >= -1074 ^ rv >= -1075 ^ rv >= -1076 ^ rv >= -1077 ^ rv >= -1078 ^ rv >= -1079 ^ rv >= -1080 ^ rv >= -1081 ^ rv >= -1082 ^ rv >= -1083 ^ rv >= -1084 ^ rv >= -1085 ^ rv >= -1086 ^ rv >= -1087 ^ rv >= -1088 ^ rv >= -1089 ^ rv >= -1090 ^ rv >= -1091 ^ rv >= -1092 ^ rv >= -1093 ^ rv >= -1094 ^ rv >= -1095 ^ rv >= -1096 ^ rv >= -1097 ^ rv >= -1098 ^ rv >= -1099;
+    RETURN x;
+}
@@ -0,0 +1,38 @@
+INT FUNCTION countOdd(INT n) {
+    DECLARE (INT i, INT odd, BOOL flag);
+    @PRE n >= 0;
+    @POST rv >= 0 ^ rv <= n;
+    i := 0;
+    odd := 0;
+    flag := FALSE;
+    @LOOP (i <= n) ^ (odd >= 0) ^ (odd <= i);
+    WHILE (i < n) {
+        IF (flag) {
+            odd := odd + 1;
+        } ELSE {
+            NOP;
+        }
+        flag := NOT(flag);
+        i := i + 1;
+    }
+    RETURN odd;
+}
+
+INT FUNCTION grid(INT n) {
+    DECLARE (INT i, INT j, INT cells);
+    @PRE n >= 0;
+    @POST rv >= 0;
+    i := 0;
+    cells := 0;
+    @LOOP (i >= 0) ^ (cells >= 0);
+    WHILE (i < n) {
+        j := 0;
+        @LOOP (j >= 0) ^ (cells >= 0) ^ (i >= 0);
+        WHILE (j < n) {
+            cells := cells + 1;
+            j := j + 1;
+        }
+        i := i + 1;
+    }
+    RETURN cells;
+}
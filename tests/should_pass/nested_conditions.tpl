@@ -0,0 +1,33 @@
+INT FUNCTION clamp(INT x, BOOL flag) {
+    DECLARE (INT y);
+    @PRE x >= 0;
+    @POST rv >= 0 ^ rv <= 10;
+    y := x;
+    IF (x > 10) {
+        IF (x < 5) {
+            y := 0 - 1;
+        } ELSE {
+            y := 10;
+        }
+    } ELSE {
+        IF (NOT(x <= 10)) {
+            y := 0 - 1;
+        } ELSE {
+            NOP;
+        }
+    }
+    IF (flag) {
+        IF (NOT(flag) ^ x >= 0) {
+            y := 0 - 1;
+        } ELSE {
+            NOP;
+        }
+    } ELSE {
+        IF (x < 0) {
+            y := 0 - 1;
+        } ELSE {
+            NOP;
+        }
+    }
+    RETURN y;
+}
@@ -0,0 +1,29 @@
+INT FUNCTION countUp(INT a, INT b) {
+    @PRE a < b;
+    @POST a >= b;
+    @LOOP a <= b;
+    WHILE (a < b) {
+        a := a + 1;
+    }
+    RETURN a;
+}
+
+INT FUNCTION countDown(INT low, INT high) {
+    @PRE high > low;
+    @POST high <= low;
+    @LOOP low <= high;
+    WHILE (low < high) {
+        high := high - 1;
+    }
+    RETURN high;
+}
+
+INT FUNCTION catchUp(INT x, INT y) {
+    @PRE y > x;
+    @POST x >= y;
+    @LOOP y >= x;
+    WHILE (y > x) {
+        x := 1 + x;
+    }
+    RETURN x;
+}
@@ -0,0 +1,9 @@
+INT FUNCTION abs(INT x) {
+   @PRE TRUE;
+   @POST rv ^ (x >= 0);
+    IF (x >= 0) {
+       RETURN x;
+    } ELSE {
+       RETURN -x ;
+    }
+}
@@ -0,0 +1,13 @@
+INT FUNCTION sign(INT x) {
+    @PRE TRUE;
+    @POST rv >= 0 - 1 ^ rv <= 1;
+    IF (x > 0) {
+        RETURN 1;
+    } ELSE {
+        IF (x < 0) {
+            RETURN 0 - 1;
+        } ELSE {
+            NOP;
+        }
+    }
+}
@@ -0,0 +1,8 @@
+INT FUNCTION decrement(INT a) {
+    @PRE a > 0;
+    @POST rv > 0;
+    WHILE (a > 10) {
+        a := a - 1;
+    }
+    @LOOP a > 0;
+}
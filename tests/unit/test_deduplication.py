@@ -0,0 +1,64 @@
+import io
+import os
+import tempfile
+import unittest
+import contextlib
+
+from IR import generate_basic_paths
+from parser import reset_functions
+from solvers import get_solver_statistics
+
+# three functions of 3 VCs each, 5 of those of the last two are VCs of countUp up to the names of their variables
+RENAMED_FILE = "tests/should_pass/renamed_functions.tpl"
+
+# the VC of second is that of first, with b for a
+INVALID_SOURCE = """INT FUNCTION first(INT a) {
+    @PRE a > 0;
+    @POST rv > 1;
+    RETURN a;
+}
+
+INT FUNCTION second(INT b) {
+    @PRE b > 0;
+    @POST rv > 1;
+    RETURN b;
+}
+"""
+
+
+def verify(file_path:str, **options) -> tuple:
+    ''' (result, output, number of VCs given to a solver) '''
+    # the function names are registered per program
+    reset_functions()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        is_valid = generate_basic_paths(file_path, **options)
+    checked = sum(count for logic, (count, duration) in get_solver_statistics().items() if "/" not in logic)
+    return is_valid, output.getvalue(), checked
+
+
+class DeduplicationTest(unittest.TestCase):
+
+    def test_renamed_vcs_are_checked_once(self):
+        is_valid, output, checked = verify(RENAMED_FILE, random_tests=0)
+        self.assertTrue(is_valid)
+        self.assertEqual(checked, 4)
+        self.assertEqual(output.count("(same VC as countUp path"), 5)
+        self.assertIn("Validating function: catchUp\nOriginal basic path\n[@Pre (y > x), @Loop (y >= x)]\nVC\n"
+                      "((y > x)) => ((y >= x))\nValid! (same VC as countUp path 0)", output)
+
+        is_valid, output, checked = verify(RENAMED_FILE, random_tests=0, deduplicate=False)
+        self.assertTrue(is_valid)
+        self.assertEqual(checked, 9)
+        self.assertNotIn("same VC as", output)
+
+    def test_counterexample_in_own_names(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "renamed_invalid.tpl")
+            with open(file_path, "w") as f:
+                f.write(INVALID_SOURCE)
+            is_valid, output, checked = verify(file_path, random_tests=0)
+        self.assertFalse(is_valid)
+        self.assertEqual(checked, 1)
+        self.assertIn("Invalid!\nCounter example:  [a = 1]", output)
+        self.assertIn("Invalid! (same VC as first path 0)\nCounter example:  [b = 1]", output)
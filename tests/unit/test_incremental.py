@@ -0,0 +1,86 @@
+import io
+import os
+import tempfile
+import unittest
+import contextlib
+
+from expr import Expression
+from statement import Statement
+from parser import parse_program, reset_functions
+from incremental import IncrementalParser
+from IR import load_program
+import main
+
+with open("tests/should_pass/multiple_functions.tpl") as f:
+    SOURCE = f.read()
+# the first function gets one more line, the second one is unchanged but one line further down
+EDITED = SOURCE.replace("        a := a + 1;\n", "        a := a + 1;\n        a := a + 0;\n")
+# the same edit, not parsed
+BROKEN = SOURCE.replace("        a := a + 1;\n", "        a := a + 1;\n        a := ;\n")
+
+
+def dump(node):
+    ''' the attributes of the nodes of an AST, with the line numbers, to compare two parses '''
+    if isinstance(node, (Statement, Expression)):
+        return type(node).__name__, {name: dump(value) for name, value in vars(node).items()}
+    if isinstance(node, list):
+        return [dump(item) for item in node]
+    return node
+
+
+def full_parse(source:str):
+    reset_functions()
+    return parse_program(source)
+
+
+class IncrementalParserTest(unittest.TestCase):
+
+    def test_edit_one_function(self):
+        parser = IncrementalParser()
+        first = parser.parse(SOURCE)
+        self.assertEqual((parser.parsed, parser.reused), (2, 0))
+        self.assertEqual(dump(first.statements), dump(full_parse(SOURCE).statements))
+
+        second = parser.parse(EDITED)
+        self.assertEqual((parser.parsed, parser.reused), (1, 1))
+        self.assertIsNot(second.statements[0], first.statements[0])
+        self.assertIs(second.statements[1], first.statements[1])
+        # the reused function was moved to its new lines
+        self.assertEqual(dump(second.statements), dump(full_parse(EDITED).statements))
+
+        parser.parse(EDITED)
+        self.assertEqual((parser.parsed, parser.reused), (0, 2))
+
+    def test_watch(self):
+        ''' the watch loop of main.py verifies every version of the file, a version that can not be parsed is
+        reported and the next one is verified '''
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "watched.tpl")
+            versions = [BROKEN, EDITED]
+            counters = []
+
+            def write(source:str):
+                modification_time = os.stat(file_path).st_mtime_ns if os.path.exists(file_path) else 0
+                with open(file_path, "w") as f:
+                    f.write(source)
+                # a later modification time, even on a filesystem with a coarse clock
+                modification_time += 10 ** 9
+                os.utime(file_path, ns=(modification_time, modification_time))
+
+            def verify(incremental_parser:IncrementalParser):
+                try:
+                    load_program(file_path, incremental_parser=incremental_parser)
+                    counters.append((incremental_parser.parsed, incremental_parser.reused))
+                finally:
+                    if versions:
+                        write(versions.pop(0))
+                if not versions and len(counters) == 2:
+                    raise KeyboardInterrupt()
+
+            write(SOURCE)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                main.watch(file_path, verify)
+        self.assertEqual(counters, [(2, 0), (1, 1)])
+        self.assertIn("Parsed 2 functions, reused 0", output.getvalue())
+        self.assertIn("ParseError", output.getvalue())
@@ -0,0 +1,35 @@
+import io
+import unittest
+import contextlib
+
+from IR import generate_basic_paths
+from parser import reset_functions
+from solvers import get_solver_statistics
+
+FILES = ["tests/should_pass/loop_with_branches.tpl", "tests/should_pass/renamed_functions.tpl",
+         "tests/should_fail/multiple_functions_fail_01.tpl", "tests/should_fail/positive_mul_fail.tpl"]
+
+
+def verify(file_path:str, jobs:int) -> tuple:
+    ''' (result, verdict lines, number of VCs of each logic) of generate_basic_paths '''
+    # the function names are registered per program
+    reset_functions()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        is_valid = generate_basic_paths(file_path, jobs=jobs)
+    verdicts = [line for line in output.getvalue().splitlines()
+                if line.startswith(("Valid!", "Invalid!", "Unknown!", "Validating function"))]
+    counts = {logic: count for logic, (count, duration) in get_solver_statistics().items()}
+    return is_valid, verdicts, counts
+
+
+class JobsTest(unittest.TestCase):
+    ''' the VCs checked by 4 threads, each with its own z3 context, give the report of a single thread,
+    only a counterexample may differ '''
+
+    def test_same_report(self):
+        for file_path in FILES:
+            with self.subTest(file_path=file_path):
+                expected = verify(file_path, 1)
+                self.assertTrue(expected[1])
+                self.assertEqual(verify(file_path, 4), expected)
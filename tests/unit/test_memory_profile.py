@@ -0,0 +1,40 @@
+import io
+import unittest
+import contextlib
+
+import main
+from profiling import disable_memory_profiling, get_memory_profiler, PHASES
+
+FILE = "tests/should_pass/multiple_functions.tpl"
+FUNCTIONS = ["aFunction", "randomFunction"]
+
+
+class MemoryProfileTest(unittest.TestCase):
+
+    def tearDown(self):
+        disable_memory_profiling()
+
+    def test_report(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main.main([FILE, "--memory-profile", "2", "--jobs", "4"])
+        self.assertIsNotNone(get_memory_profiler())
+        report = output.getvalue().partition("Memory per phase:\n")[2]
+        rows = [line.split() for line in report.partition("Top allocation sites")[0].splitlines()[1:]]
+        # phase (one or two words), function, calls, peak KiB, retained KiB
+        measured = {(" ".join(row[:-4]), row[-4]) for row in rows}
+        for phase in PHASES:
+            self.assertTrue(any(measured_phase == phase for measured_phase, function in measured), phase)
+        for function in FUNCTIONS:
+            for phase in PHASES[2:]:
+                self.assertIn((phase, function), measured)
+        for row in rows:
+            self.assertGreater(int(row[-3]), 0)
+            self.assertGreaterEqual(float(row[-2]), 0)
+        sites = report.partition("Top allocation sites")[2]
+        for phase in PHASES:
+            self.assertIn(f"  {phase}:\n", sites)
+        self.assertIn(" KiB\n", sites)
+        # the phases are measured in a single thread, the verdicts are those of the usual run
+        self.assertEqual(output.getvalue().count("Valid!"), 5)
+        self.assertNotIn("Invalid!", output.getvalue())
@@ -0,0 +1,75 @@
+import io
+import os
+import tempfile
+import unittest
+import contextlib
+
+from IR import generate_basic_paths
+from events import add_event_listener, remove_event_listener
+from metrics import PrometheusExporter, read_samples, DURATION_BUCKETS
+from parser import reset_functions
+
+# two functions, one of them is not verified
+FILE = "tests/should_fail/multiple_functions_fail_01.tpl"
+
+
+def total(samples:dict, name:str) -> float:
+    ''' sum of the samples of a metric over its labels '''
+    return sum(value for sample, value in samples.items() if sample == name or sample.startswith(name + "{"))
+
+
+class MetricsTest(unittest.TestCase):
+
+    def run_exported(self, metrics_path:str) -> str:
+        ''' output of a verification of FILE, whose metrics are added to the file '''
+        exporter = PrometheusExporter()
+        add_event_listener(exporter)
+        output = io.StringIO()
+        try:
+            # the function names are registered per program
+            reset_functions()
+            with contextlib.redirect_stdout(output):
+                generate_basic_paths(FILE)
+        finally:
+            remove_event_listener(exporter)
+        exporter.write(metrics_path)
+        return output.getvalue()
+
+    def test_counters_and_histograms(self):
+        with tempfile.TemporaryDirectory() as directory:
+            metrics_path = os.path.join(directory, "tpl.prom")
+            output = self.run_exported(metrics_path)
+            samples = read_samples(metrics_path)
+            with open(metrics_path) as f:
+                text = f.read()
+
+            self.assertEqual(samples["tpl_runs_total"], 1)
+            self.assertEqual(samples['tpl_functions_total{result="verified"}'], 1)
+            self.assertEqual(samples['tpl_functions_total{result="not_verified"}'], 1)
+            self.assertEqual(samples["tpl_function_duration_seconds_count"], 2)
+            self.assertIn("# TYPE tpl_vc_solve_duration_seconds histogram", text)
+            # every printed verdict is a checked or a deduplicated VC
+            verdicts = sum(line.startswith(("Valid!", "Invalid!", "Unknown!")) for line in output.splitlines())
+            solved = total(samples, "tpl_vcs_solved_total")
+            self.assertEqual(solved + total(samples, "tpl_vcs_deduplicated_total"), verdicts)
+            self.assertEqual(samples["tpl_last_run_vcs_solved"], solved)
+            self.assertEqual(total(samples, "tpl_vc_solve_duration_seconds_count"), solved)
+            self.assertEqual(total(samples, "tpl_paths_total"), total(samples, "tpl_vcs_built_total"))
+
+            # cumulative buckets, the last one counts every observation
+            bounds = [str(bound) for bound in DURATION_BUCKETS] + ["+Inf"]
+            logics = {sample.partition('logic="')[2].partition('"')[0] for sample in samples
+                      if sample.startswith("tpl_vc_solve_duration_seconds_count")}
+            for logic in logics:
+                buckets = [samples[f'tpl_vc_solve_duration_seconds_bucket{{logic="{logic}",le="{bound}"}}']
+                           for bound in bounds]
+                self.assertEqual(buckets, sorted(buckets))
+                self.assertEqual(buckets[-1], samples[f'tpl_vc_solve_duration_seconds_count{{logic="{logic}"}}'])
+
+            # a second run adds to the counters and histograms, and replaces the gauges
+            self.run_exported(metrics_path)
+            second = read_samples(metrics_path)
+        self.assertEqual(second["tpl_runs_total"], 2)
+        self.assertEqual(total(second, "tpl_vcs_solved_total"), 2 * solved)
+        self.assertEqual(total(second, "tpl_vc_solve_duration_seconds_count"), 2 * solved)
+        self.assertEqual(second["tpl_last_run_vcs_solved"], solved)
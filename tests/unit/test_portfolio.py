@@ -0,0 +1,41 @@
+import io
+import os
+import json
+import tempfile
+import unittest
+import contextlib
+
+from IR import generate_basic_paths
+from portfolio import write_portfolio_log, PORTFOLIO_LOGICS
+from solvers import get_solver_statistics
+
+# its loop VCs are nonlinear
+FILE = "tests/should_pass/positive_mul.tpl"
+CONFIGURATIONS = ["default", "qfnia"]
+
+
+class PortfolioTest(unittest.TestCase):
+
+    def test_log(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            # without random tests every nonlinear VC is raced
+            is_valid = generate_basic_paths(FILE, random_tests=0, portfolio=CONFIGURATIONS)
+        self.assertTrue(is_valid)
+        statistics = get_solver_statistics()
+        races = sum(statistics.get(logic + "/portfolio", [0])[0] for logic in PORTFOLIO_LOGICS)
+        self.assertGreater(races, 0)
+        self.assertIn("Portfolio wins:", output.getvalue())
+
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = os.path.join(directory, "portfolio.jsonl")
+            # the log of a second run is appended
+            write_portfolio_log(log_path)
+            write_portfolio_log(log_path)
+            with open(log_path) as f:
+                entries = [json.loads(line) for line in f]
+        self.assertEqual(len(entries), 2 * races)
+        for entry in entries:
+            self.assertIn(entry["logic"], PORTFOLIO_LOGICS)
+            self.assertIn(entry["winner"], CONFIGURATIONS)
+            self.assertGreaterEqual(entry["duration"], 0)
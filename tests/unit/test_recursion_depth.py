@@ -0,0 +1,23 @@
+import re
+import unittest
+
+from run_tests import run_tests, collect_tests, SHOULD_PASS, SHOULD_FAIL, SHOULD_THROW_ERROR
+
+# the times in the outputs of the runs
+TIME = re.compile(r"\d+\.\d+m?s\b")
+
+
+def outcomes(results) -> dict:
+    return {result.name: (result.passed, TIME.sub("", result.output)) for result in results}
+
+
+class RecursionDepthTest(unittest.TestCase):
+    ''' the passes recurse down to RECURSION_DEPTH levels and continue on explicit stacks, the .tpl tests must give
+    the same outputs when they run on the stacks from the root, or from the first level '''
+
+    def test_explicit_stacks(self):
+        tests = collect_tests([SHOULD_PASS, SHOULD_FAIL, SHOULD_THROW_ERROR])
+        expected = outcomes(run_tests(tests))
+        for depth in (0, 1):
+            with self.subTest(depth=depth):
+                self.assertEqual(outcomes(run_tests(tests, recursion_depth=depth)), expected)
@@ -0,0 +1,102 @@
+import io
+import os
+import time
+import tempfile
+import unittest
+import contextlib
+
+import shard
+from IR import generate_basic_paths
+from parser import reset_functions
+
+PASSING_FILE = "tests/should_pass/multiple_functions.tpl"
+FAILING_FILE = "tests/should_fail/multiple_functions_fail_01.tpl"
+# three functions with the same VCs up to renaming
+RENAMED_FILE = "tests/should_pass/renamed_functions.tpl"
+
+
+def run(function, *arguments):
+    ''' (value, printed output) of a call '''
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        value = function(*arguments)
+    return value, output.getvalue()
+
+
+def verdicts(output:str) -> list:
+    return [line.split(" (")[0] for line in output.splitlines()
+            if line.startswith(("Valid!", "Invalid!", "Unknown!", "Validating function"))]
+
+
+class ShardTest(unittest.TestCase):
+    ''' submit, work and merge on a queue in a temporary directory, a worker of the test process '''
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.queue = os.path.join(self.directory.name, "queue")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def submit(self, *files):
+        exit_code, output = run(shard.main, ["submit", self.queue, *files])
+        self.assertEqual(exit_code, 0)
+        return output
+
+    def test_merged_report(self):
+        self.assertIn("Submitted 4 jobs", self.submit(PASSING_FILE, FAILING_FILE))
+        self.assertEqual(run(shard.work, self.queue, "worker")[0], 4)
+        self.assertEqual(os.listdir(os.path.join(self.queue, shard.PENDING)), [])
+        self.assertEqual(os.listdir(os.path.join(self.queue, shard.CLAIMED)), [])
+
+        is_valid, merged = run(shard.merge, self.queue)
+        self.assertFalse(is_valid)
+        reports = merged.split("File: ")[1:]
+        self.assertEqual(len(reports), 2)
+        for file_path, report in zip([PASSING_FILE, FAILING_FILE], reports):
+            # the function names are registered per program
+            reset_functions()
+            file_is_valid, expected = run(generate_basic_paths, file_path)
+            self.assertTrue(report.startswith(file_path))
+            self.assertEqual(verdicts(report), verdicts(expected))
+            self.assertEqual(file_is_valid, "Invalid!" not in report)
+
+    def test_deduplication_per_function(self):
+        self.submit(RENAMED_FILE)
+        run(shard.work, self.queue, "worker")
+        is_valid, merged = run(shard.merge, self.queue)
+        self.assertTrue(is_valid)
+        self.assertNotIn("(same VC as countUp", merged)
+        # as many as main.py reports (same VC as ...)
+        self.assertIn("5 VCs equal to a VC of another function were checked again", merged)
+
+    def test_requeue_stale_claim(self):
+        self.submit(PASSING_FILE)
+        # a worker claims a job and dies
+        name = shard.claim(self.queue)
+        self.assertIsNotNone(name)
+        claimed_path = os.path.join(self.queue, shard.CLAIMED, name)
+        # a job claimed just now is not stale, even if it was submitted long ago
+        self.assertEqual(shard.requeue(self.queue, 60), 0)
+        claim_time = time.time() - 120
+        os.utime(claimed_path, (claim_time, claim_time))
+        self.assertEqual(shard.requeue(self.queue, 60), 1)
+        self.assertFalse(os.path.exists(claimed_path))
+
+        self.assertEqual(run(shard.work, self.queue, "other worker")[0], 2)
+        is_valid, merged = run(shard.merge, self.queue)
+        self.assertTrue(is_valid)
+        self.assertNotIn("Missing result!", merged)
+
+    def test_claim_time(self):
+        self.submit(PASSING_FILE)
+        submit_time = time.time() - 120
+        for name in os.listdir(os.path.join(self.queue, shard.PENDING)):
+            os.utime(os.path.join(self.queue, shard.PENDING, name), (submit_time, submit_time))
+        name = shard.claim(self.queue)
+        self.assertGreater(os.path.getmtime(os.path.join(self.queue, shard.CLAIMED, name)), submit_time + 60)
+
+    def test_invalid_tactics(self):
+        with contextlib.redirect_stderr(io.StringIO()) as errors, self.assertRaises(SystemExit):
+            shard.main(["submit", self.queue, PASSING_FILE, "--tactics", "f=no-such-tactic"])
+        self.assertIn("Unknown z3 tactic no-such-tactic", errors.getvalue())
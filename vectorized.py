@@ -0,0 +1,178 @@
+from typing import Union, List, Dict
+
+import operator
+
+import numpy as np
+
+from expr import *
+
+# Evaluation of VCs over whole arrays of assignments at once with NumPy.
+# A column holds the values of one variable, row i of all the columns is one assignment.
+
+# maximal number of variables of a Boolean VC checked by enumerating all its assignments
+DEFAULT_EXHAUSTIVE_MAX_VARIABLES = 16
+
+# number of random assignments a VC is evaluated on before it is given to z3
+DEFAULT_RANDOM_TESTS = 4096
+# integers the first half of the random assignments are drawn from, where sign and off-by-one errors show up
+BOUNDARY_INTEGERS = [0, 1, -1, 2, -2, 3, -3, 10, -10, 100, -100, 2 ** 15, -2 ** 15]
+# the other random integers are drawn uniformly from [-RANDOM_INTEGER_BOUND, RANDOM_INTEGER_BOUND]
+RANDOM_INTEGER_BOUND = 2 ** 15
+# violations found with int64 arithmetic are confirmed with Python integers, in case of an overflow
+MAX_CONFIRMED_VIOLATIONS = 16
+
+
+def free_variables(expression) -> Dict[str, DataType]:
+    ''' name -> type of the variables used in an expression, in order of first use '''
+    variables = {}
+    stack = [expression]
+    while stack:
+        expression = stack.pop()
+        if isinstance(expression, (VariableExpression, ReturnValueVariableExpression)):
+            variables.setdefault(expression.name, expression.type)
+        else:
+            # the leftmost child is visited first
+            stack.extend(reversed(expression.children()))
+    return variables
+
+
+class VectorizedEvaluator(Fold):
+    ''' value of an expression for every row of the columns, as a NumPy array (or a NumPy scalar for
+    a constant subexpression, which broadcasts against the columns) '''
+
+    def __init__(self, columns:Dict[str, np.ndarray]):
+        self.columns = columns
+
+    def visit_VariableExpression(self, expression):
+        return self.columns[expression.name]
+
+    def visit_ReturnValueVariableExpression(self, expression):
+        return self.columns[expression.name]
+
+    def visit_BooleanLiteralExpression(self, expression):
+        return np.bool_(expression.value == "TRUE")
+
+    def visit_IntLiteralExpression(self, expression):
+        return np.int64(expression.value)
+
+    def visit_BinaryExpression(self, expression, left, right):
+        return VECTORIZED_BINARY_OPERATORS[expression.op](left, right)
+
+    def visit_NotExpression(self, expression, operand):
+        return np.logical_not(operand)
+
+    def visit_IntUnaryExpression(self, expression, operand):
+        return np.negative(operand)
+
+
+VECTORIZED_BINARY_OPERATORS = {
+    "=>": lambda left, right: np.logical_or(np.logical_not(left), right),
+    "^": np.logical_and,
+    "v": np.logical_or,
+    "==": np.equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    BinaryOperator.PLUS: np.add,
+    BinaryOperator.MINUS: np.subtract,
+    BinaryOperator.TIMES: np.multiply,
+}
+
+
+class ExactEvaluator(VectorizedEvaluator):
+    ''' value of an expression for a single assignment of Python values, integers never overflow '''
+
+    def visit_BooleanLiteralExpression(self, expression):
+        return expression.value == "TRUE"
+
+    def visit_IntLiteralExpression(self, expression):
+        return int(expression.value)
+
+    def visit_BinaryExpression(self, expression, left, right):
+        return EXACT_BINARY_OPERATORS[expression.op](left, right)
+
+    def visit_NotExpression(self, expression, operand):
+        return not operand
+
+    def visit_IntUnaryExpression(self, expression, operand):
+        return -operand
+
+
+EXACT_BINARY_OPERATORS = {
+    "=>": lambda left, right: (not left) or right,
+    "^": lambda left, right: left and right,
+    "v": lambda left, right: left or right,
+    "==": operator.eq,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    BinaryOperator.PLUS: operator.add,
+    BinaryOperator.MINUS: operator.sub,
+    BinaryOperator.TIMES: operator.mul,
+}
+
+
+def evaluate(expression, columns:Dict[str, np.ndarray]):
+    return VectorizedEvaluator(columns).visit(expression)
+
+
+def boolean_columns(variable_names:List[str]) -> Dict[str, np.ndarray]:
+    ''' the 2^n assignments of n Boolean variables, variable i is bit i of the row number '''
+    rows = np.arange(1 << len(variable_names), dtype=np.int64)
+    return {name: ((rows >> index) & 1).astype(np.bool_) for index, name in enumerate(variable_names)}
+
+
+def exhaustive_check(expression, variables:Dict[str, DataType]) -> Union[None, Dict[str, bool]]:
+    ''' decide a Boolean VC by evaluating it on every assignment of its variables,
+    returns None if it is valid and an assignment falsifying it otherwise '''
+    assert all(variable_type == DataType.BOOL for variable_type in variables.values())
+    names = list(variables)
+    columns = boolean_columns(names)
+    holds = np.broadcast_to(evaluate(expression, columns), (1 << len(names),))
+    violations = np.flatnonzero(~holds)
+    if violations.size == 0:
+        return None
+    row = violations[0]
+    return {name: bool(columns[name][row]) for name in names}
+
+
+def format_counter_example(counter_example:Dict[str, object]) -> str:
+    ''' same layout as a z3 model '''
+    return "[" + ", ".join(f"{name} = {value}" for name, value in counter_example.items()) + "]"
+
+
+def random_columns(variables:Dict[str, DataType], rows:int, generator:np.random.Generator,
+                   bound:int=RANDOM_INTEGER_BOUND) -> Dict[str, np.ndarray]:
+    ''' rows random assignments of the variables, the integers are in [-bound, bound] and those of the
+    first half are boundary values '''
+    boundary_rows = rows // 2
+    boundary_integers = [value for value in BOUNDARY_INTEGERS if -bound <= value <= bound] + [bound, -bound]
+    columns = {}
+    for name, variable_type in variables.items():
+        if variable_type == DataType.BOOL:
+            columns[name] = generator.integers(0, 2, rows).astype(np.bool_)
+        else:
+            column = generator.integers(-bound, bound, rows, dtype=np.int64, endpoint=True)
+            column[:boundary_rows] = generator.choice(boundary_integers, boundary_rows)
+            columns[name] = column
+    return columns
+
+
+def random_check(expression, variables:Dict[str, DataType], rows:int=DEFAULT_RANDOM_TESTS, seed:int=0) \
+        -> Union[None, Dict[str, object]]:
+    ''' evaluate a VC on random assignments of its variables, returns an assignment falsifying it or
+    None if none was found (which does not mean the VC is valid) '''
+    columns = random_columns(variables, rows, np.random.default_rng(seed))
+    try:
+        with np.errstate(over="ignore"):
+            holds = np.broadcast_to(evaluate(expression, columns), (rows,))
+    except OverflowError:
+        # a literal that does not fit in an int64
+        return None
+    for row in np.flatnonzero(~holds)[:MAX_CONFIRMED_VIOLATIONS]:
+        counter_example = {name: column[row].item() for name, column in columns.items()}
+        if not ExactEvaluator(counter_example).visit(expression):
+            return counter_example
+    return None
@@ -0,0 +1,47 @@
+# AST node classes and visitor classes, every visitor class has a dispatch table with an entry for each node class
+_node_classes = []
+_visitor_classes = []
+
+
+def register_node_class(node_class):
+    ''' called for every subclass of Expression and Statement when it is defined '''
+    _node_classes.append(node_class)
+    for visitor_class in _visitor_classes:
+        visitor_class._dispatch_table[node_class] = visitor_class._resolve(node_class)
+
+
+class Visitor:
+    ''' Base class of the passes over the AST.
+
+    A node is dispatched on its exact class through a table owned by the visitor class: a node of class C
+    is handled by the visit_C method, or by the visit method of the nearest base class of C that has one.
+    The table is filled once, when the visitor class and the node classes are defined, so dispatching
+    is a single dictionary lookup instead of a chain of isinstance checks.
+
+    Passes that run on every node of large trees can index self._dispatch_table directly
+    for the children of a node, which saves the call to visit. '''
+
+    _dispatch_table = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch_table = {node_class: cls._resolve(node_class) for node_class in _node_classes}
+        _visitor_classes.append(cls)
+
+    @classmethod
+    def _resolve(cls, node_class):
+        for base_class in node_class.__mro__:
+            method = getattr(cls, "visit_" + base_class.__name__, None)
+            if method is not None:
+                return method
+        return cls.generic_visit
+
+    def visit(self, node):
+        try:
+            method = self._dispatch_table[node.__class__]
+        except KeyError:
+            method = self._resolve(node.__class__)
+        return method(self, node)
+
+    def generic_visit(self, node, *args):
+        raise TypeError(f"{type(self).__name__} cannot visit {type(node).__name__}")